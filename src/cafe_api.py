@@ -0,0 +1,243 @@
+"""
+**Cafe API - Local HTTP/JSON Service for Displays**
+
+**Purpose:**
+- Serves events, tournament rosters and bracket state as JSON over HTTP, using only the standard library.
+
+**Why This File Exists:**
+- Every screen in the cafe had to run the full PyQt app with direct database access.
+- Wall-mounted displays and phones can now poll this service instead.
+
+**Usage:**
+```
+python src/cafe_api.py                      # http://127.0.0.1:8080 (this machine only)
+python src/cafe_api.py --host 0.0.0.0       # also reachable from displays on the cafe network
+```
+
+**Endpoints (GET):**
+- `/events` (optionally `?game=chess`): tournaments and campaigns.
+- `/tournaments`: all tournaments.
+- `/tournaments/<name>`: one tournament.
+- `/tournaments/<name>/roster`: gamertags signed up (no names or emails, the data is public).
+- `/tournaments/<name>/bracket`: rounds with recorded winners.
+- `/tournaments/<name>/schedule`: estimated start and table of every match (see `model/match_scheduler.py`).
+
+**Implementation Decisions:**
+- Responses are cached in memory per URL together with the database's `PRAGMA data_version`;
+  the number changes whenever another connection commits, so a poll costs one pragma until the
+  data actually changes. Schedules also depend on the time, so they are cached per minute.
+- Every response carries a content-hash `ETag`; clients sending `If-None-Match` get an empty
+  `304 Not Modified` when nothing changed.
+- Binds to `127.0.0.1` by default so it can be tested entirely on localhost.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from model import database
+from model.current_events import CurrentEvents
+from model.event_signups import EventSignUps
+from model.match_results import MatchResults
+from model.match_scheduler import schedule_tournament
+from model.tournament import create_tournament
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+MAX_CACHED_RESPONSES = 256  # Oldest cached URL is dropped beyond this
+
+
+class NotFound(Exception):
+    """ Raised by a route when the requested resource does not exist. """
+
+
+class ResponseCache:
+    """
+    **ResponseCache Class**
+
+    **Class Purpose:**
+    - Remembers the JSON body and ETag for each URL until the database changes.
+
+    **Implementation Decisions:**
+    - One long-lived connection is kept only to read `PRAGMA data_version`; this service never
+      writes, so the value only moves when a kiosk (or the CLI) commits a change.
+    """
+
+    def __init__(self, db_path: str):
+        """ Opens the version connection and creates an empty cache. """
+        self.version_conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.lock = threading.Lock()  # Guards the connection and the cache dictionary
+        self.entries = {}  # URL -> (data_version, etag, body)
+
+    def data_version(self) -> int:
+        """ Returns the current change counter of the database. """
+        with self.lock:
+            return self.version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get(self, key: str, build) -> tuple[str, bytes]:
+        """
+        **Returns `(etag, body)` for `key`, calling `build()` only if the data changed.**
+
+        - The version is read before building, so a change made during the build is picked up
+          by the next request rather than hidden behind a stale entry.
+        """
+        version = self.data_version()
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry and entry[0] == version:
+            return entry[1], entry[2]
+
+        body = json.dumps(build(), ensure_ascii=False).encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (version, etag, body)
+            while len(self.entries) > MAX_CACHED_RESPONSES:
+                del self.entries[next(iter(self.entries))]  # Dictionaries keep insertion order
+        return etag, body
+
+
+class ApiServer(ThreadingHTTPServer):
+    """ HTTP server holding the database path and the shared response cache. """
+
+    daemon_threads = True  # Slow clients never keep the process alive on shutdown
+
+    def __init__(self, address: tuple, db_path: str = database.DB_PATH):
+        """ Binds the server and prepares the cache. """
+        super().__init__(address, ApiRequestHandler)
+        self.db_path = db_path
+        self.cache = ResponseCache(db_path)
+
+    def route(self, path: str, query: dict):
+        """
+        **Builds the JSON-ready data for a request path.**
+
+        **Raises:**
+        - `NotFound`: If the path or the named tournament does not exist.
+        """
+        parts = [unquote(part) for part in path.strip("/").split("/") if part]
+        events = CurrentEvents(self.db_path)
+
+        if parts == ["events"]:
+            game = query.get("game", [None])[0]
+            if game:
+                return {"tournaments": events.get_tournaments(game), "campaigns": events.get_campaigns(game)}
+            return {"tournaments": events.get_all_tournaments(), "campaigns": events.get_all_campaigns()}
+        if parts == ["tournaments"]:
+            return events.get_all_tournaments()
+
+        if len(parts) in (2, 3) and parts[0] == "tournaments":
+            tournament = events.get_tournament(parts[1])
+            if tournament is None:
+                raise NotFound(f"No tournament named '{parts[1]}'")
+            if len(parts) == 2:
+                return tournament
+            if parts[2] == "roster":
+                return [player["gamertag"] for player in EventSignUps(self.db_path).get_roster(parts[1])]
+            if parts[2] == "bracket":
+                bracket = create_tournament(tournament, self.db_path)
+                MatchResults(self.db_path).apply(bracket)
+                return {"name": bracket.name, "type": tournament["type"], "max_players": bracket.max_players, "rounds": bracket.named_rounds()}
+            if parts[2] == "schedule":
+                bracket = create_tournament(tournament, self.db_path)
+                MatchResults(self.db_path).apply(bracket)
+                schedule = schedule_tournament(bracket, tournament, self.db_path)
+                if schedule is None:
+                    raise NotFound(f"'{parts[1]}' has no start time")
+                path = schedule.critical_path()
+                return {
+                    "name": bracket.name,
+                    "rounds": [
+                        [
+                            {"starts_at": f"{schedule.starts[(r, m)]:%Y-%m-%d %H:%M}", "table": match.get("table"),
+                             "finished": (r, m) in schedule.finished}
+                            for m, match in enumerate(matches, start=1)
+                        ]
+                        for r, matches in enumerate(bracket.rounds, start=1)
+                    ],
+                    "estimated_finish": f"{schedule.ends[path[-1]]:%Y-%m-%d %H:%M}" if path else None,
+                    "critical_path": [list(key) for key in path],
+                }
+
+        raise NotFound(f"Unknown path '{path}'")
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """ Answers GET requests from the shared cache, with ETag revalidation. """
+
+    server_version = "CafeAPI/1.0"
+
+    def do_GET(self):
+        """ Serves a cached JSON response, a 304, or a JSON error. """
+        url = urlsplit(self.path)
+        key = url.path + ("?" + url.query if url.query else "")
+        if url.path.rstrip("/").endswith("/schedule"):
+            key += f"#{datetime.now():%Y-%m-%d %H:%M}"  # Estimates move with the clock, not only with the data
+        try:
+            etag, body = self.server.cache.get(key, lambda: self.server.route(url.path, parse_qs(url.query)))
+        except NotFound as error:
+            self.send_json_error(404, str(error))
+            return
+        except (sqlite3.Error, ValueError) as error:
+            logger.exception("request failed path=%s", self.path)
+            self.send_json_error(500, str(error))
+            return
+
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")  # Clients may keep it but must revalidate
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json_error(self, status: int, message: str) -> None:
+        """ Sends `{"error": message}` with the given status code. """
+        body = json.dumps({"error": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """ Sends access logs to the logging module instead of stderr. """
+        logger.debug("%s " + format, self.address_string(), *args)
+
+
+def main() -> int:
+    """ Parses arguments and serves until interrupted. Returns the process exit status. """
+    parser = argparse.ArgumentParser(description="Serve cafe events and brackets as JSON.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to bind (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to bind (default: %(default)s)")
+    parser.add_argument("--db", default=database.DB_PATH, help="database file (default: %(default)s)")
+    args = parser.parse_args()
+
+    server = ApiServer((args.host, args.port), args.db)
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
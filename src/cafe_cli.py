@@ -0,0 +1,393 @@
+"""
+**Cafe Command Line - Events and Tournaments Without the GUI**
+
+**Purpose:**
+- Lists events, prints tournament brackets, records match results and exports rosters from a terminal.
+
+**Why This File Exists:**
+- Tournament logic was only reachable through `TournamentDisplay` inside a `QApplication`.
+- Staff can prepare brackets over SSH on the back-office machine, and scripts start in milliseconds.
+- This file and everything it imports must never import PyQt6.
+
+**Usage:**
+```
+python src/cafe_cli.py events [--game chess]
+python src/cafe_cli.py bracket "Cafe Chess Masters"
+python src/cafe_cli.py result "Cafe Chess Masters" 1 2 SomeGamertag
+python src/cafe_cli.py schedule "Cafe Chess Masters"
+python src/cafe_cli.py eta "Cafe Chess Masters" SomeGamertag
+python src/cafe_cli.py roster "Cafe Chess Masters" --output roster.csv
+python src/cafe_cli.py checkin "Cafe Chess Masters" SomeGamertag 1042
+python src/cafe_cli.py checkin "Cafe Chess Masters" --close
+python src/cafe_cli.py seed "Cafe Chess Masters" SomeGamertag 1
+python src/cafe_cli.py ratings --top 10 [--recompute]
+python src/cafe_cli.py queue SomeGamertag Chess
+python src/cafe_cli.py unqueue SomeGamertag
+python src/cafe_cli.py matchmake
+python src/cafe_cli.py sessions --from 2025-03-11 --days 7
+python src/cafe_cli.py tables --day 2025-03-10
+python src/cafe_cli.py waitlist "Cafe Chess Masters"
+python src/cafe_cli.py withdraw "Cafe Chess Masters" SomeGamertag
+```
+- Round and match numbers start at 1, as printed by `bracket`.
+- `--db PATH` points any command at a different database file.
+"""
+
+import argparse
+import csv
+import sys
+from datetime import date, datetime, timedelta
+
+from model import database
+from model.checkin import CheckInDesk
+from model.current_events import CurrentEvents
+from model.event_signups import EventSignUps
+from model.match_results import MatchResults
+from model.table_allocator import TablePlan
+from model.match_scheduler import schedule_tournament
+from model.matchmaking import MatchmakingQueue
+from model.ratings import PlayerRatings
+from model.recurrence import CampaignSchedule
+from model.tournament import create_tournament
+
+
+def list_events(args) -> int:
+    """ Prints tournaments and campaigns, optionally for one game. """
+    events = CurrentEvents(args.db)
+    if args.game:
+        tournaments, campaigns = events.get_tournaments(args.game), events.get_campaigns(args.game)
+    else:
+        tournaments, campaigns = events.get_all_tournaments(), events.get_all_campaigns()
+
+    print("Tournaments:")
+    for t in tournaments:
+        print(f"  {t['name']} [{t['game_type']}, {t['type']}] {t['date']} {t['time']} - {t['max_players']} players, entry {t['entry_fee']}, prize {t['prize']}")
+    print("Campaigns:")
+    for c in campaigns:
+        print(f"  {c['name']} [{c['game_type']}] {c['meet_day']} {c['time']} ({c['meet_frequency']}) - host {c['host']}, {c['max_players']} players")
+    return 0
+
+
+def load_bracket(db_path: str, event_name: str):
+    """ Builds a tournament's bracket with every stored result applied. Raises `ValueError` if not found. """
+    event = CurrentEvents(db_path).get_tournament(event_name)
+    if event is None:
+        raise ValueError(f"No tournament named '{event_name}'")
+    tournament = create_tournament(event, db_path)
+    MatchResults(db_path).apply(tournament)
+    return tournament
+
+
+def print_bracket(args) -> int:
+    """ Prints every round of a tournament with recorded winners. """
+    tournament = load_bracket(args.db, args.event)
+    print(f"{tournament.name} ({type(tournament).__name__}, {tournament.max_players} players)")
+    for round_number, matches in enumerate(tournament.named_rounds(), start=1):
+        print(f"Round {round_number}")
+        for match_number, match in enumerate(matches, start=1):
+            winner = f"  -> {match['winner']}" if match["winner"] else ""
+            table = f"  [table {match['table']}]" if match.get("table") is not None else ""
+            print(f"  {match_number:>3}. {match['p1']} vs {match['p2']}{table}{winner}")
+    return 0
+
+
+def record_result(args) -> int:
+    """ Validates a winner against the current bracket, then stores it. """
+    tournament = load_bracket(args.db, args.event)
+    winner_id = tournament.player_id(args.winner)
+    if winner_id is None:
+        raise ValueError(f"'{args.winner}' is not signed up for {tournament.name}")
+    tournament.record_winner(args.round, args.match, winner_id)  # Raises ValueError if invalid
+    match = tournament.rounds[args.round - 1][args.match - 1]
+    loser_id = match["p2"] if match["p1"] == winner_id else match["p1"]
+    if loser_id <= 0:
+        loser_id = None  # Wins against an open slot are not rated
+
+    replaced = MatchResults(args.db).record(
+        tournament.name, args.round, args.match, winner_id, loser_id, tournament.frozen_seeds()
+    )
+    ratings = PlayerRatings(args.db)
+    if replaced:  # A corrected result can change later pairings and every rating after it
+        MatchResults(args.db).reconcile(create_tournament(CurrentEvents(args.db).get_tournament(tournament.name), args.db))
+        ratings.recompute()
+    elif loser_id is not None:
+        ratings.record_result(winner_id, loser_id)
+    print(f"Recorded {args.winner} as winner of round {args.round} match {args.match} in {tournament.name}")
+    return 0
+
+
+def load_schedule(db_path: str, event_name: str):
+    """ Returns a tournament's bracket and its `MatchSchedule`. Raises `ValueError` if either is missing. """
+    tournament = load_bracket(db_path, event_name)
+    schedule = schedule_tournament(tournament, CurrentEvents(db_path).get_tournament(event_name), db_path)
+    if schedule is None:
+        raise ValueError(f"{event_name} has no start time to schedule from")
+    return tournament, schedule
+
+
+def print_schedule(args) -> int:
+    """ Prints the estimated start of every match, then the chain of matches that sets the finish time. """
+    tournament, schedule = load_schedule(args.db, args.event)
+    print(f"{tournament.name} (matches of {schedule.duration.seconds // 60} min from {schedule.starts_at:%m-%d-%Y %H:%M})")
+    for round_number, matches in enumerate(tournament.named_rounds(), start=1):
+        print(f"Round {round_number}")
+        for match_number, match in enumerate(matches, start=1):
+            key = (round_number, match_number)
+            starts = schedule.starts[key]
+            state = "done" if key in schedule.finished else f"{starts:%H:%M}" if starts.date() == schedule.starts_at.date() else f"{starts:%m-%d %H:%M}"
+            table = f"  [table {match['table']}]" if match.get("table") is not None else ""
+            print(f"  {match_number:>3}. {state:>11}  {match['p1']} vs {match['p2']}{table}")
+    path = schedule.critical_path()
+    if path:
+        print(f"Estimated finish {schedule.ends[path[-1]]:%m-%d-%Y %H:%M}, set by: " + " -> ".join(f"R{r}M{m}" for r, m in path))
+    return 0
+
+
+def print_eta(args) -> int:
+    """ Prints when and where a player's next match should start. """
+    tournament, schedule = load_schedule(args.db, args.event)
+    player_id = tournament.player_id(args.gamertag)
+    if player_id is None:
+        raise ValueError(f"'{args.gamertag}' is not signed up for {tournament.name}")
+    upcoming = schedule.next_match(player_id)
+    if upcoming is None:
+        print(f"{args.gamertag} has no match waiting in {tournament.name}")
+        return 0
+    round_number, match_number, starts_at, table = upcoming
+    where = f" at table {table}" if table is not None else ""
+    print(f"{args.gamertag}: round {round_number} match {match_number}{where}, about {starts_at:%m-%d-%Y %H:%M}")
+    return 0
+
+
+def check_in_players(args) -> int:
+    """ Checks players in by gamertag or member id, then closes check-in if asked and prints the new first round. """
+    desk = CheckInDesk(args.event, args.db)
+    for player in args.players:
+        print(f"  {player}: {desk.check_in(player).message}")
+
+    if args.close:
+        tournament = load_bracket(args.db, args.event)
+        summary = desk.close(tournament)
+        tournament.reseat_first_round(summary.replacements, desk.gamertags)
+        for no_show, replacement in summary.replacements.items():
+            taken = f", seat taken by {desk.gamertags[replacement]}" if replacement is not None else ", seat left empty"
+            print(f"No-show: {desk.gamertags[no_show]}{taken}")
+        print("Round 1")
+        for match_number, match in enumerate(tournament.named_rounds()[0] if tournament.rounds else [], start=1):
+            table = f"  [table {match['table']}]" if match.get("table") is not None else ""
+            print(f"  {match_number:>3}. {match['p1']} vs {match['p2']}{table}")
+    elif not args.players:
+        missing = desk.missing()
+        standby = len(desk.present & desk.waiting)  # Waitlisted players are not part of the field
+        print(f"{len(desk.present) - standby} checked in, {len(missing)} still to arrive, {standby} standing by"
+              + (":" if missing else ""))
+        for gamertag in missing:
+            print(f"  {gamertag}")
+    return 0
+
+
+def show_ratings(args) -> int:
+    """ Prints the highest-rated players, after rebuilding every rating from history if asked. """
+    ratings = PlayerRatings(args.db)
+    if args.recompute:
+        print(f"Recomputed ratings from {ratings.recompute()} matches")
+    for rank, (gamertag, rating, games) in enumerate(ratings.get_leaderboard(args.top), start=1):
+        print(f"  {rank:>3}. {gamertag:<20} {rating:7.1f}  ({games} games)")
+    return 0
+
+
+def export_roster(args) -> int:
+    """ Writes an event's sign-ups as CSV (the bulk import member format) to a file or stdout. """
+    roster = EventSignUps(args.db).get_roster(args.event)
+    columns = ["fname", "lname", "gamertag", "email"]
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(roster)
+        print(f"{len(roster)} players written to {args.output}")
+    else:
+        writer = csv.DictWriter(sys.stdout, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(roster)
+    return 0
+
+
+def show_waitlist(args) -> int:
+    """ Prints the players waiting for an event, next to be promoted first. """
+    for position, gamertag in enumerate(EventSignUps(args.db).get_waitlist(args.event), start=1):
+        print(f"  {position:>3}. {gamertag}")
+    return 0
+
+
+def withdraw_player(args) -> int:
+    """ Removes a player from an event or its waitlist; the next waiting player takes a freed seat. """
+    signups = EventSignUps(args.db)
+    user_id = signups.get_user_id(args.gamertag)
+    if user_id is None or not signups.remove_user_from_event(user_id, args.event):
+        raise ValueError(f"{args.gamertag} is not signed up or waiting for '{args.event}'")
+    print(f"Withdrew {args.gamertag} from {args.event}")
+    return 0
+
+
+def queue_player(args) -> int:
+    """ Puts a player in the casual matchmaking queue for a game. """
+    user_id = EventSignUps(args.db).get_user_id(args.gamertag)
+    if user_id is None:
+        raise ValueError(f"No registered player '{args.gamertag}'")
+    title = MatchmakingQueue(args.db).request_game(user_id, args.game)
+    print(f"{args.gamertag} is looking for a {title} opponent")
+    return 0
+
+
+def unqueue_player(args) -> int:
+    """ Takes a player out of the casual matchmaking queue. """
+    user_id = EventSignUps(args.db).get_user_id(args.gamertag)
+    if user_id is None or not MatchmakingQueue(args.db).cancel(user_id):
+        raise ValueError(f"{args.gamertag} is not in the matchmaking queue")
+    print(f"{args.gamertag} left the matchmaking queue")
+    return 0
+
+
+def run_matchmaking(args) -> int:
+    """ Runs the matcher once, then prints the new matches and who is still waiting. """
+    queue = MatchmakingQueue(args.db)
+    for game_title, first, second in queue.run_matcher():
+        print(f"Matched: {first} vs {second} ({game_title})")
+    for gamertag, game_title, minutes in queue.waiting():
+        print(f"  waiting: {gamertag:<20} {game_title}  ({minutes:.0f} min)")
+    return 0
+
+
+def seed_player(args) -> int:
+    """ Sets or clears a player's manual seed for a tournament bracket. """
+    signups = EventSignUps(args.db)
+    user_id = signups.get_user_id(args.gamertag)
+    if args.seed is not None and args.seed < 1:
+        raise ValueError("Seeds start at 1")
+    if user_id is None or not signups.set_seed(user_id, args.event, args.seed):
+        raise ValueError(f"{args.gamertag} is not signed up for '{args.event}'")
+    print(f"Seeded {args.gamertag} {args.seed} in {args.event}" if args.seed else f"Cleared the seed of {args.gamertag} in {args.event}")
+    return 0
+
+
+def list_sessions(args) -> int:
+    """ Prints campaign sessions for a range of days, then any host or table clashes. """
+    start = datetime.combine(date.fromisoformat(args.start) if args.start else date.today(), datetime.min.time())
+    end = start + timedelta(days=args.days)
+    schedule = CampaignSchedule(args.db)
+
+    for session in schedule.sessions(start, end):
+        table = f" [table {session.table}]" if session.table is not None else ""
+        print(f"  {session.starts_at:%a %m-%d-%Y %H:%M}-{session.ends_at:%H:%M}  {session.campaign} (host {session.host}){table}")
+    for name in schedule.unreadable:
+        print(f"Skipped {name}: schedule could not be read", file=sys.stderr)
+    for reason, earlier, later in schedule.conflicts(start, end):
+        print(f"Clash ({reason}): {earlier.campaign} and {later.campaign} on {later.starts_at:%m-%d-%Y %H:%M}")
+    return 0
+
+
+def show_tables(args) -> int:
+    """ Prints which tables each tournament and campaign session gets on one day, then anything that did not fit. """
+    plan = TablePlan.for_day(args.db, date.fromisoformat(args.day) if args.day else date.today())
+    for name, tables in plan.tournaments.items():
+        print(f"  {name}: tables {', '.join(map(str, tables)) or '-'}")
+    for (campaign, starts_at), table in sorted(plan.sessions.items(), key=lambda item: (item[0][1], item[0][0])):
+        print(f"  {campaign} ({starts_at:%H:%M}): table {table}")
+    for shortfall in plan.shortfalls:
+        print(f"Not placed: {shortfall}", file=sys.stderr)
+    return 0
+
+
+def main() -> int:
+    """ Parses arguments and runs the chosen command. Returns the process exit status. """
+    parser = argparse.ArgumentParser(description="Cafe events and tournaments from the command line.")
+    parser.add_argument("--db", default=database.DB_PATH, help="database file (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    events_parser = commands.add_parser("events", help="list tournaments and campaigns")
+    events_parser.add_argument("--game", help="only events for this game, e.g. chess")
+    events_parser.set_defaults(handler=list_events)
+
+    bracket_parser = commands.add_parser("bracket", help="print a tournament bracket")
+    bracket_parser.add_argument("event", help="tournament name")
+    bracket_parser.set_defaults(handler=print_bracket)
+
+    result_parser = commands.add_parser("result", help="record the winner of a match")
+    result_parser.add_argument("event", help="tournament name")
+    result_parser.add_argument("round", type=int, help="round number (from 1)")
+    result_parser.add_argument("match", type=int, help="match number within the round (from 1)")
+    result_parser.add_argument("winner", help="winning gamertag")
+    result_parser.set_defaults(handler=record_result)
+
+    schedule_parser = commands.add_parser("schedule", help="estimate when every match of a tournament starts")
+    schedule_parser.add_argument("event")
+    schedule_parser.set_defaults(handler=print_schedule)
+
+    eta_parser = commands.add_parser("eta", help="estimate when a player's next match starts")
+    eta_parser.add_argument("event")
+    eta_parser.add_argument("gamertag")
+    eta_parser.set_defaults(handler=print_eta)
+
+    roster_parser = commands.add_parser("roster", help="export the players signed up for an event as CSV")
+    roster_parser.add_argument("event", help="event name")
+    roster_parser.add_argument("--output", metavar="PATH", help="write to this file instead of stdout")
+    roster_parser.set_defaults(handler=export_roster)
+
+    checkin_parser = commands.add_parser("checkin", help="check players in for a tournament, or close check-in")
+    checkin_parser.add_argument("event")
+    checkin_parser.add_argument("players", nargs="*", metavar="PLAYER", help="gamertag or member id")
+    checkin_parser.add_argument("--close", action="store_true", help="replace no-shows from the waitlist and fix the field")
+    checkin_parser.set_defaults(handler=check_in_players)
+
+    waitlist_parser = commands.add_parser("waitlist", help="show the waitlist of a full event")
+    waitlist_parser.add_argument("event", help="event name")
+    waitlist_parser.set_defaults(handler=show_waitlist)
+
+    withdraw_parser = commands.add_parser("withdraw", help="remove a player from an event or its waitlist")
+    withdraw_parser.add_argument("event", help="event name")
+    withdraw_parser.add_argument("gamertag", help="player to remove")
+    withdraw_parser.set_defaults(handler=withdraw_player)
+
+    ratings_parser = commands.add_parser("ratings", help="show the highest-rated players")
+    ratings_parser.add_argument("--top", type=int, default=20, help="number of players (default: %(default)s)")
+    ratings_parser.add_argument("--recompute", action="store_true", help="rebuild all ratings from match history first")
+    ratings_parser.set_defaults(handler=show_ratings)
+
+    queue_parser = commands.add_parser("queue", help="look for a casual opponent")
+    queue_parser.add_argument("gamertag", help="player looking for a game")
+    queue_parser.add_argument("game", help="game title, as in the Game Library")
+    queue_parser.set_defaults(handler=queue_player)
+
+    unqueue_parser = commands.add_parser("unqueue", help="stop looking for a casual opponent")
+    unqueue_parser.add_argument("gamertag", help="player to remove from the queue")
+    unqueue_parser.set_defaults(handler=unqueue_player)
+
+    matchmake_parser = commands.add_parser("matchmake", help="pair queued players now and show the queue")
+    matchmake_parser.set_defaults(handler=run_matchmaking)
+
+    seed_parser = commands.add_parser("seed", help="set a player's tournament seed")
+    seed_parser.add_argument("event", help="tournament name")
+    seed_parser.add_argument("gamertag", help="player to seed")
+    seed_parser.add_argument("seed", type=int, nargs="?", help="seed, 1 = top (omit to clear)")
+    seed_parser.set_defaults(handler=seed_player)
+
+    sessions_parser = commands.add_parser("sessions", help="list campaign sessions and clashes")
+    sessions_parser.add_argument("--from", dest="start", metavar="YYYY-MM-DD", help="first day (default: today)")
+    sessions_parser.add_argument("--days", type=int, default=7, help="number of days (default: %(default)s)")
+    sessions_parser.set_defaults(handler=list_sessions)
+
+    tables_parser = commands.add_parser("tables", help="show the table plan for a day")
+    tables_parser.add_argument("--day", metavar="YYYY-MM-DD", help="day to plan (default: today)")
+    tables_parser.set_defaults(handler=show_tables)
+
+    args = parser.parse_args()
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,17 @@
+import logging
 from view.menu import MenuWindow
 from model.order import *
 from view.tournament_display import TournamentDisplay
 from view.game_library_display import GameDisplay
 from model.current_events import CurrentEvents
 from view.events_display import EventsDisplay, AllEventsDisplay, EventSignUp
+from view.import_dialog import ImportDialog
+from view.diagnostics_window import DiagnosticsWindow
+from model.instrumentation import Timed
+from model import profiling
+from model.profiling import profiled
+
+logger = logging.getLogger(__name__)
 
 class Controller:
     """
@@ -31,41 +39,71 @@ class Controller:
         self.events = CurrentEvents()  # Handles event-related data retrieval
         self.order = Order()  # Manages orders in the cafe system
 
+    @profiled()  # Only when profiling mode is on (GAME_CAFE_PROFILE=1 or Ctrl+Shift+P)
+    @Timed()
     def open_game_library(self):
         """Opens the Game Library window."""
-        print("Game Library opened")  # Debugging output
+        logger.debug("Game Library opened")
         self.game_library_display = GameDisplay(self)  # Load game library UI
         self.game_library_display.show()  # Display window
 
+    @profiled()
+    @Timed()
     def open_tournaments(self):
         """Opens the Tournaments window."""
-        print("Tournaments opened")
+        logger.debug("Tournaments opened")
         self.tournament_view = TournamentDisplay(self)  # Load tournament UI
         self.tournament_view.show()  # Display window
 
+    @profiled()
+    @Timed()
     def open_cafe_menu(self):
         """Opens the Cafe Menu window."""
-        print("Café Menu opened")  # Debugging output
+        logger.debug("Café Menu opened")
         self.menu_window = MenuWindow(self)  # Load cafe menu UI
         self.menu_window.show()  # Display window
 
+    @profiled()
+    @Timed()
     def on_game_clicked(self, game_name):
         """Opens the Events Display for a specific game."""
-        print(f"--- {game_name.upper()} Events at the Cafe ---")  # Debugging output
+        logger.debug("events opened game=%s", game_name)
         self.event_window = EventsDisplay(game_name, self)  # Load event UI for the selected game
         self.event_window.show()  # Display window
 
+    @profiled()
+    @Timed()
     def open_events(self):
         """Opens the All Events display window, showing all upcoming events at the cafe."""
-        print("Opening All Events Window")  # Debugging output
+        logger.debug("All Events opened")
         self.all_events = AllEventsDisplay(self)  # Load all events UI
         self.all_events.show()  # Display window
 
+    @profiled()
+    @Timed()
     def on_signup(self, event, event_type):
         """Opens the sign-up window for the user to sign up for the associated event."""
         self.sign_up = EventSignUp(self, event, event_type)  # Load event sign-up UI
         self.sign_up.show()  # Display window
 
+    @profiled()
+    @Timed()
+    def open_bulk_import(self):
+        """Opens the admin Bulk Import dialog for CSV members and sign-ups."""
+        self.import_dialog = ImportDialog()  # Load bulk import UI
+        self.import_dialog.show()  # Display window
+
+    def open_diagnostics(self):
+        """Opens the hidden Diagnostics window with timing for recent actions and queries."""
+        self.diagnostics_window = DiagnosticsWindow()  # Load diagnostics UI
+        self.diagnostics_window.show()  # Display window
+
+    def toggle_profiling(self):
+        """Turns cProfile capture of window opens on or off and returns the new state."""
+        profiling.set_enabled(not profiling.is_enabled())
+        return profiling.is_enabled()
+
+    @Timed()
     def add_to_cart(self, item):
         """Adds an item to the cart in menu.py."""
         # Check if the item already exists in the cart
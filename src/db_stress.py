@@ -0,0 +1,154 @@
+"""
+**Database Stress Check - Multi-Kiosk Write Contention**
+
+**Purpose:**
+- Simulates several kiosks registering members and signing them up for events at the same time.
+- Verifies that no write is lost, no event is overfilled, and write latency stays bounded.
+
+**Why This File Exists:**
+- Concurrency bugs only show up under contention, which never happens when testing one kiosk by hand.
+- Gives a repeatable check to run after changing `model/database.py` or any writer.
+
+**Usage:**
+```
+python src/db_stress.py [--processes 8] [--iterations 200] [--p99-limit 2.0]
+```
+- Runs against a temporary copy of `src/game_cafe.db`; the real database is never touched.
+- Exits with status 1 if any write was lost, an event was overfilled, or p99 latency exceeded the limit.
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+from model import database
+from model.event_signups import EventSignUps, SignUpResult
+from model.registered_users import RegisteredUsers
+
+BIG_EVENT = "Stress Test Open"  # Large enough for every simulated player
+SMALL_EVENT = "Stress Test Finals"  # Deliberately tiny so the capacity check is contended
+SMALL_EVENT_SEATS = 8
+
+
+def kiosk(db_path: str, kiosk_id: int, iterations: int, results) -> None:
+    """
+    **Runs one simulated kiosk: register a player, then sign them up for both stress events.**
+
+    Sends `(latencies, big_ok, small_ok, errors)` back through the `results` queue.
+    """
+    users = RegisteredUsers(db_path)
+    signups = EventSignUps(db_path)
+    latencies = []  # Seconds per write, across all three write types
+    big_ok = small_ok = 0
+    errors = []
+
+    for i in range(iterations):
+        gamertag = f"stress_{kiosk_id}_{i}"
+        try:
+            start = time.perf_counter()
+            user_id = users.add_user("Stress", "Tester", gamertag, f"{gamertag}@example.com")
+            latencies.append(time.perf_counter() - start)
+
+            for event_name in (BIG_EVENT, SMALL_EVENT):
+                start = time.perf_counter()
+                result = signups.add_user_to_event(user_id, event_name)
+                latencies.append(time.perf_counter() - start)
+                if result is SignUpResult.OK:
+                    if event_name == BIG_EVENT:
+                        big_ok += 1
+                    else:
+                        small_ok += 1
+        except sqlite3.Error as error:  # Any error here is a write the GUI would have lost
+            errors.append(f"{gamertag}: {error}")
+
+    results.put((latencies, big_ok, small_ok, errors))
+
+
+def percentile(values: list, fraction: float) -> float:
+    """ Returns the value below which `fraction` of the sorted values fall. """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main() -> int:
+    """ Runs the stress check and prints a summary. Returns the process exit status. """
+    parser = argparse.ArgumentParser(description="Hammer the cafe database from several processes.")
+    parser.add_argument("--processes", type=int, default=8, help="number of simulated kiosks")
+    parser.add_argument("--iterations", type=int, default=200, help="registrations per kiosk")
+    parser.add_argument("--p99-limit", type=float, default=2.0, help="maximum acceptable p99 write latency in seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Work on a copy so the real database is never modified
+        db_path = os.path.join(tmp, "game_cafe.db")
+        shutil.copy(database.DB_PATH, db_path)
+        total_players = args.processes * args.iterations
+        conn = database.connect(db_path)
+        with database.immediate_transaction(conn):
+            for name, seats in ((BIG_EVENT, total_players), (SMALL_EVENT, SMALL_EVENT_SEATS)):
+                event_id = conn.execute("""
+                    INSERT INTO events (name, kind, game_type, starts_at, ends_at, time, max_players)
+                    VALUES (?, 'tournament', 'chess', '2030-01-01 18:00', '2030-01-01 22:00', '6:00 PM', ?)
+                """, (name, seats)).lastrowid
+                conn.execute("""
+                    INSERT INTO tournament_details (event_id, format, entry_fee, prize)
+                    VALUES (?, 'round_robin', '$0', 'None')
+                """, (event_id,))
+        users_before = conn.execute("SELECT COUNT(*) FROM registered_users").fetchone()[0]
+        conn.close()
+
+        # Start every kiosk, then collect their results
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=kiosk, args=(db_path, k, args.iterations, results))
+            for k in range(args.processes)
+        ]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        reports = [results.get() for _ in workers]
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+        latencies = [latency for report in reports for latency in report[0]]
+        big_ok = sum(report[1] for report in reports)
+        small_ok = sum(report[2] for report in reports)
+        errors = [error for report in reports for error in report[3]]
+
+        # Compare what the kiosks were told against what the database actually holds
+        conn = database.connect(db_path)
+        users_added = conn.execute("SELECT COUNT(*) FROM registered_users").fetchone()[0] - users_before
+        big_rows = conn.execute("SELECT COUNT(*) FROM event_signup WHERE event_name = ?", (BIG_EVENT,)).fetchone()[0]
+        small_rows = conn.execute("SELECT COUNT(*) FROM event_signup WHERE event_name = ?", (SMALL_EVENT,)).fetchone()[0]
+        conn.close()
+
+    p50, p99 = percentile(latencies, 0.50), percentile(latencies, 0.99)
+    print(f"{len(latencies)} writes from {args.processes} processes in {elapsed:.2f}s")
+    print(f"latency p50 {p50 * 1000:.1f} ms | p99 {p99 * 1000:.1f} ms | max {max(latencies) * 1000:.1f} ms")
+    print(f"registrations {users_added}/{total_players} | {BIG_EVENT} {big_rows}/{total_players} | "
+          f"{SMALL_EVENT} {small_rows}/{SMALL_EVENT_SEATS}")
+
+    failures = errors[:10]  # Print only the first few errors
+    if users_added != total_players:
+        failures.append(f"lost registrations: expected {total_players}, stored {users_added}")
+    if big_rows != total_players or big_ok != big_rows:
+        failures.append(f"lost sign-ups: {big_ok} reported OK, {big_rows} stored, {total_players} expected")
+    if small_rows != SMALL_EVENT_SEATS or small_ok != small_rows:
+        failures.append(f"capacity violated: {small_ok} reported OK, {small_rows} stored, {SMALL_EVENT_SEATS} seats")
+    if p99 > args.p99_limit:
+        failures.append(f"p99 latency {p99:.3f}s exceeds limit {args.p99_limit:.3f}s")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print("PASS" if not failures else f"FAILED ({len(failures)} problems)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+**Bulk CSV Import - Command Line Entry Point**
+
+**Purpose:**
+- Imports pre-registered members or event sign-ups from a CSV spreadsheet without opening the GUI.
+
+**Usage:**
+```
+python src/import_csv.py members registrations.csv
+python src/import_csv.py signups signups.csv --errors rejected.csv
+```
+- Member files need a `fname,lname,gamertag,email` header; sign-up files need `gamertag,event_name`.
+- Every rejected row is reported with its line number; `--errors` also writes them to a CSV file.
+"""
+
+import argparse
+import csv
+import sys
+import time
+
+from model.bulk_import import BulkImporter
+
+MAX_PRINTED_ERRORS = 20  # Longer error lists should be written to a file with --errors
+
+
+def main() -> int:
+    """ Parses arguments, runs the import and prints a summary. Returns the process exit status. """
+    parser = argparse.ArgumentParser(description="Bulk import members or event sign-ups from CSV.")
+    parser.add_argument("kind", choices=["members", "signups"], help="what the CSV file contains")
+    parser.add_argument("csv_path", help="path to the CSV file")
+    parser.add_argument("--errors", metavar="PATH", help="write rejected rows to this CSV file")
+    args = parser.parse_args()
+
+    importer = BulkImporter()
+    started = time.perf_counter()
+    try:
+        with open(args.csv_path, newline="", encoding="utf-8-sig") as csv_file:  # utf-8-sig strips Excel's BOM
+            if args.kind == "members":
+                report = importer.import_members(csv_file)
+            else:
+                report = importer.import_signups(csv_file)
+    except (OSError, ValueError) as error:
+        print(f"Import failed: {error}")
+        return 1
+
+    print(f"{report} in {time.perf_counter() - started:.2f}s")
+    for line, reason in report.errors[:MAX_PRINTED_ERRORS]:
+        print(f"  line {line}: {reason}")
+    if len(report.errors) > MAX_PRINTED_ERRORS:
+        print(f"  ... and {len(report.errors) - MAX_PRINTED_ERRORS} more")
+
+    if args.errors and report.errors:
+        with open(args.errors, "w", newline="", encoding="utf-8") as error_file:
+            writer = csv.writer(error_file)
+            writer.writerow(["line", "reason"])
+            writer.writerows(report.errors)
+        print(f"Rejected rows written to {args.errors}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,10 @@
 import sys
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
 import view.main_window as mw  
 import controller.controller as ctr  
+from model.log_config import configure_logging
+from model.stall_watchdog import HEARTBEAT_MS, start_watchdog
 
 """
 **Main File - Program Entry Point**
@@ -29,9 +32,17 @@ def load_stylesheet(app):
 
 if __name__ == "__main__":
     """ Program Initialization """
+    configure_logging()  # Rotating log files; DEBUG output only when GAME_CAFE_LOG_LEVEL=DEBUG
     app = QApplication(sys.argv)  # Initialize QApplication
     load_stylesheet(app)  # Apply styles
 
+    # Log GUI freezes with the stack that caused them (threshold: GAME_CAFE_STALL_MS, 0 = off)
+    watchdog = start_watchdog()
+    if watchdog is not None:
+        heartbeat = QTimer()
+        heartbeat.timeout.connect(watchdog.beat)
+        heartbeat.start(HEARTBEAT_MS)
+
     controller = ctr.Controller()  # Initialize the controller
     window = mw.MainWindow(controller)  # Create the main window
     window.show()  # Show the main window
@@ -0,0 +1,252 @@
+import csv
+from model import database
+
+BATCH_SIZE = 5000  # Rows written per transaction; keeps each write lock short so kiosks are not blocked
+
+MEMBER_COLUMNS = ("fname", "lname", "gamertag", "email")  # Required header columns for member files
+SIGNUP_COLUMNS = ("gamertag", "event_name")  # Required header columns for sign-up files
+
+
+class ImportReport:
+    """
+    **ImportReport Class**
+
+    **Class Purpose:**
+    - Summarizes a bulk import: how many rows were read, how many were stored, and why the rest were rejected.
+
+    **Attributes:**
+    - `rows_read` (int): Data rows read from the CSV file (header excluded).
+    - `imported` (int): Rows written to the database.
+    - `errors` (list[tuple[int, str]]): `(line number, reason)` for every rejected row.
+    """
+
+    def __init__(self):
+        """ Initializes an empty report. """
+        self.rows_read = 0
+        self.imported = 0
+        self.errors = []
+
+    def reject(self, line: int, reason: str) -> None:
+        """ Records a rejected row. """
+        self.errors.append((line, reason))
+
+    def __str__(self) -> str:
+        """ Returns a one-line summary of the import. """
+        return f"{self.imported} of {self.rows_read} rows imported, {len(self.errors)} rejected"
+
+
+class BulkImporter:
+    """
+    **BulkImporter Class**
+
+    **Class Purpose:**
+    - Imports members and event sign-ups from CSV spreadsheets in bulk.
+
+    **Why This Class Exists:**
+    - Convention weekends bring thousands of pre-registrations at once; entering them one at a time
+      through the `Registration` form (one connection per lookup) is not practical.
+
+    **Implementation Decisions:**
+    - Existing gamertags, emails, events and sign-ups are loaded with one query each, so duplicate
+      checks are set lookups instead of a query per row.
+    - Rows are streamed with `csv.DictReader` and written in batches of `BATCH_SIZE`, each batch one
+      short transaction through `database.write()`.
+    - Inserts use `INSERT OR IGNORE`, so a row registered by a kiosk while the import runs is reported
+      as a duplicate instead of aborting the whole batch.
+    """
+
+    def __init__(self, db_path=database.DB_PATH, batch_size=BATCH_SIZE):
+        """ Initializes the BulkImporter class and defines the database path. """
+        self.db_path = db_path  # Assigns the database path to a variable for easier connections.
+        self.batch_size = batch_size  # Rows written per transaction
+
+    def import_members(self, csv_file, progress=None) -> ImportReport:
+        """
+        **Imports registered users from a CSV file.**
+
+        **Parameters:**
+        - `csv_file` (file object): An open text file with a `fname,lname,gamertag,email` header.
+        - `progress` (callable | None): Called with the report after every batch written.
+
+        **Returns:**
+        - `ImportReport`: Counts and per-row errors.
+
+        **Step-by-Step Explanation:**
+        1️⃣ **Step 1 - Load Existing Keys**
+           - Reads every existing gamertag and email into sets in one query.
+
+        2️⃣ **Step 2 - Validate Each Row**
+           - Rejects rows with missing fields, or a gamertag/email already registered or repeated earlier in the file.
+
+        3️⃣ **Step 3 - Write in Batches**
+           - Valid rows are buffered and inserted `batch_size` at a time.
+        """
+        report = ImportReport()
+        reader = self._open_reader(csv_file, MEMBER_COLUMNS)
+
+        # Step 1: Load existing gamertags and emails once
+        conn = database.connect(self.db_path)
+        gamertags, emails = set(), set()
+        for gamertag, email in conn.execute("SELECT gamertag, email FROM registered_users"):
+            gamertags.add(gamertag)
+            emails.add(email)
+        conn.close()
+
+        # Step 2: Validate rows as they stream in
+        batch = []  # (line, gamertag, fname, lname, email)
+        for row in reader:
+            report.rows_read += 1
+            line = reader.line_num
+            fname, lname, gamertag, email = (self._field(row, column) for column in MEMBER_COLUMNS)
+
+            if not fname or not lname or not gamertag or not email:
+                report.reject(line, "All fields are required")
+                continue
+            if gamertag in gamertags:
+                report.reject(line, f"Gamertag '{gamertag}' already exists")
+                continue
+            if email in emails:
+                report.reject(line, f"Email '{email}' already exists")
+                continue
+
+            gamertags.add(gamertag)  # Later rows in the same file are duplicates of this one
+            emails.add(email)
+            batch.append((line, gamertag, fname, lname, email))
+
+            # Step 3: Flush full batches
+            if len(batch) >= self.batch_size:
+                self._write_members(batch, report)
+                batch = []
+                if progress is not None:
+                    progress(report)
+
+        if batch:
+            self._write_members(batch, report)
+        return report
+
+    def import_signups(self, csv_file, progress=None) -> ImportReport:
+        """
+        **Imports event sign-ups from a CSV file.**
+
+        **Parameters:**
+        - `csv_file` (file object): An open text file with a `gamertag,event_name` header.
+        - `progress` (callable | None): Called with the report after every batch written.
+
+        **Returns:**
+        - `ImportReport`: Counts and per-row errors.
+
+        **Step-by-Step Explanation:**
+        1️⃣ **Step 1 - Load Lookups**
+           - Reads gamertag ids, event capacities and existing sign-ups in one query each.
+
+        2️⃣ **Step 2 - Validate Each Row**
+           - Rejects unknown gamertags or events, duplicates and rows beyond an event's capacity.
+
+        3️⃣ **Step 3 - Write in Batches**
+           - Seat counts are re-checked inside each batch transaction, so kiosk sign-ups made
+             during the import can never cause an event to overfill.
+        """
+        report = ImportReport()
+        reader = self._open_reader(csv_file, SIGNUP_COLUMNS)
+
+        # Step 1: Load lookups once
+        conn = database.connect(self.db_path)
+        user_ids = dict(conn.execute("SELECT gamertag, id FROM registered_users"))
+        capacity = dict(conn.execute("SELECT name, max_players FROM events"))
+        taken = dict(conn.execute("SELECT event_name, COUNT(*) FROM event_signup GROUP BY event_name"))
+        signed_up = set(conn.execute("SELECT event_name, gamertag FROM event_signup"))
+        conn.close()
+
+        # Step 2: Validate rows as they stream in
+        batch = []  # (line, user_id, event_name)
+        for row in reader:
+            report.rows_read += 1
+            line = reader.line_num
+            gamertag, event_name = (self._field(row, column) for column in SIGNUP_COLUMNS)
+
+            user_id = user_ids.get(gamertag)
+            if user_id is None:
+                report.reject(line, f"Gamertag '{gamertag}' is not registered")
+                continue
+            if event_name not in capacity:
+                report.reject(line, f"Event '{event_name}' not found")
+                continue
+            if (event_name, user_id) in signed_up:
+                report.reject(line, f"'{gamertag}' is already signed up for '{event_name}'")
+                continue
+            if taken.get(event_name, 0) >= capacity[event_name]:
+                report.reject(line, f"Event '{event_name}' is full")
+                continue
+
+            signed_up.add((event_name, user_id))
+            taken[event_name] = taken.get(event_name, 0) + 1
+            batch.append((line, user_id, event_name))
+
+            # Step 3: Flush full batches
+            if len(batch) >= self.batch_size:
+                self._write_signups(batch, capacity, report)
+                batch = []
+                if progress is not None:
+                    progress(report)
+
+        if batch:
+            self._write_signups(batch, capacity, report)
+        return report
+
+    def _open_reader(self, csv_file, required: tuple) -> csv.DictReader:
+        """ Wraps the file in a DictReader and checks the header has every required column. """
+        reader = csv.DictReader(csv_file)
+        header = [name.strip().lower() for name in (reader.fieldnames or [])]
+        missing = [column for column in required if column not in header]
+        if missing:
+            raise ValueError(f"CSV header is missing column(s): {', '.join(missing)}")
+        reader.fieldnames = header  # Normalized names so "Gamertag" and " gamertag" both work
+        return reader
+
+    def _field(self, row: dict, column: str) -> str:
+        """ Returns a stripped field value, treating missing cells as empty. """
+        return (row.get(column) or "").strip()
+
+    def _write_members(self, batch: list, report: ImportReport) -> None:
+        """ Inserts one batch of members in a single transaction and records rows that collided. """
+        def insert(conn):
+            rejected = []
+            for line, gamertag, fname, lname, email in batch:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO registered_users (gamertag, fname, lname, email) VALUES (?, ?, ?, ?)",
+                    (gamertag, fname, lname, email)
+                )
+                if cursor.rowcount == 0:  # Registered by a kiosk since the keys were loaded
+                    rejected.append((line, f"Gamertag '{gamertag}' already exists"))
+            return rejected
+
+        rejected = database.write(insert, self.db_path)
+        report.imported += len(batch) - len(rejected)
+        report.errors.extend(rejected)
+
+    def _write_signups(self, batch: list, capacity: dict, report: ImportReport) -> None:
+        """ Inserts one batch of sign-ups in a single transaction, re-checking seats under the write lock. """
+        def insert(conn):
+            events = {event_name for _, _, event_name in batch}
+            placeholders = ", ".join("?" * len(events))
+            taken = dict(conn.execute(
+                f"SELECT event_name, COUNT(*) FROM event_signup WHERE event_name IN ({placeholders}) GROUP BY event_name",
+                tuple(events)
+            ))
+            rejected = []
+            for line, user_id, event_name in batch:
+                if taken.get(event_name, 0) >= capacity[event_name]:  # Filled by kiosks during the import
+                    rejected.append((line, f"Event '{event_name}' is full"))
+                    continue
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO event_signup (gamertag, event_name) VALUES (?, ?)", (user_id, event_name)
+                )
+                if cursor.rowcount == 0:  # Signed up at a kiosk since the lookups were loaded
+                    rejected.append((line, f"Already signed up for '{event_name}'"))
+                    continue
+                taken[event_name] = taken.get(event_name, 0) + 1
+            return rejected
+
+        rejected = database.write(insert, self.db_path)
+        report.imported += len(batch) - len(rejected)
+        report.errors.extend(rejected)
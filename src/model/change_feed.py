@@ -0,0 +1,63 @@
+from model import database
+
+
+class ChangeFeed:
+    """
+    **ChangeFeed Class**
+
+    **Class Purpose:**
+    - Reports which tournaments, campaigns, sign-ups and match results changed since the last check.
+
+    **Why This Class Exists:**
+    - Open windows never refreshed; closing and reopening them redid every query and widget.
+    - With the names of what changed, a window can patch only the affected rows or matches.
+
+    **Implementation Decisions:**
+    - Database triggers append `(entity, key)` rows to `change_log` on every insert, update and
+      delete, whoever made the change (another kiosk, the CLI, a bulk import).
+    - `PRAGMA data_version` on a long-lived connection changes only when *another* connection
+      commits, so an idle poll is a single pragma and `change_log` is read only after a commit.
+    - `change_log` keeps the most recent entries only; a reader that fell further behind is told
+      to reload everything instead of silently missing changes.
+    - Qt-free, so the same feed can drive the GUI (`view/change_notifier.py`) or any other poller.
+    """
+
+    def __init__(self, db_path=database.DB_PATH):
+        """ Opens the polling connection and starts from the current state of the database. """
+        self.conn = database.connect(db_path)  # Kept open: data_version is tracked per connection
+        self.last_version = self.data_version()
+        self.last_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM change_log").fetchone()[0]
+
+    def data_version(self) -> int:
+        """ Returns the counter SQLite bumps whenever another connection commits. """
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def poll(self):
+        """
+        **Returns the changes committed since the previous call.**
+
+        **Returns:**
+        - `list[tuple[str, str]]`: Distinct `(entity, key)` pairs in the order they first changed,
+          e.g. `("result", "Cafe Chess Masters")`. Entities are `"tournament"`, `"campaign"`,
+          `"signup"` and `"result"`; the key is the event name. Empty if nothing changed.
+        - `None`: Changes were pruned before they could be read; reload everything.
+        """
+        version = self.data_version()
+        if version == self.last_version:
+            return []  # Nothing committed since the last poll
+        self.last_version = version
+
+        oldest = self.conn.execute("SELECT MIN(id) FROM change_log").fetchone()[0]
+        rows = self.conn.execute(
+            "SELECT id, entity, key FROM change_log WHERE id > ? ORDER BY id", (self.last_id,)
+        ).fetchall()
+        missed = oldest is not None and oldest > self.last_id + 1  # Entries after last_id were pruned
+        if rows:
+            self.last_id = rows[-1][0]
+        if missed:
+            return None
+        return list(dict.fromkeys((entity, key) for _, entity, key in rows))
+
+    def close(self) -> None:
+        """ Closes the polling connection. """
+        self.conn.close()
@@ -0,0 +1,223 @@
+"""
+**Check-In Module - Tournament-Day Arrivals, No-Shows and Replacements**
+
+**Purpose:**
+- Records who actually turned up for a tournament, and at the cutoff hands the seats of
+  no-shows to players waiting at the door.
+
+**Why This File Exists:**
+- Staff compared the printed roster against the people in the room by hand, then rebuilt the
+  bracket; with a line at the door that took longer than the first round.
+
+**Implementation Decisions:**
+- A `CheckInDesk` reads the roster and waitlist once and keeps two dictionaries, gamertag ->
+  id and id -> gamertag, so each arrival is a hash lookup plus one small insert into `checkins`,
+  however long the roster is. Staff can type a gamertag (any case) or a member id.
+- Waitlisted players can check in too: they are standing by for a no-show's seat.
+- Closing check-in is one write transaction:
+  1. Every player gets their current bracket seat stored as their seed, so the bracket is pinned.
+  2. Absent waitlisted players are dropped from the queue, so only people in the room are promoted.
+  3. Each no-show's sign-up is removed. The `waitlist_promote_on_leave` trigger (see
+     `model/database.py`) promotes the next player standing by, who takes the no-show's seat.
+  4. No-shows are marked `no_show` and the tournament is marked closed.
+- Because every seat is pinned, only the no-shows' first-round matches change (a seat nobody
+  took becomes a bye). `Tournament.reseat_first_round()` applies the same change to a bracket
+  already on screen.
+"""
+
+import logging
+from enum import Enum
+from typing import NamedTuple
+from model import database
+
+logger = logging.getLogger(__name__)
+
+
+class CheckInResult(Enum):
+    """ Outcome of checking one player in; each member carries the text shown at the desk. """
+
+    OK = "ok"
+    ALREADY = "already"
+    STANDBY = "standby"
+    UNKNOWN = "unknown"
+    CLOSED = "closed"
+
+    @property
+    def message(self) -> str:
+        """ Returns the desk text for this result. """
+        return {
+            CheckInResult.OK: "Checked in.",
+            CheckInResult.ALREADY: "Already checked in.",
+            CheckInResult.STANDBY: "Checked in on the waitlist: standing by for a no-show's seat.",
+            CheckInResult.UNKNOWN: "Not signed up or waiting for this tournament.",
+            CheckInResult.CLOSED: "Check-in has closed.",
+        }[self]
+
+
+class CheckInSummary(NamedTuple):
+    """ What closing check-in changed. """
+    replacements: dict  # No-show id -> id of the player promoted into their seat (None if nobody was standing by)
+    no_shows: list  # Gamertags of players who did not check in
+    promoted: list  # Gamertags of waitlisted players who got a seat
+
+
+class CheckInDesk:
+    """
+    **CheckInDesk Class**
+
+    **Class Purpose:**
+    - Checks players in for one tournament and closes check-in at the cutoff.
+
+    **Attributes:**
+    - `ids` (dict[str, int]): Lower-cased gamertag -> player id, for everyone signed up or waiting.
+    - `gamertags` (dict[int, str]): Player id -> gamertag, for the same players.
+    - `waiting` (set[int]): Players on the waitlist.
+    - `present` (set[int]): Players already checked in.
+    - `closed` (bool): Whether check-in has closed.
+    """
+
+    def __init__(self, event_name: str, db_path=database.DB_PATH):
+        """ Loads the roster, waitlist and earlier check-ins for `event_name`. """
+        self.event_name = event_name
+        self.db_path = db_path  # Assigns the database path to a variable for easier connections.
+        self.ids, self.gamertags = {}, {}
+        self.waiting, self.present = set(), set()
+        self.closed = False
+        self.reload()
+
+    def reload(self) -> None:
+        """ Rereads the roster, waitlist and check-ins (e.g. after a late sign-up at another kiosk). """
+        conn = database.connect(self.db_path)
+        rows = conn.execute("""
+            SELECT u.id, u.gamertag, 0 FROM event_signup s JOIN registered_users u ON u.id = s.gamertag
+            WHERE s.event_name = ?
+            UNION ALL
+            SELECT u.id, u.gamertag, 1 FROM waitlist w JOIN registered_users u ON u.id = w.gamertag
+            WHERE w.event_name = ?
+        """, (self.event_name, self.event_name)).fetchall()
+        present = conn.execute(
+            "SELECT player_id FROM checkins WHERE event_name = ? AND status = 'present'", (self.event_name,)
+        ).fetchall()
+        closed = conn.execute("""
+            SELECT d.checkin_closed_at FROM events e JOIN tournament_details d ON d.event_id = e.id
+            WHERE e.name = ?
+        """, (self.event_name,)).fetchone()
+        conn.close()
+
+        self.ids = {gamertag.lower(): player_id for player_id, gamertag, _ in rows}
+        self.gamertags = {player_id: gamertag for player_id, gamertag, _ in rows}
+        self.waiting = {player_id for player_id, _, waiting in rows if waiting}
+        self.present = {player_id for (player_id,) in present}
+        self.closed = bool(closed and closed[0])
+
+    def find(self, player: str):
+        """ Returns the id for a gamertag (any case) or member id typed at the desk, or `None` if not on the roster. """
+        player = player.strip()
+        player_id = self.ids.get(player.lower())
+        if player_id is None and player.isdigit() and int(player) in self.gamertags:
+            player_id = int(player)
+        return player_id
+
+    def check_in(self, player: str) -> CheckInResult:
+        """
+        **Checks in a player by gamertag or member id.**
+
+        **Returns:**
+        - `CheckInResult`: `OK`, `STANDBY` (waitlisted), `ALREADY`, `UNKNOWN` or `CLOSED`.
+        """
+        if self.closed:
+            return CheckInResult.CLOSED
+        player_id = self.find(player)
+        if player_id is None:
+            return CheckInResult.UNKNOWN
+        if player_id in self.present:
+            return CheckInResult.ALREADY
+
+        def save(conn):
+            conn.execute("INSERT OR IGNORE INTO checkins (event_name, player_id) VALUES (?, ?)", (self.event_name, player_id))
+
+        database.write(save, self.db_path)
+        self.present.add(player_id)
+        return CheckInResult.STANDBY if player_id in self.waiting else CheckInResult.OK
+
+    def missing(self) -> list[str]:
+        """ Returns the gamertags of signed-up players who have not checked in yet. """
+        return sorted((gamertag for player_id, gamertag in self.gamertags.items()
+                       if player_id not in self.present and player_id not in self.waiting), key=str.lower)
+
+    def close(self, tournament) -> CheckInSummary:
+        """
+        **Closes check-in: pins every seat, removes no-shows and promotes players standing by.**
+
+        **Parameters:**
+        - `tournament` (Tournament): The bracket as generated before closing, for its seat order.
+
+        **Raises:**
+        - `ValueError`: If check-in has already closed.
+
+        **Step-by-Step Explanation:**
+        1️⃣ **Step 1 - Pin Every Seat**
+           - `tournament.seat_numbers()` become the players' seeds.
+        2️⃣ **Step 2 - Keep Only Players Standing By in the Queue**
+        3️⃣ **Step 3 - Remove No-Shows**
+           - Each removal promotes the next player standing by, who inherits the no-show's seed.
+        4️⃣ **Step 4 - Mark No-Shows and Close**
+        """
+        if self.closed:
+            raise ValueError(f"Check-in for {self.event_name} has already closed")
+        seats = tournament.seat_numbers()
+
+        def close(conn):
+            # Step 1: Pin every seat
+            conn.executemany(
+                "UPDATE event_signup SET seed = ? WHERE event_name = ? AND gamertag = ?",
+                [(seat, self.event_name, player) for player, seat in seats.items()],
+            )
+            present = {player for (player,) in conn.execute(
+                "SELECT player_id FROM checkins WHERE event_name = ? AND status = 'present'", (self.event_name,)
+            )}  # Reread under the write lock: other kiosks may have checked players in
+
+            # Step 2: Nobody absent is promoted
+            queue = [player for (player,) in conn.execute(
+                "SELECT gamertag FROM waitlist WHERE event_name = ? ORDER BY id", (self.event_name,)
+            )]
+            conn.executemany(
+                "DELETE FROM waitlist WHERE event_name = ? AND gamertag = ?",
+                [(self.event_name, player) for player in queue if player not in present],
+            )
+            standing_by = [player for player in queue if player in present]
+
+            # Step 3: Each removal promotes the head of the queue into the freed seat
+            no_shows = [player for player in sorted(seats, key=seats.get) if player not in present]
+            replacements = {}
+            for player in no_shows:
+                conn.execute("DELETE FROM event_signup WHERE event_name = ? AND gamertag = ?", (self.event_name, player))
+                replacement = standing_by.pop(0) if standing_by else None
+                if replacement is not None:
+                    conn.execute(
+                        "UPDATE event_signup SET seed = ? WHERE event_name = ? AND gamertag = ?",
+                        (seats[player], self.event_name, replacement),
+                    )
+                replacements[player] = replacement
+
+            # Step 4: Record no-shows and close
+            conn.executemany("""
+                INSERT INTO checkins (event_name, player_id, status) VALUES (?, ?, 'no_show')
+                ON CONFLICT (event_name, player_id) DO UPDATE SET status = 'no_show', checked_at = datetime('now')
+            """, [(self.event_name, player) for player in no_shows])
+            conn.execute("""
+                UPDATE tournament_details SET checkin_closed_at = datetime('now')
+                WHERE event_id = (SELECT id FROM events WHERE name = ?)
+            """, (self.event_name,))
+            return replacements
+
+        replacements = database.write(close, self.db_path)
+        self.closed = True
+        self.waiting -= set(replacements.values())
+        summary = CheckInSummary(
+            replacements,
+            [self.gamertags[player] for player in replacements],
+            [self.gamertags[player] for player in replacements.values() if player is not None],
+        )
+        logger.info("check-in closed event=%s no_shows=%d promoted=%d", self.event_name, len(summary.no_shows), len(summary.promoted))
+        return summary
@@ -1,4 +1,45 @@
-import sqlite3
+from datetime import datetime, timedelta
+from model import database
+from model.instrumentation import Timed
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"  # How `events.starts_at` / `ends_at` are stored (cafe local time)
+DEFAULT_EVENT_HOURS = 4  # Length given to tournaments that were stored without an end time
+MAX_EVENT_HOURS = 24  # Longest event "happening now" looks for; keeps that query a bounded range scan
+
+# Tournament columns in the order every tournament query returns them; dates are shown as 'MM-DD-YYYY'
+TOURNAMENT_QUERY = """
+    SELECT e.name, e.game_type, d.format, strftime('%m-%d-%Y', e.starts_at), e.starts_at, d.entry_fee, d.prize, e.max_players
+    FROM events e JOIN tournament_details d ON d.event_id = e.id
+"""
+
+# Campaign columns in the order every campaign query returns them
+CAMPAIGN_QUERY = """
+    SELECT e.name, e.game_type, d.host, d.meet_day, d.meet_frequency, e.time, e.max_players
+    FROM events e JOIN campaign_details d ON d.event_id = e.id
+"""
+
+# Every event in one query; detail columns of the other kind are NULL
+EVENT_QUERY = """
+    SELECT e.kind, e.name, e.game_type, strftime('%m-%d-%Y', e.starts_at), e.time, e.max_players,
+        t.format, t.entry_fee, t.prize, c.host, c.meet_day, c.meet_frequency, e.starts_at, e.ends_at
+    FROM events e
+    LEFT JOIN tournament_details t ON t.event_id = e.id
+    LEFT JOIN campaign_details c ON c.event_id = e.id
+"""
+
+
+def to_timestamp(moment: datetime) -> str:
+    """ Formats a datetime the way `events.starts_at` and `events.ends_at` are stored. """
+    return moment.strftime(TIMESTAMP_FORMAT)
+
+
+def display_time(timestamp: str) -> str:
+    """ Turns a stored timestamp into the cafe's display time, e.g. `'2025-03-05 21:00'` -> `'9:00 PM'`. """
+    if timestamp is None:
+        return "TBD"  # Tournament without a start time yet
+    moment = datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+    return f"{moment.hour % 12 or 12}:{moment.minute:02d} {'AM' if moment.hour < 12 else 'PM'}"
+
 
 class CurrentEvents:
     """
@@ -10,14 +51,17 @@ class CurrentEvents:
     
     **Why This Class Exists:**
     - Ensures **real-time access** to tournament and campaign data stored in a structured format.
+    - Tournaments and campaigns share the `events` table (`kind` column) with their own columns in
+      `tournament_details` and `campaign_details`, so "every event" is one query.
     - Reduces reliance on **hardcoded event details** by dynamically pulling data from the database.
     - Allows easy expansion of event data without requiring changes to the application logic.
     """
     
-    def __init__(self, db_path="src\game_cafe.db"):
+    def __init__(self, db_path=database.DB_PATH):
         """ Initializes the CurrentEvents class and defines the database path. """
         self.db_path = db_path  # Assigns the database path to a variable for easier connections.
     
+    @Timed()
     def get_tournaments(self, game_name):
         """
         **Fetches tournament details for a specific game.**
@@ -44,14 +88,10 @@ class CurrentEvents:
         4️⃣ **Step 4 - Close Database Connection**
         5️⃣ **Step 5 - Return Data**
         """
-        conn = sqlite3.connect(self.db_path)  # Step 1: Establish connection to the database.
+        conn = database.connect(self.db_path)  # Step 1: Establish connection to the database.
         cursor = conn.cursor()  # Create a cursor object to execute SQL commands.
 
-        cursor.execute("""
-            SELECT event_name, game_type, event_type, date, time, entry_fee, prize, max_players
-            FROM active_tournaments
-            WHERE game_type = ?
-        """, (game_name.lower(),))  # Step 2: Execute the query, filtering by the given game_name.
+        cursor.execute(TOURNAMENT_QUERY + " WHERE e.game_type = ? AND e.kind = 'tournament'", (game_name.lower(),))  # Step 2: Execute the query, filtering by the given game_name.
 
         # Step 3: Process the query results and convert them into dictionaries.
         tournaments = [
@@ -60,7 +100,8 @@ class CurrentEvents:
                 "game_type": row[1],  # Game type
                 "type": row[2],  # Tournament format (e.g., single_elimination, double_elimination)
                 "date": row[3],  # Date of the tournament
-                "time": row[4],  # Time of the tournament
+                "time": display_time(row[4]),  # Time of the tournament
+                "starts_at": row[4],  # Start as 'YYYY-MM-DD HH:MM'
                 "entry_fee": row[5],  # Entry fee amount
                 "prize": row[6],  # Prize details
                 "max_players": int(row[7]),  # Max number of players allowed
@@ -71,6 +112,7 @@ class CurrentEvents:
         conn.close()  # Step 4: Close the database connection to free up resources.
         return tournaments  # Step 5: Return the list of tournaments.
 
+    @Timed()
     def get_campaigns(self, game_name):
         """
         **Fetches active campaigns for a specific game.**
@@ -91,10 +133,10 @@ class CurrentEvents:
         
         **Step-by-Step Explanation:**
         1️⃣ **Step 1 - Establish Database Connection**
-           - Connects to the SQLite database using `sqlite3.connect()`.
+           - Connects to the SQLite database using `database.connect()`.
         
         2️⃣ **Step 2 - Execute SQL Query**
-           - Retrieves campaign details from the `active_campaigns` table.
+           - Retrieves campaign details from `events` joined with `campaign_details`.
            - Filters results based on the provided `game_name`.
         
         3️⃣ **Step 3 - Process Query Results**
@@ -106,14 +148,10 @@ class CurrentEvents:
         5️⃣ **Step 5 - Return Data**
            - Returns a list of dictionaries, each representing a campaign.
         """
-        conn = sqlite3.connect(self.db_path)  # Step 1: Establish connection to the database.
+        conn = database.connect(self.db_path)  # Step 1: Establish connection to the database.
         cursor = conn.cursor()  # Create a cursor object to execute SQL commands.
 
-        cursor.execute("""
-            SELECT campaign_name, game_type, host, meet_day, meet_frequency, time, max_players
-            FROM active_campaigns
-            WHERE game_type = ?
-        """, (game_name.lower(),))  # Step 2: Execute query filtering by game_name.
+        cursor.execute(CAMPAIGN_QUERY + " WHERE e.game_type = ? AND e.kind = 'campaign'", (game_name.lower(),))  # Step 2: Execute query filtering by game_name.
 
         # Step 3: Process query results into dictionaries.
         campaigns = [
@@ -132,6 +170,7 @@ class CurrentEvents:
         conn.close()  # Step 4: Close the database connection.
         return campaigns  # Step 5: Return the list of campaigns.
     
+    @Timed()
     def get_all_tournaments(self):
         """
         **Fetches all active tournaments from the database.**
@@ -141,17 +180,17 @@ class CurrentEvents:
         - Ensures all tournament details are accessible from a single function call.
         
         **Implementation Decisions:**
-        - Uses a direct SQL query to fetch all tournaments from `active_tournaments`.
+        - Uses a direct SQL query to fetch all tournaments from `events` joined with `tournament_details`.
         
         **Returns:**
         - `list[dict]`: A list of tournament dictionaries.
         
         **Step-by-Step Explanation:**
         1️⃣ **Step 1 - Establish Database Connection**
-           - Connects to the SQLite database using `sqlite3.connect()`.
+           - Connects to the SQLite database using `database.connect()`.
         
         2️⃣ **Step 2 - Execute SQL Query**
-           - Retrieves tournament details from the `active_tournaments` table.
+           - Retrieves tournament details from `events` joined with `tournament_details`.
         
         3️⃣ **Step 3 - Process Query Results**
            - Converts each retrieved row into a dictionary containing tournament details.
@@ -162,13 +201,10 @@ class CurrentEvents:
         5️⃣ **Step 5 - Return Data**
            - Returns a list of dictionaries, each representing a tournament.
         """
-        conn = sqlite3.connect(self.db_path)  # Step 1: Establish connection to the database.
+        conn = database.connect(self.db_path)  # Step 1: Establish connection to the database.
         cursor = conn.cursor()  # Create a cursor object to execute SQL commands.
 
-        cursor.execute("""
-            SELECT event_name, game_type, event_type, date, time, entry_fee, prize, max_players
-            FROM active_tournaments
-        """)  # Step 2: Execute query to fetch all tournaments.
+        cursor.execute(TOURNAMENT_QUERY)  # Step 2: Execute query to fetch all tournaments.
 
         # Step 3: Process query results into dictionaries.
         tournaments = [
@@ -177,7 +213,8 @@ class CurrentEvents:
                 "game_type": row[1],  # Game type
                 "type": row[2],  # Tournament type
                 "date": row[3],  # Tournament date
-                "time": row[4],  # Tournament time
+                "time": display_time(row[4]),  # Tournament time
+                "starts_at": row[4],  # Start as 'YYYY-MM-DD HH:MM'
                 "entry_fee": row[5],  # Entry fee amount
                 "prize": row[6],  # Prize details
                 "max_players": int(row[7])  # Max number of players
@@ -186,4 +223,206 @@ class CurrentEvents:
         ]
 
         conn.close()  # Step 4: Close the database connection.
-        return tournaments  # Step 5: Return the list of tournaments.
\ No newline at end of file
+        return tournaments  # Step 5: Return the list of tournaments.
+
+    @Timed()
+    def get_tournament(self, event_name):
+        """
+        **Fetches one tournament by its event name.**
+
+        **Returns:**
+        - `dict | None`: The tournament dictionary (same keys as `get_all_tournaments()`), or `None` if not found.
+        """
+        conn = database.connect(self.db_path)
+        row = conn.execute(TOURNAMENT_QUERY + " WHERE e.name = ?", (event_name,)).fetchone()
+        conn.close()
+
+        if row is None:
+            return None
+        return {
+            "name": row[0],  # Tournament name
+            "game_type": row[1],  # Game type
+            "type": row[2],  # Tournament type
+            "date": row[3],  # Tournament date
+            "time": display_time(row[4]),  # Tournament time
+            "starts_at": row[4],  # Start as 'YYYY-MM-DD HH:MM'
+            "entry_fee": row[5],  # Entry fee amount
+            "prize": row[6],  # Prize details
+            "max_players": int(row[7])  # Max number of players
+        }
+
+    @Timed()
+    def get_all_campaigns(self):
+        """
+        **Fetches all active campaigns from the database.**
+
+        **Returns:**
+        - `list[dict]`: A list of campaign dictionaries (same keys as `get_campaigns()`).
+        """
+        conn = database.connect(self.db_path)
+        rows = conn.execute(CAMPAIGN_QUERY).fetchall()
+        conn.close()
+
+        return [
+            {
+                "name": row[0],  # Campaign name
+                "game_type": row[1],  # Game type
+                "host": row[2],  # Host of the campaign
+                "meet_day": row[3],  # Meeting day
+                "meet_frequency": row[4],  # How often they meet
+                "time": row[5],  # Meeting time
+                "max_players": int(row[6]),  # Maximum number of players
+            }
+            for row in rows
+        ]
+
+    @Timed()
+    def get_all_events(self):
+        """
+        **Fetches every tournament and campaign with one query, past tournaments included.**
+
+        **Why This Function Exists:**
+        - The main window and All Events window used to query each table and merge the results in Python.
+
+        **Returns:**
+        - `list[dict]`: Tournaments by start time, then campaigns. Each dictionary has the keys of
+          `get_all_tournaments()` or `get_all_campaigns()`, plus `"kind"` (`"tournament"` or `"campaign"`)
+          and, for tournaments, `"ends_at"`.
+        """
+        conn = database.connect(self.db_path)
+        rows = conn.execute(EVENT_QUERY + " ORDER BY e.starts_at IS NULL, e.starts_at, e.id").fetchall()
+        conn.close()
+        return [self._event_from_row(row) for row in rows]
+
+    @Timed()
+    def get_upcoming_events(self, now=None):
+        """
+        **Fetches tournaments that have not finished yet, plus every campaign.**
+
+        **Why This Function Exists:**
+        - Finished tournaments stayed on the main window and events list forever, because a
+          free-form date could not be compared in SQL.
+
+        **Implementation Decisions:**
+        - A tournament that has not ended started less than `MAX_EVENT_HOURS` ago or later, so
+          the filter is a range scan of `idx_events_starts` (plus its `NULL` entries for campaigns)
+          and `ends_at` is only checked on the rows inside that range.
+        - Campaigns have no single date (they meet on a schedule), so they are always included.
+
+        **Parameters:**
+        - `now` (datetime | None): The moment to compare against; defaults to the current time.
+
+        **Returns:**
+        - `list[dict]`: Same shape as `get_all_events()`.
+        """
+        now = now or datetime.now()
+        conn = database.connect(self.db_path)
+        rows = conn.execute(
+            EVENT_QUERY + """
+            WHERE (e.starts_at > ? AND e.ends_at > ?) OR e.starts_at IS NULL
+            ORDER BY e.starts_at IS NULL, e.starts_at, e.id
+            """,
+            (to_timestamp(now - timedelta(hours=MAX_EVENT_HOURS)), to_timestamp(now))
+        ).fetchall()
+        conn.close()
+        return [self._event_from_row(row) for row in rows]
+
+    @Timed()
+    def get_next_events(self, count, now=None):
+        """
+        **Fetches the next `count` tournaments that start at or after `now`.**
+
+        **Implementation Decisions:**
+        - `idx_events_starts` already returns rows in start order, so SQLite reads the index
+          from `now` and stops after `count` rows; nothing is sorted.
+
+        **Parameters:**
+        - `count` (int): How many events to return at most.
+        - `now` (datetime | None): The moment to compare against; defaults to the current time.
+
+        **Returns:**
+        - `list[dict]`: Same shape as `get_all_events()`, soonest first.
+        """
+        now = now or datetime.now()
+        conn = database.connect(self.db_path)
+        rows = conn.execute(
+            EVENT_QUERY + " WHERE e.starts_at >= ? ORDER BY e.starts_at LIMIT ?", (to_timestamp(now), count)
+        ).fetchall()
+        conn.close()
+        return [self._event_from_row(row) for row in rows]
+
+    @Timed()
+    def get_events_between(self, start, end):
+        """
+        **Fetches tournaments starting in the window `[start, end)`.**
+
+        **Implementation Decisions:**
+        - One range scan of `idx_events_starts`, already in start order.
+
+        **Parameters:**
+        - `start` (datetime): First moment included, e.g. midnight today.
+        - `end` (datetime): First moment excluded, e.g. midnight tomorrow.
+
+        **Returns:**
+        - `list[dict]`: Same shape as `get_all_events()`, earliest first.
+        """
+        conn = database.connect(self.db_path)
+        rows = conn.execute(
+            EVENT_QUERY + " WHERE e.starts_at >= ? AND e.starts_at < ? ORDER BY e.starts_at",
+            (to_timestamp(start), to_timestamp(end))
+        ).fetchall()
+        conn.close()
+        return [self._event_from_row(row) for row in rows]
+
+    @Timed()
+    def get_happening_now(self, now=None):
+        """
+        **Fetches tournaments that have started and not yet ended.**
+
+        **Implementation Decisions:**
+        - Only events that started within the last `MAX_EVENT_HOURS` can still be running, so
+          this is the same bounded range scan as `get_events_between()`; `ends_at` is checked on
+          those few rows.
+
+        **Parameters:**
+        - `now` (datetime | None): The moment to check; defaults to the current time.
+
+        **Returns:**
+        - `list[dict]`: Same shape as `get_all_events()`, earliest start first.
+        """
+        now = now or datetime.now()
+        conn = database.connect(self.db_path)
+        rows = conn.execute(
+            EVENT_QUERY + " WHERE e.starts_at > ? AND e.starts_at <= ? AND e.ends_at > ? ORDER BY e.starts_at",
+            (to_timestamp(now - timedelta(hours=MAX_EVENT_HOURS)), to_timestamp(now), to_timestamp(now))
+        ).fetchall()
+        conn.close()
+        return [self._event_from_row(row) for row in rows]
+
+    @Timed()
+    def get_event(self, event_name):
+        """
+        **Fetches one tournament or campaign by name.**
+
+        **Returns:**
+        - `dict | None`: Same shape as `get_all_events()`, or `None` if no event has that name.
+        """
+        conn = database.connect(self.db_path)
+        row = conn.execute(EVENT_QUERY + " WHERE e.name = ?", (event_name,)).fetchone()
+        conn.close()
+        return self._event_from_row(row) if row else None
+
+    def _event_from_row(self, row):
+        """ Converts an `EVENT_QUERY` row into a tournament or campaign dictionary tagged with its kind. """
+        (kind, name, game_type, date, time, max_players, event_format, entry_fee, prize,
+         host, meet_day, meet_frequency, starts_at, ends_at) = row
+        if kind == "tournament":
+            return {
+                "kind": kind, "name": name, "game_type": game_type, "type": event_format, "date": date,
+                "time": display_time(starts_at), "entry_fee": entry_fee, "prize": prize,
+                "max_players": int(max_players), "starts_at": starts_at, "ends_at": ends_at,
+            }
+        return {
+            "kind": kind, "name": name, "game_type": game_type, "host": host, "meet_day": meet_day,
+            "meet_frequency": meet_frequency, "time": time, "max_players": int(max_players),
+        }
@@ -0,0 +1,873 @@
+"""
+**Database Module**
+
+**Purpose:**
+- Provides a single place to open connections to the cafe's SQLite database.
+- Applies schema upgrades (indexes, constraints, new tables) the first time a database file is opened.
+
+**Why This File Exists:**
+- Every model and view used to call `sqlite3.connect()` with its own hard-coded path.
+- Schema changes must reach databases that were created before the change, without manual SQL editing.
+- Write operations that must be atomic (e.g. event sign-up) need a shared way to open a transaction.
+- Several kiosks share one database file, so writers must wait for and retry around each other's locks.
+
+**Implementation Decisions:**
+- Migrations are plain lists of SQL statements, applied in order and tracked with `PRAGMA user_version`.
+- Each migration runs in one transaction together with its version bump, so it is applied exactly once.
+"""
+
+import random
+import sqlite3
+import time
+from contextlib import contextmanager
+
+DB_PATH = "src/game_cafe.db"  # Relative path to the database file (the program is launched from the repo root)
+
+# Each entry upgrades the schema by one version; never edit an entry once shipped, append a new one instead.
+MIGRATIONS = [
+    # Version 1 - A user may only sign up once per event
+    [
+        """
+        DELETE FROM event_signup
+        WHERE id NOT IN (SELECT MIN(id) FROM event_signup GROUP BY event_name, gamertag)
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_event_signup_event_user ON event_signup (event_name, gamertag)",
+    ],
+    # Version 2 - Search-as-you-type gamertag lookup
+    [
+        # Case-insensitive index for prefix range scans
+        "CREATE INDEX IF NOT EXISTS idx_registered_users_gamertag_nocase ON registered_users (gamertag COLLATE NOCASE)",
+        # Trigram full-text index for substring and typo-tolerant matches, kept in sync by triggers
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS registered_users_fts USING fts5(
+            gamertag, content='registered_users', content_rowid='id', tokenize='trigram'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS registered_users_fts_insert AFTER INSERT ON registered_users BEGIN
+            INSERT INTO registered_users_fts (rowid, gamertag) VALUES (new.id, new.gamertag);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS registered_users_fts_delete AFTER DELETE ON registered_users BEGIN
+            INSERT INTO registered_users_fts (registered_users_fts, rowid, gamertag) VALUES ('delete', old.id, old.gamertag);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS registered_users_fts_update AFTER UPDATE OF gamertag ON registered_users BEGIN
+            INSERT INTO registered_users_fts (registered_users_fts, rowid, gamertag) VALUES ('delete', old.id, old.gamertag);
+            INSERT INTO registered_users_fts (rowid, gamertag) VALUES (new.id, new.gamertag);
+        END
+        """,
+        "INSERT INTO registered_users_fts (registered_users_fts) VALUES ('rebuild')",  # Index existing members
+    ],
+    # Version 3 - Full-text search across tournaments, campaigns and games
+    [
+        # Games hosted at the cafe, so event categories can be searched in SQL
+        """
+        CREATE TABLE IF NOT EXISTS games (
+            title TEXT PRIMARY KEY NOT NULL,
+            category TEXT NOT NULL,
+            image_path TEXT NOT NULL
+        )
+        """,
+        """
+        INSERT OR IGNORE INTO games (title, category, image_path) VALUES
+            ('chess', 'competitive', 'resources/images/chess.png'),
+            ('dnd', 'campaign', 'resources/images/dnd.png'),
+            ('magic', 'competitive', 'resources/images/magic.jpg'),
+            ('monopoly', 'competitive', 'resources/images/monopoly.jpg'),
+            ('pokemon', 'competitive', 'resources/images/pokemon.png'),
+            ('poker', 'competitive', 'resources/images/poker.png'),
+            ('risk', 'competitive', 'resources/images/risk.png'),
+            ('runescape', 'campaign', 'resources/images/runescape.jpg'),
+            ('warhammer', 'campaign', 'resources/images/warhammer.png'),
+            ('wow', 'campaign', 'resources/images/wow.png')
+        """,
+        # One row per searchable thing; its id is the rowid of its full-text entry
+        """
+        CREATE TABLE IF NOT EXISTS search_docs (
+            id INTEGER PRIMARY KEY,
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            game_type TEXT NOT NULL,
+            UNIQUE (kind, key)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_search_docs_game_type ON search_docs (game_type)",
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+            name, host, game, category, tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )
+        """,
+        # Index what already exists
+        """
+        INSERT INTO search_docs (kind, key, game_type)
+            SELECT 'tournament', event_name, game_type FROM active_tournaments
+            UNION ALL SELECT 'campaign', campaign_name, game_type FROM active_campaigns
+            UNION ALL SELECT 'game', title, title FROM games
+        """,
+        """
+        INSERT INTO search_index (rowid, name, host, game, category)
+            SELECT d.id, d.key, COALESCE(c.host, ''), d.game_type, COALESCE(g.category, '')
+            FROM search_docs d
+            LEFT JOIN active_campaigns c ON d.kind = 'campaign' AND c.campaign_name = d.key
+            LEFT JOIN games g ON g.title = d.game_type
+        """,
+        # Keep the index in sync with tournaments
+        """
+        CREATE TRIGGER IF NOT EXISTS search_tournament_insert AFTER INSERT ON active_tournaments BEGIN
+            INSERT INTO search_docs (kind, key, game_type) VALUES ('tournament', new.event_name, new.game_type);
+            INSERT INTO search_index (rowid, name, host, game, category) VALUES (
+                last_insert_rowid(), new.event_name, '', new.game_type,
+                COALESCE((SELECT category FROM games WHERE title = new.game_type), ''));
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_tournament_delete AFTER DELETE ON active_tournaments BEGIN
+            DELETE FROM search_index WHERE rowid = (SELECT id FROM search_docs WHERE kind = 'tournament' AND key = old.event_name);
+            DELETE FROM search_docs WHERE kind = 'tournament' AND key = old.event_name;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_tournament_update AFTER UPDATE ON active_tournaments BEGIN
+            DELETE FROM search_index WHERE rowid = (SELECT id FROM search_docs WHERE kind = 'tournament' AND key = old.event_name);
+            DELETE FROM search_docs WHERE kind = 'tournament' AND key = old.event_name;
+            INSERT INTO search_docs (kind, key, game_type) VALUES ('tournament', new.event_name, new.game_type);
+            INSERT INTO search_index (rowid, name, host, game, category) VALUES (
+                last_insert_rowid(), new.event_name, '', new.game_type,
+                COALESCE((SELECT category FROM games WHERE title = new.game_type), ''));
+        END
+        """,
+        # Keep the index in sync with campaigns
+        """
+        CREATE TRIGGER IF NOT EXISTS search_campaign_insert AFTER INSERT ON active_campaigns BEGIN
+            INSERT INTO search_docs (kind, key, game_type) VALUES ('campaign', new.campaign_name, new.game_type);
+            INSERT INTO search_index (rowid, name, host, game, category) VALUES (
+                last_insert_rowid(), new.campaign_name, new.host, new.game_type,
+                COALESCE((SELECT category FROM games WHERE title = new.game_type), ''));
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_campaign_delete AFTER DELETE ON active_campaigns BEGIN
+            DELETE FROM search_index WHERE rowid = (SELECT id FROM search_docs WHERE kind = 'campaign' AND key = old.campaign_name);
+            DELETE FROM search_docs WHERE kind = 'campaign' AND key = old.campaign_name;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_campaign_update AFTER UPDATE ON active_campaigns BEGIN
+            DELETE FROM search_index WHERE rowid = (SELECT id FROM search_docs WHERE kind = 'campaign' AND key = old.campaign_name);
+            DELETE FROM search_docs WHERE kind = 'campaign' AND key = old.campaign_name;
+            INSERT INTO search_docs (kind, key, game_type) VALUES ('campaign', new.campaign_name, new.game_type);
+            INSERT INTO search_index (rowid, name, host, game, category) VALUES (
+                last_insert_rowid(), new.campaign_name, new.host, new.game_type,
+                COALESCE((SELECT category FROM games WHERE title = new.game_type), ''));
+        END
+        """,
+        # Keep the index in sync with games; a category change also re-labels that game's events
+        """
+        CREATE TRIGGER IF NOT EXISTS search_game_insert AFTER INSERT ON games BEGIN
+            INSERT INTO search_docs (kind, key, game_type) VALUES ('game', new.title, new.title);
+            INSERT INTO search_index (rowid, name, host, game, category) VALUES (
+                last_insert_rowid(), new.title, '', new.title, new.category);
+            UPDATE search_index SET category = new.category
+                WHERE rowid IN (SELECT id FROM search_docs WHERE game_type = new.title);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_game_delete AFTER DELETE ON games BEGIN
+            DELETE FROM search_index WHERE rowid = (SELECT id FROM search_docs WHERE kind = 'game' AND key = old.title);
+            DELETE FROM search_docs WHERE kind = 'game' AND key = old.title;
+            UPDATE search_index SET category = ''
+                WHERE rowid IN (SELECT id FROM search_docs WHERE game_type = old.title);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS search_game_update AFTER UPDATE OF title, category ON games BEGIN
+            DELETE FROM search_index WHERE rowid = (SELECT id FROM search_docs WHERE kind = 'game' AND key = old.title);
+            DELETE FROM search_docs WHERE kind = 'game' AND key = old.title;
+            INSERT INTO search_docs (kind, key, game_type) VALUES ('game', new.title, new.title);
+            INSERT INTO search_index (rowid, name, host, game, category) VALUES (
+                last_insert_rowid(), new.title, '', new.title, new.category);
+            UPDATE search_index SET category = new.category
+                WHERE rowid IN (SELECT id FROM search_docs WHERE game_type = new.title AND kind != 'game');
+        END
+        """,
+    ],
+    # Version 4 - Game library details (player counts and tags) live in the database
+    [
+        "ALTER TABLE games ADD COLUMN min_players INTEGER NOT NULL DEFAULT 1",
+        "ALTER TABLE games ADD COLUMN max_players INTEGER NOT NULL DEFAULT 1",
+        """
+        CREATE TABLE IF NOT EXISTS game_tags (
+            title TEXT NOT NULL REFERENCES games(title) ON DELETE CASCADE,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (title, tag)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_game_tags_tag ON game_tags (tag)",
+        """
+        UPDATE games SET min_players = CASE title
+                WHEN 'chess' THEN 2 WHEN 'dnd' THEN 3 WHEN 'magic' THEN 2 WHEN 'monopoly' THEN 2
+                WHEN 'pokemon' THEN 2 WHEN 'poker' THEN 2 WHEN 'risk' THEN 2 WHEN 'runescape' THEN 1
+                WHEN 'warhammer' THEN 2 WHEN 'wow' THEN 1 ELSE min_players END,
+            max_players = CASE title
+                WHEN 'chess' THEN 2 WHEN 'dnd' THEN 7 WHEN 'magic' THEN 4 WHEN 'monopoly' THEN 8
+                WHEN 'pokemon' THEN 2 WHEN 'poker' THEN 10 WHEN 'risk' THEN 6 WHEN 'runescape' THEN 5
+                WHEN 'warhammer' THEN 4 WHEN 'wow' THEN 5 ELSE max_players END
+        """,
+        """
+        INSERT OR IGNORE INTO game_tags (title, tag) VALUES
+            ('chess', 'board'), ('chess', 'strategy'),
+            ('dnd', 'roleplaying'), ('dnd', 'tabletop'),
+            ('magic', 'card'), ('magic', 'trading card'),
+            ('monopoly', 'board'), ('monopoly', 'family'),
+            ('pokemon', 'card'), ('pokemon', 'trading card'),
+            ('poker', 'card'), ('poker', 'casino'),
+            ('risk', 'board'), ('risk', 'strategy'),
+            ('runescape', 'video game'), ('runescape', 'mmo'),
+            ('warhammer', 'miniatures'), ('warhammer', 'strategy'),
+            ('wow', 'video game'), ('wow', 'mmo')
+        """,
+    ],
+    # Version 5 - Recorded tournament match winners (round and match numbers are 1-based)
+    [
+        """
+        CREATE TABLE IF NOT EXISTS match_results (
+            event_name TEXT NOT NULL,
+            round_number INTEGER NOT NULL,
+            match_number INTEGER NOT NULL,
+            winner TEXT NOT NULL,
+            recorded_at TEXT NOT NULL DEFAULT (datetime('now')),
+            PRIMARY KEY (event_name, round_number, match_number)
+        )
+        """,
+    ],
+    # Version 6 - Change log read by open windows to refresh only what changed
+    [
+        """
+        CREATE TABLE IF NOT EXISTS change_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity TEXT NOT NULL,
+            key TEXT NOT NULL
+        )
+        """,
+        # Keeps only the most recent 10,000 entries; checked every 1,000 inserts
+        """
+        CREATE TRIGGER IF NOT EXISTS change_log_prune AFTER INSERT ON change_log WHEN new.id % 1000 = 0 BEGIN
+            DELETE FROM change_log WHERE id <= new.id - 10000;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_tournament_insert AFTER INSERT ON active_tournaments BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('tournament', new.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_tournament_update AFTER UPDATE ON active_tournaments BEGIN
+            INSERT INTO change_log (entity, key) SELECT 'tournament', old.event_name WHERE old.event_name <> new.event_name;
+            INSERT INTO change_log (entity, key) VALUES ('tournament', new.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_tournament_delete AFTER DELETE ON active_tournaments BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('tournament', old.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_campaign_insert AFTER INSERT ON active_campaigns BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('campaign', new.campaign_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_campaign_update AFTER UPDATE ON active_campaigns BEGIN
+            INSERT INTO change_log (entity, key) SELECT 'campaign', old.campaign_name WHERE old.campaign_name <> new.campaign_name;
+            INSERT INTO change_log (entity, key) VALUES ('campaign', new.campaign_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_campaign_delete AFTER DELETE ON active_campaigns BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('campaign', old.campaign_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_signup_insert AFTER INSERT ON event_signup BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('signup', new.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_signup_update AFTER UPDATE ON event_signup BEGIN
+            INSERT INTO change_log (entity, key) SELECT 'signup', old.event_name WHERE old.event_name <> new.event_name;
+            INSERT INTO change_log (entity, key) VALUES ('signup', new.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_signup_delete AFTER DELETE ON event_signup BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('signup', old.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_result_insert AFTER INSERT ON match_results BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('result', new.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_result_update AFTER UPDATE ON match_results BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('result', new.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS change_result_delete AFTER DELETE ON match_results BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('result', old.event_name);
+        END
+        """,
+    ],
+    # Version 7 - One `events` table for tournaments and campaigns, with per-kind detail tables
+    [
+        """
+        CREATE TABLE events (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            kind TEXT NOT NULL CHECK (kind IN ('tournament', 'campaign')),
+            game_type TEXT NOT NULL,
+            event_date TEXT,
+            time TEXT NOT NULL,
+            max_players INTEGER NOT NULL
+        )
+        """,
+        # event_date is ISO 'YYYY-MM-DD' so it sorts; NULL for campaigns, which meet on a schedule
+        "CREATE INDEX idx_events_date ON events (event_date)",
+        "CREATE INDEX idx_events_game ON events (game_type, kind)",
+        """
+        CREATE TABLE tournament_details (
+            event_id INTEGER PRIMARY KEY REFERENCES events(id),
+            format TEXT NOT NULL,
+            entry_fee TEXT NOT NULL,
+            prize TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE campaign_details (
+            event_id INTEGER PRIMARY KEY REFERENCES events(id),
+            host TEXT NOT NULL,
+            meet_day TEXT NOT NULL,
+            meet_frequency TEXT NOT NULL
+        )
+        """,
+        # Copy existing events ('MM-DD-YYYY' dates become 'YYYY-MM-DD')
+        """
+        INSERT INTO events (name, kind, game_type, event_date, time, max_players)
+            SELECT event_name, 'tournament', game_type,
+                CASE WHEN date GLOB '[0-9][0-9]-[0-9][0-9]-[0-9][0-9][0-9][0-9]'
+                    THEN substr(date, 7, 4) || '-' || substr(date, 1, 2) || '-' || substr(date, 4, 2) END,
+                time, CAST(max_players AS INTEGER)
+            FROM active_tournaments
+        """,
+        """
+        INSERT INTO tournament_details (event_id, format, entry_fee, prize)
+            SELECT e.id, t.event_type, t.entry_fee, t.prize
+            FROM active_tournaments t JOIN events e ON e.name = t.event_name
+        """,
+        """
+        INSERT INTO events (name, kind, game_type, event_date, time, max_players)
+            SELECT campaign_name, 'campaign', game_type, NULL, time, CAST(max_players AS INTEGER)
+            FROM active_campaigns
+        """,
+        """
+        INSERT INTO campaign_details (event_id, host, meet_day, meet_frequency)
+            SELECT e.id, c.host, c.meet_day, c.meet_frequency
+            FROM active_campaigns c JOIN events e ON e.name = c.campaign_name
+        """,
+        # Dropping the old tables also drops their search and change-log triggers
+        "DROP TABLE active_tournaments",
+        "DROP TABLE active_campaigns",
+        # Details go with their event
+        """
+        CREATE TRIGGER events_delete_details AFTER DELETE ON events BEGIN
+            DELETE FROM tournament_details WHERE event_id = old.id;
+            DELETE FROM campaign_details WHERE event_id = old.id;
+        END
+        """,
+        # Keep the search index in sync (existing search_docs rows already match by kind and name)
+        """
+        CREATE TRIGGER search_event_insert AFTER INSERT ON events BEGIN
+            INSERT INTO search_docs (kind, key, game_type) VALUES (new.kind, new.name, new.game_type);
+            INSERT INTO search_index (rowid, name, host, game, category) VALUES (
+                last_insert_rowid(), new.name, '', new.game_type,
+                COALESCE((SELECT category FROM games WHERE title = new.game_type), ''));
+        END
+        """,
+        """
+        CREATE TRIGGER search_event_delete AFTER DELETE ON events BEGIN
+            DELETE FROM search_index WHERE rowid = (SELECT id FROM search_docs WHERE kind = old.kind AND key = old.name);
+            DELETE FROM search_docs WHERE kind = old.kind AND key = old.name;
+        END
+        """,
+        """
+        CREATE TRIGGER search_event_update AFTER UPDATE OF name, kind, game_type ON events BEGIN
+            DELETE FROM search_index WHERE rowid = (SELECT id FROM search_docs WHERE kind = old.kind AND key = old.name);
+            DELETE FROM search_docs WHERE kind = old.kind AND key = old.name;
+            INSERT INTO search_docs (kind, key, game_type) VALUES (new.kind, new.name, new.game_type);
+            INSERT INTO search_index (rowid, name, host, game, category) VALUES (
+                last_insert_rowid(), new.name,
+                COALESCE((SELECT host FROM campaign_details WHERE event_id = new.id), ''), new.game_type,
+                COALESCE((SELECT category FROM games WHERE title = new.game_type), ''));
+        END
+        """,
+        """
+        CREATE TRIGGER search_campaign_host_insert AFTER INSERT ON campaign_details BEGIN
+            UPDATE search_index SET host = new.host WHERE rowid = (
+                SELECT d.id FROM search_docs d JOIN events e ON d.kind = e.kind AND d.key = e.name WHERE e.id = new.event_id);
+        END
+        """,
+        """
+        CREATE TRIGGER search_campaign_host_update AFTER UPDATE OF host ON campaign_details BEGIN
+            UPDATE search_index SET host = new.host WHERE rowid = (
+                SELECT d.id FROM search_docs d JOIN events e ON d.kind = e.kind AND d.key = e.name WHERE e.id = new.event_id);
+        END
+        """,
+        # Change log for open windows; the entity is the event kind, as before
+        """
+        CREATE TRIGGER change_event_insert AFTER INSERT ON events BEGIN
+            INSERT INTO change_log (entity, key) VALUES (new.kind, new.name);
+        END
+        """,
+        """
+        CREATE TRIGGER change_event_update AFTER UPDATE ON events BEGIN
+            INSERT INTO change_log (entity, key) SELECT old.kind, old.name WHERE old.name <> new.name OR old.kind <> new.kind;
+            INSERT INTO change_log (entity, key) VALUES (new.kind, new.name);
+        END
+        """,
+        """
+        CREATE TRIGGER change_event_delete AFTER DELETE ON events BEGIN
+            INSERT INTO change_log (entity, key) VALUES (old.kind, old.name);
+        END
+        """,
+        """
+        CREATE TRIGGER change_tournament_details AFTER UPDATE ON tournament_details BEGIN
+            INSERT INTO change_log (entity, key) SELECT 'tournament', name FROM events WHERE id = new.event_id;
+        END
+        """,
+        """
+        CREATE TRIGGER change_campaign_details AFTER UPDATE ON campaign_details BEGIN
+            INSERT INTO change_log (entity, key) SELECT 'campaign', name FROM events WHERE id = new.event_id;
+        END
+        """,
+    ],
+    # Version 8 - Tournament start and end as sortable timestamps instead of a date plus free-form time
+    [
+        # 'YYYY-MM-DD HH:MM' in cafe local time; NULL for campaigns, which meet on a schedule
+        "ALTER TABLE events ADD COLUMN starts_at TEXT",
+        "ALTER TABLE events ADD COLUMN ends_at TEXT",
+        # '9:00 PM' -> '21:00'; a time that cannot be read starts at midnight so the event still sorts by day
+        """
+        UPDATE events SET starts_at = event_date || ' ' || CASE
+            WHEN trim(time) GLOB '[0-9]:[0-9][0-9] [AaPp][Mm]' OR trim(time) GLOB '[0-9][0-9]:[0-9][0-9] [AaPp][Mm]'
+            THEN printf('%02d:%s',
+                CAST(substr(trim(time), 1, instr(trim(time), ':') - 1) AS INTEGER) % 12
+                    + CASE WHEN upper(trim(time)) LIKE '%PM' THEN 12 ELSE 0 END,
+                substr(trim(time), instr(trim(time), ':') + 1, 2))
+            ELSE '00:00' END
+        WHERE event_date IS NOT NULL
+        """,
+        # Tournaments run for an evening (see current_events.DEFAULT_EVENT_HOURS)
+        "UPDATE events SET ends_at = strftime('%Y-%m-%d %H:%M', starts_at, '+4 hours') WHERE starts_at IS NOT NULL",
+        "CREATE INDEX idx_events_starts ON events (starts_at)",
+        "DROP INDEX idx_events_date",
+        "ALTER TABLE events DROP COLUMN event_date",
+    ],
+    # Version 9 - Campaign start date (anchors bi-weekly schedules) and assigned table
+    [
+        "ALTER TABLE campaign_details ADD COLUMN starts_on TEXT",  # ISO date of the first session, or NULL
+        "ALTER TABLE campaign_details ADD COLUMN table_number INTEGER",  # NULL until a table is assigned
+    ],
+    # Version 10 - Waitlist for full events, promoted automatically when a seat frees up
+    [
+        # gamertag holds the registered_users id, as in event_signup; id order is queue order
+        """
+        CREATE TABLE waitlist (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_name TEXT NOT NULL,
+            gamertag INTEGER NOT NULL,
+            joined_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (event_name, gamertag)
+        )
+        """,
+        # Queue order per event: the head is one index seek, positions come from `waitlist_rank` (version 19)
+        "CREATE INDEX idx_waitlist_event_queue ON waitlist (event_name, id)",
+        # A sign-up removed (withdrawal, no-show) hands its seat to the head of the queue
+        """
+        CREATE TRIGGER waitlist_promote_on_leave AFTER DELETE ON event_signup BEGIN
+            INSERT INTO event_signup (gamertag, event_name)
+                SELECT w.gamertag, w.event_name FROM waitlist w
+                WHERE w.event_name = old.event_name
+                    AND (SELECT COUNT(*) FROM event_signup WHERE event_name = old.event_name)
+                        < (SELECT max_players FROM events WHERE name = old.event_name)
+                ORDER BY w.id LIMIT 1;
+            DELETE FROM waitlist WHERE event_name = old.event_name
+                AND gamertag IN (SELECT gamertag FROM event_signup WHERE event_name = old.event_name);
+        END
+        """,
+        # Raising an event's capacity promotes as many players as there are new seats
+        """
+        CREATE TRIGGER waitlist_promote_on_capacity AFTER UPDATE OF max_players ON events
+        WHEN new.max_players > old.max_players BEGIN
+            INSERT INTO event_signup (gamertag, event_name)
+                SELECT w.gamertag, w.event_name FROM waitlist w
+                WHERE w.event_name = new.name
+                ORDER BY w.id
+                LIMIT max(0, new.max_players - (SELECT COUNT(*) FROM event_signup WHERE event_name = new.name));
+            DELETE FROM waitlist WHERE event_name = new.name
+                AND gamertag IN (SELECT gamertag FROM event_signup WHERE event_name = new.name);
+        END
+        """,
+        "CREATE TRIGGER waitlist_event_delete AFTER DELETE ON events BEGIN DELETE FROM waitlist WHERE event_name = old.name; END",
+        # Open windows refresh waitlists like sign-ups
+        """
+        CREATE TRIGGER change_waitlist_insert AFTER INSERT ON waitlist BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('signup', new.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER change_waitlist_delete AFTER DELETE ON waitlist BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('signup', old.event_name);
+        END
+        """,
+    ],
+    # Version 11 - Match winners stored by registered_users id instead of gamertag
+    [
+        """
+        CREATE TABLE match_results_new (
+            event_name TEXT NOT NULL,
+            round_number INTEGER NOT NULL,
+            match_number INTEGER NOT NULL,
+            winner_id INTEGER NOT NULL,
+            recorded_at TEXT NOT NULL DEFAULT (datetime('now')),
+            PRIMARY KEY (event_name, round_number, match_number)
+        )
+        """,
+        # Winners whose gamertag no longer matches a registered user could not be replayed anyway
+        """
+        INSERT INTO match_results_new (event_name, round_number, match_number, winner_id, recorded_at)
+            SELECT r.event_name, r.round_number, r.match_number, u.id, r.recorded_at
+            FROM match_results r JOIN registered_users u ON u.gamertag = r.winner
+        """,
+        "DROP TABLE match_results",
+        "ALTER TABLE match_results_new RENAME TO match_results",
+        # The version 6 change triggers went with the old table
+        """
+        CREATE TRIGGER change_result_insert AFTER INSERT ON match_results BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('result', new.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER change_result_update AFTER UPDATE ON match_results BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('result', new.event_name);
+        END
+        """,
+        """
+        CREATE TRIGGER change_result_delete AFTER DELETE ON match_results BEGIN
+            INSERT INTO change_log (entity, key) VALUES ('result', old.event_name);
+        END
+        """,
+    ],
+    # Version 12 - Manual tournament seeds set by staff (NULL = seeded by rating, then sign-up order)
+    [
+        "ALTER TABLE event_signup ADD COLUMN seed INTEGER",
+    ],
+    # Version 13 - Elo ratings (see model/ratings.py); losers are stored so results can be rated
+    [
+        "ALTER TABLE match_results ADD COLUMN loser_id INTEGER",
+        """
+        CREATE TABLE player_ratings (
+            player_id INTEGER PRIMARY KEY,
+            rating REAL NOT NULL,
+            games INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """,
+        "CREATE INDEX idx_player_ratings_rating ON player_ratings (rating)",
+    ],
+    # Version 14 - Casual matchmaking (see model/matchmaking.py)
+    [
+        """
+        CREATE TABLE matchmaking_queue (
+            player_id INTEGER PRIMARY KEY,
+            game_title TEXT NOT NULL,
+            joined_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """,
+        """
+        CREATE TABLE casual_matches (
+            id INTEGER PRIMARY KEY,
+            game_title TEXT NOT NULL,
+            player1_id INTEGER NOT NULL,
+            player2_id INTEGER NOT NULL,
+            matched_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """,
+        "CREATE INDEX idx_casual_matches_player1 ON casual_matches (player1_id)",
+        "CREATE INDEX idx_casual_matches_player2 ON casual_matches (player2_id)",
+    ],
+    # Version 15 - The cafe floor plan (see model/table_allocator.py); staff edit these rows
+    [
+        """
+        CREATE TABLE cafe_tables (
+            number INTEGER PRIMARY KEY,
+            kind TEXT NOT NULL DEFAULT 'table' CHECK (kind IN ('table', 'station')),
+            seats INTEGER NOT NULL CHECK (seats > 0)
+        )
+        """,
+        """
+        INSERT INTO cafe_tables (number, kind, seats) VALUES
+            (1, 'table', 4), (2, 'table', 4), (3, 'table', 4), (4, 'table', 4),
+            (5, 'table', 4), (6, 'table', 4), (7, 'table', 10), (8, 'table', 10),
+            (9, 'station', 2), (10, 'station', 2), (11, 'station', 2), (12, 'station', 2)
+        """,
+    ],
+    # Version 16 - Average tournament match length per game (see model/match_scheduler.py)
+    [
+        "ALTER TABLE games ADD COLUMN match_minutes INTEGER CHECK (match_minutes > 0)",
+        """
+        UPDATE games SET match_minutes = CASE title
+            WHEN 'chess' THEN 40 WHEN 'magic' THEN 50 WHEN 'monopoly' THEN 90 WHEN 'pokemon' THEN 30
+            WHEN 'poker' THEN 60 WHEN 'risk' THEN 120 ELSE NULL END
+        """,
+    ],
+    # Version 17 - Tournament-day check-in (see model/checkin.py); player_id is a registered_users id
+    [
+        """
+        CREATE TABLE checkins (
+            event_name TEXT NOT NULL,
+            player_id INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'present' CHECK (status IN ('present', 'no_show')),
+            checked_at TEXT NOT NULL DEFAULT (datetime('now')),
+            PRIMARY KEY (event_name, player_id)
+        ) WITHOUT ROWID
+        """,
+        # Set when staff close check-in; the field is final from then on
+        "ALTER TABLE tournament_details ADD COLUMN checkin_closed_at TEXT",
+        "CREATE TRIGGER checkins_event_delete AFTER DELETE ON events BEGIN DELETE FROM checkins WHERE event_name = old.name; END",
+    ],
+    # Version 18 - Waitlist promotion removes only the promoted rows instead of checking the whole roster
+    [
+        "DROP TRIGGER waitlist_promote_on_leave",
+        """
+        CREATE TRIGGER waitlist_promote_on_leave AFTER DELETE ON event_signup
+        WHEN (SELECT COUNT(*) FROM event_signup WHERE event_name = old.event_name)
+            < (SELECT max_players FROM events WHERE name = old.event_name) BEGIN
+            INSERT INTO event_signup (gamertag, event_name)
+                SELECT gamertag, event_name FROM waitlist WHERE event_name = old.event_name ORDER BY id LIMIT 1;
+            DELETE FROM waitlist WHERE id = (SELECT id FROM waitlist WHERE event_name = old.event_name ORDER BY id LIMIT 1);
+        END
+        """,
+        "DROP TRIGGER waitlist_promote_on_capacity",
+        # The promoted players are the head of the queue, so the delete stops after them
+        """
+        CREATE TRIGGER waitlist_promote_on_capacity AFTER UPDATE OF max_players ON events
+        WHEN new.max_players > old.max_players BEGIN
+            INSERT INTO event_signup (gamertag, event_name)
+                SELECT w.gamertag, w.event_name FROM waitlist w
+                WHERE w.event_name = new.name
+                ORDER BY w.id
+                LIMIT max(0, new.max_players - (SELECT COUNT(*) FROM event_signup WHERE event_name = new.name));
+            DELETE FROM waitlist WHERE id IN (
+                SELECT w.id FROM waitlist w
+                WHERE w.event_name = new.name
+                    AND EXISTS (SELECT 1 FROM event_signup s WHERE s.event_name = w.event_name AND s.gamertag = w.gamertag)
+                ORDER BY w.id LIMIT new.max_players - old.max_players
+            );
+        END
+        """,
+    ],
+    # Version 19 - Waitlist ranks (see EventSignUps.waitlist_position): a Fenwick tree per event over waitlist ids
+    [
+        # Bit numbers 0-31, to list a waitlist id's tree nodes without a loop (triggers cannot use WITH)
+        "CREATE TABLE waitlist_bits (bit INTEGER PRIMARY KEY)",
+        """
+        INSERT INTO waitlist_bits (bit) VALUES
+            (0), (1), (2), (3), (4), (5), (6), (7), (8), (9), (10), (11), (12), (13), (14), (15),
+            (16), (17), (18), (19), (20), (21), (22), (23), (24), (25), (26), (27), (28), (29), (30), (31)
+        """,
+        # Node n counts the event's waiting entries with ids in (n - lowest set bit of n, n]
+        """
+        CREATE TABLE waitlist_rank (
+            event_name TEXT NOT NULL,
+            node INTEGER NOT NULL,
+            total INTEGER NOT NULL,
+            PRIMARY KEY (event_name, node)
+        ) WITHOUT ROWID
+        """,
+        """
+        INSERT INTO waitlist_rank (event_name, node, total)
+            SELECT event_name, node, COUNT(*) FROM (
+                SELECT DISTINCT w.id, w.event_name, ((w.id - 1) | ((1 << b.bit) - 1)) + 1 AS node
+                FROM waitlist w, waitlist_bits b
+            )
+            GROUP BY event_name, node
+        """,
+        # Joining or leaving the queue updates the id's covering nodes: at most 32 index seeks
+        """
+        CREATE TRIGGER waitlist_rank_insert AFTER INSERT ON waitlist BEGIN
+            INSERT INTO waitlist_rank (event_name, node, total)
+                SELECT DISTINCT new.event_name, ((new.id - 1) | ((1 << bit) - 1)) + 1, 1 FROM waitlist_bits WHERE true
+                ON CONFLICT (event_name, node) DO UPDATE SET total = total + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER waitlist_rank_delete AFTER DELETE ON waitlist BEGIN
+            UPDATE waitlist_rank SET total = total - 1
+                WHERE event_name = old.event_name
+                    AND node IN (SELECT ((old.id - 1) | ((1 << bit) - 1)) + 1 FROM waitlist_bits);
+            DELETE FROM waitlist_rank
+                WHERE event_name = old.event_name AND total = 0
+                    AND node IN (SELECT ((old.id - 1) | ((1 << bit) - 1)) + 1 FROM waitlist_bits);
+        END
+        """,
+    ],
+]
+
+# Busy handling for several kiosks sharing one database file
+BUSY_TIMEOUT = 5.0  # Seconds SQLite itself waits on a locked database before giving up
+WRITE_ATTEMPTS = 5  # Total tries for one write before the error reaches the caller
+RETRY_BASE_DELAY = 0.05  # Seconds slept after the first failed attempt, doubled after each retry
+RETRY_MAX_DELAY = 1.0  # Upper bound on a single retry sleep
+
+_migrated_paths = set()  # Database files already brought up to date by this process
+
+
+def connect(db_path: str = DB_PATH, busy_timeout: float = BUSY_TIMEOUT) -> sqlite3.Connection:
+    """
+    **Opens a connection to the cafe database with the schema up to date.**
+
+    **Parameters:**
+    - `db_path` (str): Path to the SQLite database file.
+    - `busy_timeout` (float): Seconds to wait for another kiosk's lock before raising "database is locked".
+
+    **Returns:**
+    - `sqlite3.Connection`: An open connection; the caller is responsible for closing it.
+    """
+    conn = sqlite3.connect(db_path, timeout=busy_timeout)  # `timeout` installs SQLite's busy handler
+    if db_path not in _migrated_paths:  # Only check the schema version once per file per process
+        ensure_schema(conn)
+        _migrated_paths.add(db_path)
+    return conn
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    **Applies any migrations the database has not seen yet.**
+
+    **Step-by-Step Explanation:**
+    1️⃣ **Step 1 - Read the Current Version**
+       - `PRAGMA user_version` stores how many migrations have been applied.
+       - If it is current, return without taking any lock.
+
+    2️⃣ **Step 2 - Apply Pending Migrations**
+       - Each pending migration runs inside its own immediate transaction.
+       - The version is re-read under the lock, so two kiosks starting together never apply a step twice.
+       - The version is bumped in the same transaction, so a failure leaves the file unchanged.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= len(MIGRATIONS):  # Step 1: Fast path
+        return
+
+    while True:  # Step 2: Apply one migration per transaction until current
+        with immediate_transaction(conn):
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= len(MIGRATIONS):
+                return
+            for statement in MIGRATIONS[version]:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version + 1}")  # PRAGMA does not accept bound parameters
+
+
+@contextmanager
+def immediate_transaction(conn: sqlite3.Connection):
+    """
+    **Runs the enclosed statements as one `BEGIN IMMEDIATE` transaction.**
+
+    **Why This Function Exists:**
+    - `BEGIN IMMEDIATE` takes the write lock up front, so a read-then-write sequence
+      (count seats, then insert) cannot interleave with another kiosk doing the same.
+    - Commits on success and rolls back if the block raises.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+
+
+def is_busy_error(error: sqlite3.OperationalError) -> bool:
+    """ Returns True if the error means another connection holds the lock. """
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+class WriteCoordinator:
+    """
+    **WriteCoordinator Class**
+
+    **Class Purpose:**
+    - Runs short write transactions against the shared database, retrying when another kiosk holds the lock.
+
+    **Why This Class Exists:**
+    - Without a busy timeout, a concurrent write raised "database is locked" straight into the GUI.
+    - SQLite's busy handler covers most waits, but it can still give up under heavy contention;
+      those failures are retried here with bounded exponential backoff instead of being shown to the user.
+
+    **Implementation Decisions:**
+    - Each attempt opens its own connection and runs the work in one `BEGIN IMMEDIATE` transaction,
+      so a retried attempt never sees half of a previous one.
+    - Work functions must only touch the database: they may run more than once.
+    - Backoff sleeps are jittered so kiosks that collided do not retry in lockstep.
+    """
+
+    def __init__(self, db_path=DB_PATH, busy_timeout=BUSY_TIMEOUT, attempts=WRITE_ATTEMPTS,
+                 base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY):
+        """ Initializes the coordinator with its database path and retry policy. """
+        self.db_path = db_path  # Database file to write to
+        self.busy_timeout = busy_timeout  # Seconds SQLite waits on a lock per attempt
+        self.attempts = attempts  # Maximum number of attempts per write
+        self.base_delay = base_delay  # First backoff sleep in seconds
+        self.max_delay = max_delay  # Longest backoff sleep in seconds
+
+    def run(self, work):
+        """
+        **Runs `work(conn)` inside a write transaction, retrying on lock contention.**
+
+        **Parameters:**
+        - `work` (callable): Receives an open connection inside the transaction; its return value is passed through.
+
+        **Returns:**
+        - Whatever `work` returns from the attempt that committed.
+
+        **Step-by-Step Explanation:**
+        1️⃣ **Step 1 - Attempt the Write**
+           - Opens a connection and runs `work` in an immediate transaction.
+
+        2️⃣ **Step 2 - Retry on Busy**
+           - On "database is locked", sleeps `base_delay * 2^attempt` (capped, with jitter) and tries again.
+           - Any other error, or the final busy error, is raised to the caller.
+        """
+        for attempt in range(self.attempts):
+            conn = connect(self.db_path, self.busy_timeout)
+            try:
+                with immediate_transaction(conn):  # Step 1: One short transaction per attempt
+                    return work(conn)
+            except sqlite3.OperationalError as error:
+                if not is_busy_error(error) or attempt == self.attempts - 1:
+                    raise
+            finally:
+                conn.close()
+
+            delay = min(self.max_delay, self.base_delay * (2 ** attempt))  # Step 2: Exponential backoff
+            time.sleep(delay * random.uniform(0.5, 1.0))  # Jitter spreads out retries from colliding kiosks
+
+
+def write(work, db_path: str = DB_PATH):
+    """ Runs `work(conn)` as a retried write transaction using the default retry policy. """
+    return WriteCoordinator(db_path).run(work)
@@ -0,0 +1,74 @@
+import atexit
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from model.instrumentation import record
+
+logger = logging.getLogger(__name__)
+
+READ_WORKERS = 2  # Reads run side by side (SQLite allows many readers)
+SLOW_WAIT_MS = 250  # Requests that queued longer than this are logged
+
+
+class DatabaseExecutor:
+    """
+    **DatabaseExecutor Class**
+
+    **Class Purpose:**
+    - Runs database work on dedicated worker threads and hands back a `Future` for each request.
+
+    **Why This Class Exists:**
+    - Every query from the windows ran on the Qt main thread, so a slow disk or another kiosk
+      holding the write lock froze the whole screen until SQLite gave up waiting.
+
+    **Implementation Decisions:**
+    - Writes go through a single thread, in the order they were submitted; SQLite only ever
+      allows one writer, so more write threads would just wait on each other's locks.
+    - Reads have their own small pool, so a write stuck on a busy database never delays a read.
+    - Submitted work is ordinary model code (`CurrentEvents`, `EventSignUps`, ...). Those methods
+      open their connection where they run, so connections are created and used only on the
+      worker threads, never on the GUI thread.
+    - Qt-free: returns plain `concurrent.futures.Future` objects. `view/db_worker.py` turns them
+      into callbacks on the GUI thread.
+    - Time spent waiting in the queue is recorded as `db.read.wait` / `db.write.wait` in the
+      diagnostics window.
+    """
+
+    def __init__(self, read_workers: int = READ_WORKERS):
+        """ Starts the read pool and the single write thread. """
+        self.reads = ThreadPoolExecutor(max_workers=read_workers, thread_name_prefix="db-read")
+        self.writes = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-write")
+
+    def read(self, fn, *args, **kwargs) -> Future:
+        """ Queues `fn(*args, **kwargs)` on a read thread. `fn` must not write. """
+        return self.reads.submit(self._run, "read", time.perf_counter(), fn, args, kwargs)
+
+    def write(self, fn, *args, **kwargs) -> Future:
+        """ Queues `fn(*args, **kwargs)` on the write thread, after every write submitted before it. """
+        return self.writes.submit(self._run, "write", time.perf_counter(), fn, args, kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """ Finishes queued work (if `wait`) and stops the worker threads. """
+        self.reads.shutdown(wait=wait)
+        self.writes.shutdown(wait=wait)
+
+    @staticmethod
+    def _run(kind, queued_at, fn, args, kwargs):
+        """ Runs one request on a worker thread, recording how long it waited for the thread. """
+        waited_ms = (time.perf_counter() - queued_at) * 1000
+        record(f"db.{kind}.wait", waited_ms)
+        if waited_ms > SLOW_WAIT_MS:
+            logger.warning("database request queued kind=%s waited_ms=%.0f fn=%s", kind, waited_ms, getattr(fn, "__qualname__", fn))
+        return fn(*args, **kwargs)
+
+
+_executor = None  # Shared DatabaseExecutor, created on first use
+
+
+def db_executor() -> DatabaseExecutor:
+    """ Returns the application-wide executor, starting its threads on first use. """
+    global _executor
+    if _executor is None:
+        _executor = DatabaseExecutor()
+        atexit.register(_executor.shutdown)  # Let queued writes finish before the process exits
+    return _executor
@@ -0,0 +1,71 @@
+import re
+from model import database
+
+SEARCH_LIMIT = 25  # Results shown under the search box
+
+# bm25 column weights for (name, host, game, category): a hit in the name matters most
+COLUMN_WEIGHTS = (10.0, 3.0, 5.0, 1.0)
+
+
+class EventSearch:
+    """
+    **EventSearch Class**
+
+    **Class Purpose:**
+    - Searches tournaments, campaigns and games by name, host, game title and category.
+
+    **Why This Class Exists:**
+    - `AllEventsDisplay` lists everything and `EventsDisplay` only filters by exact game, so staff
+      scrolled through every event frame to find one.
+
+    **Implementation Decisions:**
+    - Backed by the `search_index` FTS5 table, which database triggers keep in sync whenever a
+      tournament, campaign or game is added, changed or removed; nothing here rebuilds it.
+    - Every typed word is treated as a prefix and all words must match, like a search engine.
+    - Results are ranked with weighted `bm25()` so name matches outrank category matches.
+    """
+
+    def __init__(self, db_path=database.DB_PATH):
+        """ Initializes the EventSearch class and defines the database path. """
+        self.db_path = db_path  # Assigns the database path to a variable for easier connections.
+
+    def search(self, text: str, limit: int = SEARCH_LIMIT) -> list[dict]:
+        """
+        **Returns the best-matching events and games for the typed text.**
+
+        **Parameters:**
+        - `text` (str): Free text typed by the user, e.g. `"fri mag"`.
+        - `limit` (int): Maximum number of results.
+
+        **Returns:**
+        - `list[dict]`: Best match first, each with:
+            - `"kind"` (str): `"tournament"`, `"campaign"` or `"game"`.
+            - `"name"` (str): Event name or game title.
+            - `"game_type"` (str): The game the result belongs to.
+        """
+        query = self.build_query(text)
+        if not query:
+            return []
+
+        conn = database.connect(self.db_path)
+        rows = conn.execute(f"""
+            SELECT d.kind, d.key, d.game_type
+            FROM search_index
+            JOIN search_docs d ON d.id = search_index.rowid
+            WHERE search_index MATCH ?
+            ORDER BY bm25(search_index, {", ".join(map(str, COLUMN_WEIGHTS))})
+            LIMIT ?
+        """, (query, limit)).fetchall()
+        conn.close()
+
+        return [{"kind": kind, "name": name, "game_type": game_type} for kind, name, game_type in rows]
+
+    def build_query(self, text: str) -> str:
+        """
+        **Turns free text into an FTS5 query where every word is a required prefix.**
+
+        - Words are quoted, so characters FTS5 treats as syntax (`-`, `:`, `*`, quotes) are just text.
+        - `"fri mag"` becomes `"fri"* "mag"*`, which matches "MTG Friday Night Magic".
+        """
+        words = re.findall(r"\w+", text)
+        return " ".join(f'"{word}"*' for word in words)
@@ -0,0 +1,226 @@
+from enum import Enum
+import sqlite3
+from model import database
+
+
+class SignUpResult(Enum):
+    """
+    **Outcome of an event sign-up attempt.**
+
+    **Why This Class Exists:**
+    - The sign-up window only needs to know *what happened*, not how it was checked.
+    - Each member carries the message shown to the user, so the GUI can render it directly.
+    """
+
+    OK = "ok"
+    FULL = "full"
+    WAITLISTED = "waitlisted"
+    DUPLICATE = "duplicate"
+    NOT_FOUND = "not_found"
+
+    @property
+    def message(self) -> str:
+        """ Returns the user-facing text for this result. """
+        return {
+            SignUpResult.OK: "Successfully signed up!",
+            SignUpResult.FULL: "This event is already full!",
+            SignUpResult.WAITLISTED: "This event is full, so you have been added to the waitlist.",
+            SignUpResult.DUPLICATE: "You are already signed up for this event!",
+            SignUpResult.NOT_FOUND: "Event not found!",
+        }[self]
+
+
+class EventSignUps:
+    """
+    **EventSignUps Class**
+
+    **Class Purpose:**
+    - Looks up registered users and adds them to events in the `event_signup` table, or to the
+      event's `waitlist` when it is full.
+
+    **Why This Class Exists:**
+    - Sign-up used to run four separate statements with no transaction, so two kiosks
+      signing up at the same moment could both see a free seat and overfill the event.
+    - Keeps database logic out of the `EventSignUp` window, which only renders the result.
+    """
+
+    def __init__(self, db_path=database.DB_PATH):
+        """ Initializes the EventSignUps class and defines the database path. """
+        self.db_path = db_path  # Assigns the database path to a variable for easier connections.
+
+    def get_user_id(self, gamertag: str):
+        """
+        **Retrieves a user's id from `registered_users` based on their gamertag.**
+
+        **Returns:**
+        - `int | None`: The user id, or `None` if the gamertag is not registered.
+        """
+        conn = database.connect(self.db_path)
+        row = conn.execute("SELECT id FROM registered_users WHERE gamertag = ?", (gamertag,)).fetchone()
+        conn.close()
+        return row[0] if row else None  # Returns user_id if found
+
+    def add_user_to_event(self, user_id: int, event_name: str, waitlist: bool = False) -> SignUpResult:
+        """
+        **Adds a user to an event (or its waitlist) as a single atomic operation.**
+
+        **Why This Function Exists:**
+        - The capacity check and the insert must happen under the same write lock,
+          otherwise concurrent sign-ups can overfill an event.
+
+        **Implementation Decisions:**
+        - Runs through `database.write()`: `BEGIN IMMEDIATE` takes the write lock before reading,
+          so no other writer can insert between the seat count and our insert, and a busy
+          database is retried instead of raising into the GUI.
+        - One query returns the capacity, seat count and duplicate flags together.
+        - Capacity comes from the shared `events` table, so campaigns are checked exactly like
+          tournaments (they used to be reported as not found).
+        - With `waitlist=True` a full event queues the player instead of turning them away;
+          database triggers promote the head of the queue whenever a seat frees up.
+        - The unique `(event_name, gamertag)` index is a safety net: a duplicate that slips
+          past the check is still reported as `DUPLICATE` instead of crashing.
+
+        **Parameters:**
+        - `user_id` (int): The `registered_users.id` of the player.
+        - `event_name` (str): The tournament or campaign to sign up for.
+        - `waitlist` (bool): Join the waitlist if the event is full.
+
+        **Returns:**
+        - `SignUpResult`: `OK`, `FULL`, `WAITLISTED`, `DUPLICATE` or `NOT_FOUND`.
+          A player already on the waitlist gets `WAITLISTED` again.
+
+        **Step-by-Step Explanation:**
+        1️⃣ **Step 1 - Lock and Read Event State**
+           - Fetches max players, current sign-ups and whether the user is already signed up or waiting.
+
+        2️⃣ **Step 2 - Validate**
+           - Returns `NOT_FOUND`, `DUPLICATE` or `FULL` without writing anything.
+
+        3️⃣ **Step 3 - Insert Sign-Up or Waitlist Entry**
+           - Inserts the row; the transaction commits when the block exits.
+        """
+        def sign_up(conn):
+            # Step 1: Read everything needed for the decision in one round trip
+            row = conn.execute("""
+                SELECT e.max_players,
+                       (SELECT COUNT(*) FROM event_signup s WHERE s.event_name = e.name),
+                       EXISTS (SELECT 1 FROM event_signup s
+                               WHERE s.event_name = e.name AND s.gamertag = ?),
+                       EXISTS (SELECT 1 FROM waitlist w
+                               WHERE w.event_name = e.name AND w.gamertag = ?)
+                FROM events e
+                WHERE e.name = ?
+            """, (user_id, user_id, event_name)).fetchone()
+
+            # Step 2: Validate event, duplicates and capacity
+            if row is None:
+                return SignUpResult.NOT_FOUND
+            max_players, current_signups, already_signed_up, already_waiting = row
+            if already_signed_up:
+                return SignUpResult.DUPLICATE
+            if already_waiting:
+                return SignUpResult.WAITLISTED
+            if current_signups >= max_players:
+                if not waitlist:
+                    return SignUpResult.FULL
+                # Step 3a: Queue the player; the promotion triggers take it from here
+                conn.execute("INSERT INTO waitlist (gamertag, event_name) VALUES (?, ?)", (user_id, event_name))
+                return SignUpResult.WAITLISTED
+
+            # Step 3: Insert the sign-up
+            conn.execute("INSERT INTO event_signup (gamertag, event_name) VALUES (?, ?)", (user_id, event_name))
+            return SignUpResult.OK
+
+        try:
+            return database.write(sign_up, self.db_path)  # Retries if another kiosk holds the write lock
+        except sqlite3.IntegrityError:  # Unique index caught a duplicate the check missed
+            return SignUpResult.DUPLICATE
+
+    def remove_user_from_event(self, user_id: int, event_name: str) -> bool:
+        """
+        **Withdraws a user from an event or its waitlist.**
+
+        - Removing a sign-up fires the `waitlist_promote_on_leave` trigger, which moves the head
+          of the waitlist into the freed seat inside the same transaction.
+
+        **Returns:**
+        - `bool`: `True` if the user was signed up or waiting, otherwise `False`.
+        """
+        def withdraw(conn):
+            removed = conn.execute(
+                "DELETE FROM event_signup WHERE event_name = ? AND gamertag = ?", (event_name, user_id)
+            ).rowcount
+            removed += conn.execute(
+                "DELETE FROM waitlist WHERE event_name = ? AND gamertag = ?", (event_name, user_id)
+            ).rowcount
+            return removed > 0
+
+        return database.write(withdraw, self.db_path)
+
+    def set_seed(self, user_id: int, event_name: str, seed=None) -> bool:
+        """
+        **Sets (or with `None`, clears) a signed-up player's manual tournament seed (1 = top seed).**
+
+        **Returns:**
+        - `bool`: `True` if the user is signed up for the event, otherwise `False`.
+        """
+        def save(conn):
+            return conn.execute(
+                "UPDATE event_signup SET seed = ? WHERE event_name = ? AND gamertag = ?", (seed, event_name, user_id)
+            ).rowcount > 0
+
+        return database.write(save, self.db_path)
+
+    def waitlist_position(self, user_id: int, event_name: str):
+        """
+        **Returns the user's place in an event's waitlist (1 = next to be promoted).**
+
+        - Sums the event's `waitlist_rank` Fenwick tree nodes that cover the user's waitlist id,
+          one per set bit of the id, so it costs O(log n) index seeks however long the queue is.
+          Triggers keep the tree in step with every join, promotion and withdrawal.
+
+        **Returns:**
+        - `int | None`: The position, or `None` if the user is not waiting for this event.
+        """
+        conn = database.connect(self.db_path)
+        position = conn.execute("""
+            SELECT SUM(r.total)
+            FROM waitlist w
+            JOIN waitlist_bits b ON (w.id >> b.bit) & 1
+            JOIN waitlist_rank r ON r.event_name = w.event_name AND r.node = (w.id >> b.bit) << b.bit
+            WHERE w.event_name = ? AND w.gamertag = ?
+        """, (event_name, user_id)).fetchone()[0]
+        conn.close()
+        return position  # SUM() over no rows is NULL: the user is not waiting
+
+    def get_waitlist(self, event_name: str) -> list[str]:
+        """ Returns the gamertags waiting for an event, next to be promoted first. """
+        conn = database.connect(self.db_path)
+        rows = conn.execute("""
+            SELECT u.gamertag
+            FROM waitlist w
+            JOIN registered_users u ON u.id = w.gamertag
+            WHERE w.event_name = ?
+            ORDER BY w.id
+        """, (event_name,)).fetchall()
+        conn.close()
+        return [gamertag for (gamertag,) in rows]
+
+    def get_roster(self, event_name: str) -> list[dict]:
+        """
+        **Returns the players signed up for an event, in sign-up order.**
+
+        **Returns:**
+        - `list[dict]`: Each with `"fname"`, `"lname"`, `"gamertag"` and `"email"`
+          (the bulk import member columns, so an exported roster can be imported again).
+        """
+        conn = database.connect(self.db_path)
+        rows = conn.execute("""
+            SELECT u.fname, u.lname, u.gamertag, u.email
+            FROM event_signup s
+            JOIN registered_users u ON u.id = s.gamertag
+            WHERE s.event_name = ?
+            ORDER BY s.id
+        """, (event_name,)).fetchall()
+        conn.close()
+        return [{"fname": fname, "lname": lname, "gamertag": gamertag, "email": email} for fname, lname, gamertag, email in rows]
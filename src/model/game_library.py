@@ -1,60 +1,151 @@
+from types import MappingProxyType
+from typing import NamedTuple
+from model import database
+
+
+class Game(NamedTuple):
+    """
+    **One game hosted at the cafe.**
+
+    **Implementation Decisions:**
+    - A `NamedTuple` is immutable and has no per-instance `__dict__`, so 600+ games stay small
+      and can be shared safely between windows.
+    """
+    title: str  # Unique game title, also used as `game_type` by events
+    category: str  # e.g. 'competitive', 'campaign'
+    tags: tuple  # e.g. ('board', 'strategy')
+    min_players: int  # Fewest players per table
+    max_players: int  # Most players per table
+    image_path: str  # Image shown in the Game Library
+
+
+class GameCatalog:
+    """
+    **GameCatalog Class**
+
+    **Class Purpose:**
+    - Read-only snapshot of every game, with category and tag indexes built once at load time.
+
+    **Why This Class Exists:**
+    - The Game Library window used to regroup every game by category each time it opened;
+      with prebuilt indexes, grouping and filtering are dictionary lookups.
+
+    **Attributes:**
+    - `games` (tuple[Game]): All games, ordered by title.
+    - `by_title` (Mapping[str, Game]): Game for each title.
+    - `categories` (tuple[str]): Category names in the order they first appear.
+    - `by_category` (Mapping[str, tuple[Game]]): Games in each category.
+    - `by_tag` (Mapping[str, tuple[Game]]): Games carrying each tag.
+    """
+
+    __slots__ = ("games", "by_title", "categories", "by_category", "by_tag")
+
+    def __init__(self, games: list):
+        """ Builds the indexes from a list of `Game` records. """
+        by_category, by_tag = {}, {}
+        for game in games:
+            by_category.setdefault(game.category, []).append(game)
+            for tag in game.tags:
+                by_tag.setdefault(tag, []).append(game)
+
+        # Mapping proxies and tuples make the snapshot read-only
+        self.games = tuple(games)
+        self.by_title = MappingProxyType({game.title: game for game in games})
+        self.categories = tuple(by_category)
+        self.by_category = MappingProxyType({category: tuple(group) for category, group in by_category.items()})
+        self.by_tag = MappingProxyType({tag: tuple(group) for tag, group in by_tag.items()})
+
+
+_catalogs = {}  # Database path -> loaded GameCatalog, so the library is read once per process
+
+
+def load_catalog(db_path: str = database.DB_PATH, reload: bool = False) -> GameCatalog:
+    """
+    **Returns the game catalog, reading the `games` table only on first use.**
+
+    **Parameters:**
+    - `db_path` (str): Path to the SQLite database file.
+    - `reload` (bool): Re-read the database even if a catalog is cached (e.g. after games were edited).
+
+    **Returns:**
+    - `GameCatalog`: The shared read-only catalog.
+    """
+    if reload or db_path not in _catalogs:
+        conn = database.connect(db_path)
+        tags = {}
+        for title, tag in conn.execute("SELECT title, tag FROM game_tags ORDER BY title, tag"):
+            tags.setdefault(title, []).append(tag)
+        games = [
+            Game(title, category, tuple(tags.get(title, ())), min_players, max_players, image_path)
+            for title, category, min_players, max_players, image_path in conn.execute("""
+                SELECT title, category, min_players, max_players, image_path
+                FROM games
+                ORDER BY title
+            """)
+        ]
+        conn.close()
+        _catalogs[db_path] = GameCatalog(games)
+    return _catalogs[db_path]
+
+
 class GameLibrary:
     """
     **GameLibrary Class**
-    
+
     **Class Purpose:**
-    - Stores and manages all games available at the cafe.
-    - Uses a dictionary to store each game's **title, category, and image path**.
-    
+    - Provides access to all games available at the cafe.
+    - Games are stored in the `games` table with their **title, category, tags, player counts and image path**.
+
     **Why This Class Exists:**
-    - Provides a **centralized** storage system for games.
+    - Provides a **centralized** access point for games.
     - Allows easy retrieval of game information for display in the UI.
     - Ensures game data remains **organized and accessible**.
-    
+
     **Benefits to the Project:**
-    - Makes it easy to **add or update games** in a single place.
-    - Simplifies fetching game-related information dynamically.
+    - Games are **added or updated in the database**, not in code.
+    - Category and tag lookups use indexes built once, so the library opens instantly even with hundreds of games.
     - Reduces **hardcoded game data** across multiple files, because it is centralized here.
     """
-    
-    def __init__(self):
+
+    def __init__(self, db_path: str = database.DB_PATH):
         """
-        **Initializes the GameLibrary and populates the games dictionary.**
-        
+        **Initializes the GameLibrary from the shared game catalog.**
+
         **Implementation Decisions:**
-        - Uses a dictionary where:
+        - The catalog is loaded from the database once per process and shared by every `GameLibrary`.
+        - `games` keeps its original shape for existing callers: a dictionary where
           - The **key** is the game title.
           - The **value** is a list containing:
             1. The game **category** (e.g., 'competitive', 'campaign').
             2. The **image file path** for UI display.
         """
-        
+        self.catalog = load_catalog(db_path)  # Shared, read-only snapshot of the games table
+
         # Dictionary named `games` containing all hosted games at the cafe.
         self.games: dict[str, list[str]] = {
-            'chess': ['competitive', 'resources/images/chess.png'],
-            'dnd': ['campaign', 'resources/images/dnd.png'],
-            'magic': ['competitive', 'resources/images/magic.jpg'],
-            'monopoly': ['competitive', 'resources/images/monopoly.jpg'],
-            'pokemon': ['competitive', 'resources/images/pokemon.png'],
-            'poker': ['competitive', 'resources/images/poker.png'],
-            'risk': ['competitive', 'resources/images/risk.png'],
-            'runescape': ['campaign', 'resources/images/runescape.jpg'],
-            'warhammer': ['campaign', 'resources/images/warhammer.png'],
-            'wow': ['campaign', 'resources/images/wow.png']
+            game.title: [game.category, game.image_path] for game in self.catalog.games
         }
 
     def display_games(self) -> list[str]:
         """
         **Returns a list of all available game names.**
-        
+
         **Why This Function Exists:**
         - Provides a simple way to retrieve all games stored in `GameLibrary`.
         - Ensures the UI or other components can dynamically fetch game names.
-        
+
         **Implementation Decisions:**
-        - Uses `self.games.keys()` to extract game names efficiently.
-        
+        - Uses the catalog's title index to extract game names efficiently.
+
         **Returns:**
         - A list of strings containing all game titles.
         """
-        return list(self.games.keys())  # Extracts and returns all game titles from the dictionary
+        return list(self.catalog.by_title)  # Extracts and returns all game titles from the catalog
+
+    def games_in_category(self, category: str) -> tuple:
+        """ Returns the games in a category (empty if the category does not exist). """
+        return self.catalog.by_category.get(category, ())
+
+    def games_with_tag(self, tag: str) -> tuple:
+        """ Returns the games carrying a tag (empty if no game has it). """
+        return self.catalog.by_tag.get(tag, ())
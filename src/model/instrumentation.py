@@ -0,0 +1,134 @@
+"""
+**Instrumentation Module - Hot-Path Timing**
+
+**Purpose:**
+- Measures how long controller actions, database queries, bracket generation and image loading take.
+- Keeps the most recent measurements in memory and totals per operation for the diagnostics window.
+
+**Why This File Exists:**
+- The only diagnostics used to be `print()` calls, which say *that* something ran but not how long it took.
+- Kiosks run on different hardware; measurements tagged with the host name show which click is slow where.
+
+**Usage:**
+```
+@Timed()                      # Named after the function, e.g. "Controller.open_events"
+def open_events(self): ...
+
+with Timed("GameDisplay.load_icon") as timing:
+    ...
+    timing.rows = len(rows)   # Optional row count for queries
+```
+
+**Implementation Decisions:**
+- Samples go into a fixed-size `deque` (a ring buffer), so memory use never grows on a kiosk left running.
+- Functions that return a list or tuple have its length recorded as the row count automatically.
+- A lock guards the buffer and totals because background threads (searches, imports) are timed too.
+"""
+
+import functools
+import json
+import socket
+import threading
+import time
+from collections import deque
+
+RING_SIZE = 2000  # Most recent samples kept in memory
+
+_samples = deque(maxlen=RING_SIZE)  # Ring buffer of recent samples, oldest dropped first
+_totals = {}  # Operation name -> [calls, total_ms, max_ms, total_rows]
+_lock = threading.Lock()
+
+
+class Timed:
+    """
+    **Times a block of code or every call of a function.**
+
+    - As a context manager, set `.rows` inside the block to record a row count.
+    - As a decorator, `Timed()` uses the function's qualified name; `Timed("name")` overrides it.
+    """
+
+    def __init__(self, name: str = None):
+        """ Stores the operation name (optional when used as a decorator). """
+        self.name = name
+        self.rows = None  # Number of rows/items produced, if meaningful
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        record(self.name, (time.perf_counter() - self._start) * 1000, self.rows)
+        return False  # Never swallow exceptions
+
+    def __call__(self, func):
+        name = self.name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Timed(name) as timing:  # Fresh timer per call, so recursion and threads are safe
+                result = func(*args, **kwargs)
+                if isinstance(result, (list, tuple)):
+                    timing.rows = len(result)
+                return result
+        return wrapper
+
+
+def record(name: str, elapsed_ms: float, rows: int = None) -> None:
+    """ Adds one measurement to the ring buffer and the per-operation totals. """
+    sample = {
+        "name": name,
+        "at": time.time(),  # Wall-clock time the operation finished
+        "ms": round(elapsed_ms, 3),
+        "rows": rows,
+        "thread": threading.current_thread().name,
+    }
+    with _lock:
+        _samples.append(sample)
+        totals = _totals.setdefault(name, [0, 0.0, 0.0, 0])
+        totals[0] += 1
+        totals[1] += elapsed_ms
+        totals[2] = max(totals[2], elapsed_ms)
+        totals[3] += rows or 0
+
+
+def recent_samples() -> list[dict]:
+    """ Returns the buffered samples, newest first. """
+    with _lock:
+        return list(reversed(_samples))
+
+
+def summary() -> list[dict]:
+    """ Returns per-operation totals, slowest total time first. """
+    with _lock:
+        rows = [
+            {
+                "name": name,
+                "calls": calls,
+                "total_ms": round(total_ms, 3),
+                "avg_ms": round(total_ms / calls, 3),
+                "max_ms": round(max_ms, 3),
+                "rows": total_rows,
+            }
+            for name, (calls, total_ms, max_ms, total_rows) in _totals.items()
+        ]
+    return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+
+def export_json(path: str) -> None:
+    """ Writes the host name, totals and recent samples to a JSON file. """
+    report = {
+        "host": socket.gethostname(),  # Identifies the kiosk the numbers came from
+        "exported_at": time.time(),
+        "summary": summary(),
+        "samples": recent_samples(),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def reset() -> None:
+    """ Clears all samples and totals. """
+    with _lock:
+        _samples.clear()
+        _totals.clear()
@@ -0,0 +1,114 @@
+import random
+from itertools import count
+
+
+class _Node:
+    """ One stored interval in an `IntervalIndex` tree. """
+
+    __slots__ = ("start", "order", "end", "item", "priority", "left", "right", "max_end")
+
+    def __init__(self, start, order, end, item):
+        """ Creates a leaf; `order` breaks ties between equal starts in insertion order. """
+        self.start, self.order, self.end, self.item = start, order, end, item
+        self.priority = random.random()  # Heap order on random priorities keeps the tree balanced on average
+        self.left = self.right = None
+        self.max_end = end  # Latest end anywhere in this subtree
+
+
+def _update(node: _Node) -> None:
+    """ Recomputes `node.max_end` from the node and its children. """
+    latest = node.end
+    for child in (node.left, node.right):
+        if child is not None and child.max_end > latest:
+            latest = child.max_end
+    node.max_end = latest
+
+
+def _insert(node, new: _Node) -> _Node:
+    """ Inserts `new` below `node` and returns the subtree's new root (treap insert with rotations). """
+    if node is None:
+        return new
+    if (new.start, new.order) < (node.start, node.order):
+        node.left = _insert(node.left, new)
+        if node.left.priority > node.priority:  # Rotate right
+            child, node.left = node.left, node.left.right
+            child.right = node
+            _update(node)
+            node = child
+    else:
+        node.right = _insert(node.right, new)
+        if node.right.priority > node.priority:  # Rotate left
+            child, node.right = node.right, node.right.left
+            child.left = node
+            _update(node)
+            node = child
+    _update(node)
+    return node
+
+
+class IntervalIndex:
+    """
+    **IntervalIndex Class**
+
+    **Class Purpose:**
+    - Stores half-open intervals `[start, end)` with an item each and finds the ones that overlap a query.
+
+    **Why This Class Exists:**
+    - Checking every pair of sessions for a clash grows with the square of the number of
+      campaigns; an index answers "what overlaps this?" without looking at every interval.
+
+    **Implementation Decisions:**
+    - An augmented interval tree: a binary search tree ordered by start, where every node also
+      records the latest end in its subtree. A query skips any subtree whose latest end is not
+      after the query's start, and everything right of a node that starts at or after the
+      query's end, so it costs O(log n + k) for k results however long some intervals are.
+    - Balanced as a treap (random priorities), so inserts are O(log n) on average with no
+      rebalancing bookkeeping.
+    - Works with anything that can be ordered: numbers, or datetimes.
+    """
+
+    __slots__ = ("root", "size", "counter")
+
+    def __init__(self, intervals=()):
+        """ Builds the index from `(start, end, item)` triples in any order. """
+        self.root = None
+        self.size = 0
+        self.counter = count()  # Insertion order, for equal starts
+        for start, end, item in intervals:
+            self.add(start, end, item)
+
+    def __len__(self):
+        """ Returns the number of stored intervals. """
+        return self.size
+
+    def add(self, start, end, item) -> None:
+        """ Inserts one interval in O(log n) on average. Raises `ValueError` if `end <= start`. """
+        if not end > start:
+            raise ValueError(f"Interval must end after it starts: {start!r} - {end!r}")
+        self.root = _insert(self.root, _Node(start, next(self.counter), end, item))
+        self.size += 1
+
+    def overlapping(self, start, end) -> list:
+        """
+        **Returns the `(start, end, item)` entries that overlap `[start, end)`, earliest first.**
+
+        - Intervals that only touch (one ends exactly when the other starts) do not overlap.
+        """
+        found = []
+        pending = []  # Explicit stack for an in-order walk of the subtrees that can hold overlaps
+        node = self.root
+        while pending or node is not None:
+            if node is not None:
+                if node.max_end <= start:
+                    node = None  # Nothing in this subtree ends after `start`
+                    continue
+                pending.append(node)
+                node = node.left
+                continue
+            node = pending.pop()
+            if node.start >= end:
+                break  # In order: this and everything still to visit starts at or after `end`
+            if node.end > start:
+                found.append((node.start, node.end, node.item))
+            node = node.right
+        return found
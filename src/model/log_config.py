@@ -0,0 +1,82 @@
+"""
+**Log Configuration Module**
+
+**Purpose:**
+- Sets up application logging once at startup: rotating log files, written off the GUI thread.
+
+**Why This File Exists:**
+- Bracket code used to `print()` whole player lists and round structures; for large events that
+  built and wrote huge strings to stdout on the GUI thread.
+- Modules now log through `logging.getLogger(__name__)` with `%s` placeholders, so messages are
+  only formatted when their level is enabled.
+
+**Implementation Decisions:**
+- The default level is `WARNING`; bracket and navigation details are `DEBUG` and cost nothing
+  unless `GAME_CAFE_LOG_LEVEL=DEBUG` is set (or a level is passed to `configure_logging()`).
+- Records go through a `QueueHandler`; a `QueueListener` thread writes the files, so disk I/O
+  never blocks a click.
+- `RotatingFileHandler` caps each file at `MAX_BYTES` and keeps `BACKUP_COUNT` old files.
+- Messages use `key=value` fields (e.g. `tournament=... players=...`) so logs can be grepped.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+
+LOG_DIR = "src/logs"
+LOG_FILE = "game_cafe.log"
+LOG_LEVEL_ENV = "GAME_CAFE_LOG_LEVEL"  # e.g. DEBUG, INFO, WARNING
+DEFAULT_LEVEL = "WARNING"
+MAX_BYTES = 1_000_000  # Rotate after about 1 MB
+BACKUP_COUNT = 5  # Rotated files kept (game_cafe.log.1 ... .5)
+LOG_FORMAT = "%(asctime)s %(levelname)s %(threadName)s %(name)s: %(message)s"
+
+_listener = None  # Background QueueListener, started once per process
+
+
+def configure_logging(level: str = None, log_dir: str = LOG_DIR) -> None:
+    """
+    **Configures the root logger for the application.**
+
+    **Parameters:**
+    - `level` (str): Log level name; defaults to `$GAME_CAFE_LOG_LEVEL` or `WARNING`.
+    - `log_dir` (str): Folder for the rotating log files (created if missing).
+
+    **Step-by-Step Explanation:**
+    1️⃣ **Step 1 - Resolve Level**
+       - Unknown level names fall back to `WARNING`.
+
+    2️⃣ **Step 2 - Start the File Writer Thread**
+       - A `QueueListener` owns the `RotatingFileHandler` and stops cleanly at exit.
+
+    3️⃣ **Step 3 - Route Records to the Queue**
+       - The root logger only enqueues records, which is cheap on the calling thread.
+    """
+    global _listener
+
+    # Step 1: Resolve level
+    name = (level or os.environ.get(LOG_LEVEL_ENV) or DEFAULT_LEVEL).upper()
+    resolved = logging.getLevelName(name)
+    if not isinstance(resolved, int):
+        resolved = logging.WARNING
+
+    root = logging.getLogger()
+    root.setLevel(resolved)
+    if _listener is not None:
+        return  # Already configured; only the level changes
+
+    # Step 2: File writer thread
+    os.makedirs(log_dir, exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        os.path.join(log_dir, LOG_FILE), maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8"
+    )
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    records = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, file_handler)
+    _listener.start()
+    atexit.register(_listener.stop)  # Flushes queued records on exit
+
+    # Step 3: Route records to the queue
+    root.addHandler(logging.handlers.QueueHandler(records))
@@ -0,0 +1,136 @@
+import copy
+import logging
+from model import database
+
+logger = logging.getLogger(__name__)
+
+
+class MatchResults:
+    """
+    **MatchResults Class**
+
+    **Class Purpose:**
+    - Stores tournament match winners in the `match_results` table and replays them onto brackets.
+
+    **Why This Class Exists:**
+    - Brackets are regenerated from sign-ups every time they are opened, so results set on a
+      tournament object were lost as soon as the window or command finished.
+
+    **Implementation Decisions:**
+    - Results are keyed by event, round and match number (all 1-based); recording a match again
+      replaces the earlier winner, which is how a mistaken result is corrected. The row keeps its
+      `recorded_at`, so a corrected match is still rated in the order it was played.
+    - A correction can change who played in later rounds; `reconcile()` then drops later results
+      that no longer fit and takes every stored loser from the bracket again.
+    - Winners are stored as `registered_users.id`, the same player ids the brackets use.
+    - Replaying goes through `Tournament.record_winner()`, so winners advance exactly as they did
+      when first recorded.
+    """
+
+    def __init__(self, db_path=database.DB_PATH):
+        """ Initializes the MatchResults class and defines the database path. """
+        self.db_path = db_path  # Assigns the database path to a variable for easier connections.
+
+    def record(self, event_name: str, round_number: int, match_number: int, winner_id: int, loser_id: int = None,
+               seeds: dict = None) -> bool:
+        """
+        **Saves (or replaces) the winner and loser (player ids) of one match.**
+
+        - With the event's first result, `seeds` (see `Tournament.frozen_seeds()`) are stored for
+          players without a manual seed, so rating changes no longer move anyone in the bracket.
+
+        **Returns:**
+        - `bool`: `True` if an earlier result for the match was replaced.
+        """
+        def save(conn):
+            if seeds and conn.execute("SELECT 1 FROM match_results WHERE event_name = ? LIMIT 1", (event_name,)).fetchone() is None:
+                conn.executemany(
+                    "UPDATE event_signup SET seed = ? WHERE event_name = ? AND gamertag = ? AND seed IS NULL",
+                    [(seed, event_name, player) for player, seed in seeds.items()],
+                )
+            replaced = conn.execute("""
+                SELECT 1 FROM match_results WHERE event_name = ? AND round_number = ? AND match_number = ?
+            """, (event_name, round_number, match_number)).fetchone() is not None
+            conn.execute("""
+                INSERT INTO match_results (event_name, round_number, match_number, winner_id, loser_id)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (event_name, round_number, match_number) DO UPDATE SET
+                    winner_id = excluded.winner_id, loser_id = excluded.loser_id
+            """, (event_name, round_number, match_number, winner_id, loser_id))  # Keeps recorded_at and rowid
+            return replaced
+
+        return database.write(save, self.db_path)
+
+    def for_event(self, event_name: str) -> list[tuple]:
+        """ Returns `(round_number, match_number, winner_id)` for an event, in bracket order. """
+        conn = database.connect(self.db_path)
+        rows = conn.execute("""
+            SELECT round_number, match_number, winner_id FROM match_results
+            WHERE event_name = ?
+            ORDER BY round_number, match_number
+        """, (event_name,)).fetchall()
+        conn.close()
+        return rows
+
+    def apply(self, tournament) -> None:
+        """
+        **Replays every stored result for `tournament` onto its generated bracket.**
+
+        - Results that no longer fit (e.g. a player withdrew and the bracket changed) are skipped
+          with a warning instead of failing the whole bracket.
+        """
+        for round_number, match_number, winner_id in self.for_event(tournament.name):
+            try:
+                tournament.record_winner(round_number, match_number, winner_id)
+            except ValueError as error:
+                logger.warning("stored result skipped tournament=%s error=%s", tournament.name, error)
+
+    def reconcile(self, tournament) -> int:
+        """
+        **Brings every stored result for `tournament` back in line with its bracket after a correction.**
+
+        - Results are replayed onto the freshly generated bracket in bracket order. A winner who
+          no longer plays in their match (their feeder result changed) has that result deleted;
+          every other result has its loser set to the opponent the bracket now shows.
+        - Reads and writes share one write transaction, so a result recorded meanwhile is not lost.
+
+        **Parameters:**
+        - `tournament` (Tournament): A newly generated bracket with no results applied yet; the
+          results that are kept are applied to it.
+
+        **Returns:**
+        - `int`: Number of results deleted.
+        """
+        generated = copy.deepcopy(tournament.rounds)
+
+        def repair(conn):
+            tournament.rounds = copy.deepcopy(generated)  # A retried attempt starts from the clean bracket
+            rows = conn.execute("""
+                SELECT round_number, match_number, winner_id, loser_id FROM match_results
+                WHERE event_name = ?
+                ORDER BY round_number, match_number
+            """, (tournament.name,)).fetchall()
+            stale, losers = [], []
+            for round_number, match_number, winner_id, loser_id in rows:
+                try:
+                    tournament.record_winner(round_number, match_number, winner_id)
+                except ValueError:
+                    stale.append((tournament.name, round_number, match_number))
+                    continue
+                match = tournament.rounds[round_number - 1][match_number - 1]
+                opponent = match["p2"] if match["p1"] == winner_id else match["p1"]
+                opponent = opponent if opponent > 0 else None  # Wins against an open slot are not rated
+                if opponent != loser_id:
+                    losers.append((opponent, tournament.name, round_number, match_number))
+            conn.executemany(
+                "DELETE FROM match_results WHERE event_name = ? AND round_number = ? AND match_number = ?", stale
+            )
+            conn.executemany(
+                "UPDATE match_results SET loser_id = ? WHERE event_name = ? AND round_number = ? AND match_number = ?", losers
+            )
+            return len(stale)
+
+        deleted = database.write(repair, self.db_path)
+        if deleted:
+            logger.info("results no longer fitting removed tournament=%s count=%d", tournament.name, deleted)
+        return deleted
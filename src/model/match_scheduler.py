@@ -0,0 +1,223 @@
+"""
+**Match Scheduler Module - Estimated Start Times for Every Bracket Match**
+
+**Purpose:**
+- Works out when each match of a tournament should start, so players (and staff) can see
+  "your next match: table 3, about 19:40".
+
+**Why This File Exists:**
+- Brackets had no notion of time; players kept asking staff when their next match was.
+
+**Implementation Decisions:**
+- A match can start once the tournament has started, its players are free and its table is
+  free. "Players are free" means the matches that feed it have finished: in elimination
+  formats, the two matches whose winners meet; in round robin, each player's previous match.
+  "Table is free" means the previous match on the same table has finished.
+- Every one of those dependencies points to an earlier round, or to an earlier match on the
+  same table in the same round, so visiting matches by `(round, match)` computes every
+  estimate in one pass.
+- Matches take the game's `games.match_minutes` (or `DEFAULT_MATCH_MINUTES`). A recorded
+  result ends its match when it was recorded, early or late.
+- Estimates are made at a moment `now`: nothing unrecorded can start before it, and a match
+  still without a result has not ended yet. A match running late therefore pushes everything
+  after it back as the clock moves, instead of leaving players with ETAs in the past.
+- `record_finish()` only revisits matches downstream of the one that finished, stopping
+  wherever an estimate does not change, instead of rescheduling the whole bracket.
+- `critical_path()` follows, from the last match back, the dependency that held each match
+  up: the chain of matches that decides when the tournament ends.
+"""
+
+import heapq
+import logging
+from datetime import datetime, timedelta
+from model import database
+from model.current_events import TIMESTAMP_FORMAT
+from model.tournament import BYE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MATCH_MINUTES = 30  # For games without a match_minutes value
+
+
+class MatchSchedule:
+    """
+    **MatchSchedule Class**
+
+    **Class Purpose:**
+    - Holds an estimated start and end for every match of one tournament.
+
+    **Attributes:**
+    - `starts`, `ends` (dict[tuple[int, int], datetime]): Per `(round_number, match_number)`, both 1-based.
+    - `finished` (set[tuple[int, int]]): Matches whose end is a recorded result, not an estimate.
+    - `now` (datetime | None): When the estimates are made; `None` plans from the start time only.
+    """
+
+    def __init__(self, tournament, starts_at: datetime, match_minutes: int = DEFAULT_MATCH_MINUTES, now: datetime = None):
+        """ Builds the dependency graph for `tournament`'s bracket and estimates every match. """
+        self.tournament = tournament
+        self.starts_at = starts_at
+        self.now = now
+        self.duration = timedelta(minutes=match_minutes)
+        self.starts, self.ends = {}, {}
+        self.finished = set()
+        self.predecessors = {}  # Match -> matches that must end before it can start
+        self.successors = {}  # Match -> matches waiting on it
+        self.build_graph()
+        for key in sorted(self.predecessors):
+            self.estimate(key)
+
+    def build_graph(self) -> None:
+        """ Links every match to the matches it waits for (feeders or players' previous matches, and its table). """
+        last_on_table = {}  # Table -> latest match placed on it
+        last_for_player = {}  # Player id -> latest match they play in (round robin)
+        for round_number, matches in enumerate(self.tournament.rounds, start=1):
+            for match_number, match in enumerate(matches, start=1):
+                key = (round_number, match_number)
+                waits_for = set()
+                if self.tournament.advances_winners:
+                    if round_number > 1:
+                        waits_for.update((round_number - 1, feeder) for feeder in (2 * match_number - 1, 2 * match_number))
+                else:
+                    for player in (match["p1"], match["p2"]):
+                        if player > 0 and player in last_for_player:
+                            waits_for.add(last_for_player[player])
+                        last_for_player[player] = key
+                table = match.get("table")
+                if table is not None:
+                    if table in last_on_table:
+                        waits_for.add(last_on_table[table])
+                    last_on_table[table] = key
+
+                waits_for = {other for other in waits_for if other[0] <= len(self.tournament.rounds)
+                             and other[1] <= len(self.tournament.rounds[other[0] - 1])}
+                self.predecessors[key] = sorted(waits_for)
+                self.successors.setdefault(key, [])
+                for other in waits_for:
+                    self.successors.setdefault(other, []).append(key)
+
+    def match(self, key: tuple) -> dict:
+        """ Returns the bracket dictionary for `(round_number, match_number)`. """
+        return self.tournament.rounds[key[0] - 1][key[1] - 1]
+
+    def ready_at(self, key: tuple) -> datetime:
+        """ Returns when a match's players and table are free, from its predecessors' ends. """
+        return max([self.starts_at] + [self.ends[other] for other in self.predecessors[key]])
+
+    def estimate(self, key: tuple) -> bool:
+        """
+        **Recomputes one match from its predecessors. Returns True if its start or end moved.**
+
+        - A match without a result starts no earlier than `now`, and ends no earlier than `now`:
+          if it is already under way it may still end on time, but not in the past.
+        """
+        ready = self.ready_at(key)
+        start = ready
+        if key in self.finished:
+            end = self.ends[key]
+        elif BYE in (self.match(key)["p1"], self.match(key)["p2"]):
+            end = start  # A bye: decided without being played
+        else:
+            end = ready + self.duration
+            if self.now is not None:
+                start = max(ready, self.now)
+                end = max(end, self.now)
+        changed = self.starts.get(key) != start or self.ends.get(key) != end
+        self.starts[key], self.ends[key] = start, end
+        return changed
+
+    def record_finish(self, round_number: int, match_number: int, finished_at: datetime) -> list:
+        """
+        **Marks a match as finished at `finished_at` and moves every estimate that depends on it.**
+
+        **Returns:**
+        - `list[tuple[int, int]]`: Matches whose estimate changed, in bracket order.
+        """
+        key = (round_number, match_number)
+        self.finished.add(key)
+        self.ends[key] = max(finished_at, self.ready_at(key))  # A result cannot end a match before it could start
+        self.estimate(key)  # Its start is no longer held back to `now`
+        changed = []
+        pending = list(self.successors[key])
+        heapq.heapify(pending)
+        seen = set(pending)
+        while pending:  # Bracket order is a valid order: predecessors always come first
+            current = heapq.heappop(pending)
+            if not self.estimate(current):
+                continue  # Nothing after this match moves either, through this match
+            changed.append(current)
+            for later in self.successors[current]:
+                if later not in seen:
+                    seen.add(later)
+                    heapq.heappush(pending, later)
+        logger.debug("match finished tournament=%s match=%s moved=%d", self.tournament.name, key, len(changed))
+        return changed
+
+    def next_match(self, player_id: int):
+        """
+        **Returns the earliest undecided match `player_id` is drawn in.**
+
+        **Returns:**
+        - `tuple | None`: `(round_number, match_number, estimated start, table)`, or `None` if
+          they have no match waiting (eliminated, finished, or waiting on a result to advance).
+        """
+        for key in sorted(self.starts):
+            match = self.match(key)
+            if match["winner"] is None and player_id in (match["p1"], match["p2"]):
+                return key[0], key[1], self.starts[key], match.get("table")
+        return None
+
+    def critical_path(self) -> list:
+        """ Returns the chain of matches, first to last, that decides when the tournament ends. """
+        if not self.ends:
+            return []
+        key = max(self.ends, key=lambda other: (self.ends[other], other))
+        path = [key]
+        while self.predecessors[key]:
+            key = max(self.predecessors[key], key=lambda other: (self.ends[other], other))
+            if self.ends[key] < self.starts[path[-1]]:
+                break  # The match was waiting for the tournament to start, not for this one
+            path.append(key)
+        return path[::-1]
+
+
+def match_minutes(game_type: str, db_path: str = database.DB_PATH) -> int:
+    """ Returns the average match length for a game, in minutes. """
+    conn = database.connect(db_path)
+    row = conn.execute("SELECT match_minutes FROM games WHERE title = ?", (game_type,)).fetchone()
+    conn.close()
+    return row[0] if row and row[0] else DEFAULT_MATCH_MINUTES
+
+
+def schedule_tournament(tournament, event: dict, db_path: str = database.DB_PATH, now: datetime = None):
+    """
+    **Estimates every match of a tournament with its recorded results applied.**
+
+    **Parameters:**
+    - `tournament` (Tournament): The bracket, with results already replayed (`MatchResults.apply()`).
+    - `event` (dict): Its tournament dictionary from `CurrentEvents` (for the start time and game).
+    - `now` (datetime): When to estimate from; defaults to the current local time.
+
+    **Returns:**
+    - `MatchSchedule | None`: `None` if the tournament has no start time yet.
+    """
+    if not event.get("starts_at"):
+        return None
+    if now is None:
+        now = datetime.now().replace(second=0, microsecond=0)  # Local, minute precision like starts_at
+    schedule = MatchSchedule(tournament, datetime.strptime(event["starts_at"], TIMESTAMP_FORMAT),
+                             match_minutes(event["game_type"], db_path), now)
+
+    conn = database.connect(db_path)
+    results = conn.execute("""
+        SELECT round_number, match_number, strftime('%Y-%m-%d %H:%M', recorded_at, 'localtime')
+        FROM match_results
+        WHERE event_name = ?
+        ORDER BY round_number, match_number
+    """, (tournament.name,)).fetchall()
+    conn.close()
+
+    for round_number, match_number, recorded_at in results:
+        key = (round_number, match_number)
+        if key in schedule.starts and schedule.match(key)["winner"] is not None:  # Skip results that no longer fit
+            schedule.record_finish(round_number, match_number, datetime.strptime(recorded_at, TIMESTAMP_FORMAT))
+    return schedule
@@ -0,0 +1,226 @@
+"""
+**Matchmaking Module - Casual Opponent Queue**
+
+**Purpose:**
+- Lets players outside tournaments ask for an opponent in a game and pairs them by rating.
+
+**Why This File Exists:**
+- People looking for a casual game found opponents by shouting across the room.
+
+**Implementation Decisions:**
+- Requests live in the `matchmaking_queue` table (one per player), so every kiosk sees the same queue.
+- Pairing is per game. Each game's queue is sorted by rating once; players are then served
+  longest-waiting first, and a player's best opponent is always next to them in that order, so
+  only the two nearest unmatched neighbours are checked instead of every other player. The
+  sorted order is kept as a doubly linked list, so finding a player and unlinking a matched
+  pair are O(1) and a whole run is O(n log n) for the sort.
+- The rating gap a player accepts starts at `BASE_WINDOW` and widens by `WIDEN_PER_MINUTE`
+  while they wait (up to `MAX_WINDOW`): close matches first, but nobody waits forever.
+- `run_matcher()` reads the queue and writes the pairs in one write transaction, so kiosks
+  running the matcher at the same time can never pair a player twice. It first checks, with a
+  plain read, that some game has two players queued; an idle queue never takes the write lock.
+- Unrated players count as `DEFAULT_RATING` (see `model/ratings.py`).
+"""
+
+import logging
+from typing import NamedTuple
+from model import database
+from model.game_library import load_catalog
+from model.instrumentation import Timed
+from model.ratings import DEFAULT_RATING
+
+logger = logging.getLogger(__name__)
+
+BASE_WINDOW = 100.0  # Rating gap accepted straight away
+WIDEN_PER_MINUTE = 50.0  # Extra gap accepted per minute waited
+MAX_WINDOW = 600.0  # Widest gap ever accepted
+MATCH_INTERVAL_MS = 5000  # How often the kiosks run the matcher
+
+
+class QueueEntry(NamedTuple):
+    """ One player waiting for an opponent. """
+    player_id: int
+    game_title: str
+    rating: float
+    waited_minutes: float
+
+
+class Pairing(NamedTuple):
+    """ Two players matched for a casual game. """
+    game_title: str
+    first: int  # Player id of the longer-waiting player
+    second: int
+
+
+def rating_window(waited_minutes: float) -> float:
+    """ Returns the largest rating gap a player who has waited `waited_minutes` will accept. """
+    return min(MAX_WINDOW, BASE_WINDOW + WIDEN_PER_MINUTE * max(waited_minutes, 0.0))
+
+
+def pair_players(entries: list) -> list:
+    """
+    **Pairs queued players of the same game whose ratings are close enough.**
+
+    **Parameters:**
+    - `entries` (list[QueueEntry]): The queue, longest-waiting first.
+
+    **Returns:**
+    - `list[Pairing]`: The pairs made; everyone else stays queued.
+
+    **Step-by-Step Explanation:**
+    1️⃣ **Step 1 - Sort Each Game by Rating**
+    2️⃣ **Step 2 - Serve Players in Wait Order**
+       - The longest-waiting player has the widest window, so theirs decides the pair.
+    3️⃣ **Step 3 - Check the Nearest Neighbours**
+       - The closest unmatched rating on either side is the best candidate; both players are
+         unlinked from their game's list.
+    """
+    by_game = {}
+    for entry in entries:  # Step 1: Group by game, then sort each group by rating
+        by_game.setdefault(entry.game_title, []).append(entry)
+    previous, following = {}, {}  # Player id -> unmatched neighbour below / above in rating order (None at the ends)
+    for group in by_game.values():
+        group.sort(key=lambda entry: (entry.rating, entry.player_id))
+        ids = [None] + [entry.player_id for entry in group] + [None]
+        for below, player, above in zip(ids, ids[1:], ids[2:]):
+            previous[player], following[player] = below, above
+
+    ratings = {entry.player_id: entry.rating for entry in entries}
+    pairs = []
+    for entry in entries:  # Step 2: Longest-waiting first
+        player = entry.player_id
+        if player not in previous:
+            continue  # Already matched by a player who waited longer
+
+        # Step 3: Nearest unmatched neighbours on each side
+        window = rating_window(entry.waited_minutes)
+        candidates = [other for other in (previous[player], following[player]) if other is not None]
+        best = min(candidates, key=lambda other: abs(ratings[other] - entry.rating), default=None)
+        if best is None or abs(ratings[best] - entry.rating) > window:
+            continue
+
+        for matched in (player, best):  # Unlink both; their neighbours now see each other
+            below, above = previous.pop(matched), following.pop(matched)
+            if below is not None:
+                following[below] = above
+            if above is not None:
+                previous[above] = below
+        pairs.append(Pairing(entry.game_title, player, best))
+    return pairs
+
+
+class MatchmakingQueue:
+    """
+    **MatchmakingQueue Class**
+
+    **Class Purpose:**
+    - Adds and removes opponent requests and turns the queue into casual matches.
+    """
+
+    def __init__(self, db_path=database.DB_PATH):
+        """ Initializes the MatchmakingQueue class and defines the database path. """
+        self.db_path = db_path  # Assigns the database path to a variable for easier connections.
+
+    def request_game(self, player_id: int, game_title: str) -> str:
+        """
+        **Queues a player for an opponent in `game_title`, replacing any earlier request.**
+
+        - The title is matched ignoring case ("Chess" finds `chess`) and queued as the catalog
+          spells it, so players asking for the same game always land in the same group.
+
+        **Returns:**
+        - `str`: The catalog title the player was queued for.
+
+        **Raises:**
+        - `ValueError`: If the cafe does not have the game.
+        """
+        titles = {title.casefold(): title for title in load_catalog(self.db_path).by_title}
+        title = titles.get(game_title.strip().casefold())
+        if title is None:
+            raise ValueError(f"The cafe has no game called '{game_title}'")
+
+        def save(conn):
+            conn.execute("""
+                INSERT INTO matchmaking_queue (player_id, game_title) VALUES (?, ?)
+                ON CONFLICT (player_id) DO UPDATE SET game_title = excluded.game_title, joined_at = datetime('now')
+            """, (player_id, title))
+
+        database.write(save, self.db_path)
+        return title
+
+    def cancel(self, player_id: int) -> bool:
+        """ Removes a player's request. Returns `False` if they were not queued. """
+        def remove(conn):
+            return conn.execute("DELETE FROM matchmaking_queue WHERE player_id = ?", (player_id,)).rowcount > 0
+
+        return database.write(remove, self.db_path)
+
+    def waiting(self) -> list[tuple]:
+        """ Returns `(gamertag, game_title, minutes waited)` for every queued player, longest-waiting first. """
+        conn = database.connect(self.db_path)
+        rows = conn.execute("""
+            SELECT u.gamertag, q.game_title, (julianday('now') - julianday(q.joined_at)) * 1440
+            FROM matchmaking_queue q
+            JOIN registered_users u ON u.id = q.player_id
+            ORDER BY q.joined_at, q.player_id
+        """).fetchall()
+        conn.close()
+        return rows
+
+    def latest_match(self, player_id: int):
+        """ Returns `(game_title, opponent gamertag, matched_at)` of a player's most recent casual match, or `None`. """
+        conn = database.connect(self.db_path)
+        row = conn.execute("""
+            SELECT m.game_title, u.gamertag, m.matched_at
+            FROM casual_matches m
+            JOIN registered_users u ON u.id = CASE WHEN m.player1_id = ? THEN m.player2_id ELSE m.player1_id END
+            WHERE m.player1_id = ? OR m.player2_id = ?
+            ORDER BY m.id DESC
+            LIMIT 1
+        """, (player_id, player_id, player_id)).fetchone()
+        conn.close()
+        return row
+
+    @Timed()
+    def run_matcher(self) -> list[tuple]:
+        """
+        **Pairs everyone who can be paired now and moves them from the queue into `casual_matches`.**
+
+        - Returns straight away, without the write lock, unless some game has two players queued.
+
+        **Returns:**
+        - `list[tuple]`: `(game_title, gamertag, gamertag)` for each new match, for announcing.
+        """
+        conn = database.connect(self.db_path)
+        pairable = conn.execute(
+            "SELECT 1 FROM matchmaking_queue GROUP BY game_title HAVING COUNT(*) >= 2 LIMIT 1"
+        ).fetchone()
+        conn.close()
+        if pairable is None:
+            return []  # Nobody can be paired: skip the write lock entirely
+
+        def match(conn):
+            entries = [QueueEntry(*row) for row in conn.execute("""
+                SELECT q.player_id, q.game_title, COALESCE(r.rating, ?),
+                       (julianday('now') - julianday(q.joined_at)) * 1440
+                FROM matchmaking_queue q
+                LEFT JOIN player_ratings r ON r.player_id = q.player_id
+                ORDER BY q.joined_at, q.player_id
+            """, (DEFAULT_RATING,))]
+            pairs = pair_players(entries)
+            conn.executemany(
+                "INSERT INTO casual_matches (game_title, player1_id, player2_id) VALUES (?, ?, ?)", pairs
+            )
+            conn.executemany(
+                "DELETE FROM matchmaking_queue WHERE player_id IN (?, ?)", [(pair.first, pair.second) for pair in pairs]
+            )
+            players = [player for pair in pairs for player in pair[1:]]
+            names = dict(conn.execute(
+                f"SELECT id, gamertag FROM registered_users WHERE id IN ({', '.join('?' * len(players))})", players
+            )) if players else {}
+            return [(pair.game_title, names.get(pair.first), names.get(pair.second)) for pair in pairs]
+
+        matches = database.write(match, self.db_path)
+        if matches:
+            logger.info("casual matches made count=%d", len(matches))
+        return matches
@@ -0,0 +1,164 @@
+"""
+**Profiling Module - Opt-In cProfile Capture of Window Opens**
+
+**Purpose:**
+- Records a full `cProfile` profile of each controller `open_*` action while profiling mode is on.
+
+**Why This File Exists:**
+- `@Timed()` shows *that* opening a window is slow on some kiosks, but not which calls inside
+  it are responsible, and finding out used to mean editing code on the kiosk.
+
+**Usage:**
+- Start the app with `GAME_CAFE_PROFILE=1`, or press Ctrl+Shift+P on the main window to toggle it.
+- Every profiled call writes two files to `src/logs/profiles/`:
+  `<action>-<timestamp>.pstats` (open with `python -m pstats` or snakeviz) and a `.txt` summary
+  with the top `TOP_N` functions by cumulative time, headed by the database size at the time.
+- Database work the window hands to a worker thread (`view/db_worker.py`) is captured too, as
+  `<action>-<timestamp>.worker-<n>-<function>.pstats` and `.txt` next to the window's own files.
+
+**Implementation Decisions:**
+- Off by default: when disabled, `@profiled()` costs one boolean check per call.
+- Only the outermost profiled call on a thread is captured; a window opening another window
+  shows up inside the first profile instead of starting a second profiler.
+- cProfile only sees the thread it runs on, and since windows load their data through
+  `run_read()` most of an open happens elsewhere. `profile_worker()` wraps each callable
+  submitted during a capture so it gets its own profiler on the worker thread.
+"""
+
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import re
+import threading
+import time
+from itertools import count
+from datetime import datetime
+from model import database
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "GAME_CAFE_PROFILE"  # Set to 1 to profile from startup
+PROFILE_DIR = "src/logs/profiles"
+TOP_N = 30  # Functions listed in each text summary
+
+_enabled = os.environ.get(PROFILE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+UNSAFE_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]")  # Replaced with "_" in file names
+
+_active = threading.local()  # .capture is set while a profile is being captured on this thread
+
+
+def is_enabled() -> bool:
+    """ Returns True if profiling mode is on. """
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """ Turns profiling mode on or off for the rest of the session. """
+    global _enabled
+    _enabled = enabled
+    logger.warning("profiling %s dir=%s", "enabled" if enabled else "disabled", PROFILE_DIR)
+
+
+def capture_stem(label: str) -> str:
+    """ Returns the file name, without extension, for a capture of `label` starting now. """
+    return f"{UNSAFE_CHARACTERS.sub('_', label)}-{datetime.now():%Y%m%d-%H%M%S-%f}"
+
+
+def profiled(name: str = None, profile_dir: str = PROFILE_DIR, db_path: str = database.DB_PATH):
+    """
+    **Decorator: captures a cProfile profile of each call while profiling mode is on.**
+
+    **Parameters:**
+    - `name` (str): Label used in file names; defaults to the function's qualified name.
+    - `profile_dir` (str): Folder for `.pstats` and `.txt` files (created if missing).
+    - `db_path` (str): Database whose size is written into each summary.
+    """
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled or getattr(_active, "capture", None) is not None:
+                return func(*args, **kwargs)
+
+            profiler = cProfile.Profile()
+            stem = capture_stem(label)
+            _active.capture = (stem, label, profile_dir, db_path, count(1))  # Read by profile_worker()
+            started = time.perf_counter()
+            try:
+                return profiler.runcall(func, *args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                _active.capture = None
+                save_profile(profiler, label, elapsed_ms, profile_dir, db_path, stem)
+        return wrapper
+    return decorate
+
+
+def profile_worker(fn):
+    """
+    **Wraps `fn`, about to be handed to another thread, so it is profiled as part of the current capture.**
+
+    - Returns `fn` unchanged unless a `@profiled()` call is running on the calling thread.
+    - The worker's files share the capture's name, numbered in submission order.
+    """
+    capture = getattr(_active, "capture", None)
+    if capture is None:
+        return fn
+    stem, label, profile_dir, db_path, numbers = capture
+    name = getattr(fn, "__qualname__", type(fn).__name__)
+    worker_stem = f"{stem}.worker-{next(numbers)}-{UNSAFE_CHARACTERS.sub('_', name)}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            return profiler.runcall(fn, *args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            save_profile(profiler, f"{label} (worker: {name})", elapsed_ms, profile_dir, db_path, worker_stem)
+    return wrapper
+
+
+def save_profile(profiler: cProfile.Profile, label: str, elapsed_ms: float,
+                 profile_dir: str = PROFILE_DIR, db_path: str = database.DB_PATH, stem: str = None) -> str:
+    """
+    **Writes a finished profile as `.pstats` plus a top-N text summary.**
+
+    - Files are named `stem` (default: the label and the current time) plus the extension.
+    - Failing to write (e.g. a read-only folder) is logged and never breaks the window being opened.
+
+    **Returns:**
+    - `str`: Path of the `.pstats` file, or `""` if it could not be written.
+    """
+    if stem is None:
+        stem = capture_stem(label)
+    base = os.path.join(profile_dir, stem)
+    try:
+        db_bytes = os.path.getsize(db_path)
+    except OSError:
+        db_bytes = -1  # Unknown (e.g. the database lives elsewhere)
+
+    try:
+        os.makedirs(profile_dir, exist_ok=True)
+        profiler.dump_stats(base + ".pstats")
+
+        text = io.StringIO()
+        text.write(f"action: {label}\n")
+        text.write(f"elapsed_ms: {elapsed_ms:.1f}\n")
+        text.write(f"db_path: {db_path}\n")
+        text.write(f"db_bytes: {db_bytes}\n")
+        text.write(f"captured: {datetime.now().isoformat(timespec='seconds')}\n\n")
+        pstats.Stats(profiler, stream=text).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_N)
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(text.getvalue())
+    except OSError:
+        logger.exception("could not save profile action=%s", label)
+        return ""
+
+    logger.warning("profile saved action=%s elapsed_ms=%.1f db_bytes=%d file=%s", label, elapsed_ms, db_bytes, base + ".pstats")
+    return base + ".pstats"
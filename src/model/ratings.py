@@ -0,0 +1,207 @@
+"""
+**Ratings Module - Elo Player Ratings from Match History**
+
+**Purpose:**
+- Keeps an Elo rating per player in the `player_ratings` table, for seeding and matchmaking.
+
+**Why This File Exists:**
+- Nothing tracked player skill, so brackets were seeded by sign-up order and there was no way
+  to tell a close match from a mismatch.
+
+**Implementation Decisions:**
+- Every stored result moves both players' ratings straight away (`record_result()`), so the
+  table is always current without rereading history.
+- `recompute()` rebuilds the whole table from `match_results` in recorded order; it is how a
+  corrected result, or a change to `K_FACTOR`, reaches every later rating.
+- Elo ratings depend on match order, but two matches with no player in common do not affect
+  each other. The recompute therefore splits history into layers where no player appears
+  twice (keeping each player's matches in order) and, when NumPy is installed, updates a
+  whole layer with one set of array operations. The result is identical to replaying the
+  matches one at a time, which is what happens without NumPy.
+- Layers are only worth it when they are wide. A layer holds at most `players // 2` matches,
+  and assigning layers is itself a loop over every match, so with the few dozen regulars a
+  cafe has the thousands of thin layers were 2-5x slower than the plain loop.
+  `replay()` takes the layered path only from `MIN_LAYER_WIDTH` possible matches per layer;
+  `src/ratings_bench.py` measures both paths.
+- Plain Elo, not Glicko: Glicko's rating deviation needs rating periods, and cafe play is too
+  irregular for them to mean much. `games` is kept so a confidence rule can be added later.
+"""
+
+import logging
+import time
+from model import database
+from model.instrumentation import Timed, record
+
+try:
+    import numpy as np
+except ImportError:  # Optional: recompute() replays one match at a time without it
+    np = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATING = 1500.0  # Rating of a player with no recorded matches
+K_FACTOR = 32.0  # Most points one match can move a rating
+SCALE = 400.0  # Rating gap at which the stronger player is expected to win 10 to 1
+MIN_LAYER_WIDTH = 1000  # Widest possible layer (players // 2) below which the plain loop is faster
+
+
+def expected_score(rating: float, opponent: float) -> float:
+    """ Returns the chance (0-1) Elo gives a player rated `rating` of beating one rated `opponent`. """
+    return 1.0 / (1.0 + 10.0 ** ((opponent - rating) / SCALE))
+
+
+def rating_change(winner_rating: float, loser_rating: float, k_factor: float = K_FACTOR) -> float:
+    """ Returns the points the winner gains (and the loser loses) for one match. """
+    return k_factor * (1.0 - expected_score(winner_rating, loser_rating))
+
+
+def replay(winners, losers, k_factor: float = K_FACTOR) -> tuple[dict, dict]:
+    """
+    **Rates every player from scratch by replaying matches in order.**
+
+    **Parameters:**
+    - `winners`, `losers` (sequence[int]): Player ids; match `i` was won by `winners[i]` against `losers[i]`.
+
+    **Returns:**
+    - `tuple[dict, dict]`: Player id -> rating, and player id -> games played.
+    """
+    if np is not None and len(winners) and len(set(winners).union(losers)) // 2 >= MIN_LAYER_WIDTH:
+        return _replay_layers(winners, losers, k_factor)
+
+    ratings, games = {}, {}
+    for winner, loser in zip(winners, losers):
+        winner_rating = ratings.get(winner, DEFAULT_RATING)
+        loser_rating = ratings.get(loser, DEFAULT_RATING)
+        change = rating_change(winner_rating, loser_rating, k_factor)
+        ratings[winner] = winner_rating + change
+        ratings[loser] = loser_rating - change
+        games[winner] = games.get(winner, 0) + 1
+        games[loser] = games.get(loser, 0) + 1
+    return ratings, games
+
+
+def _replay_layers(winners, losers, k_factor: float) -> tuple[dict, dict]:
+    """ NumPy version of `replay()`: one vectorized update per layer of player-disjoint matches. """
+    ids, dense = np.unique(np.concatenate([np.asarray(winners), np.asarray(losers)]), return_inverse=True)
+    count = len(winners)
+    winner_index, loser_index = dense[:count], dense[count:]
+
+    # A match's layer is one past the last layer either player appeared in, so players never
+    # repeat within a layer and each player's matches stay in order
+    next_free = [0] * len(ids)
+    layers = [0] * count
+    for match, (winner, loser) in enumerate(zip(winner_index.tolist(), loser_index.tolist())):
+        layer = next_free[winner] if next_free[winner] > next_free[loser] else next_free[loser]  # max() without the call
+        layers[match] = layer
+        next_free[winner] = next_free[loser] = layer + 1
+
+    layers = np.asarray(layers)
+    order = np.argsort(layers, kind="stable")
+    bounds = np.flatnonzero(np.diff(layers[order])) + 1
+    ratings = np.full(len(ids), DEFAULT_RATING)
+    for batch in np.split(order, bounds):
+        batch_winners, batch_losers = winner_index[batch], loser_index[batch]
+        change = k_factor / (1.0 + 10.0 ** ((ratings[batch_winners] - ratings[batch_losers]) / SCALE))
+        ratings[batch_winners] += change  # Safe: no player appears twice in a layer
+        ratings[batch_losers] -= change
+
+    games = np.bincount(winner_index, minlength=len(ids)) + np.bincount(loser_index, minlength=len(ids))
+    ids = ids.tolist()
+    return dict(zip(ids, ratings.tolist())), dict(zip(ids, games.tolist()))
+
+
+class PlayerRatings:
+    """
+    **PlayerRatings Class**
+
+    **Class Purpose:**
+    - Reads, updates and rebuilds the `player_ratings` table.
+    """
+
+    def __init__(self, db_path=database.DB_PATH):
+        """ Initializes the PlayerRatings class and defines the database path. """
+        self.db_path = db_path  # Assigns the database path to a variable for easier connections.
+
+    def get_ratings(self) -> dict:
+        """ Returns player id -> rating for every rated player (unrated players are `DEFAULT_RATING`). """
+        conn = database.connect(self.db_path)
+        rows = conn.execute("SELECT player_id, rating FROM player_ratings").fetchall()
+        conn.close()
+        return dict(rows)
+
+    def get_leaderboard(self, limit: int = 20) -> list[tuple]:
+        """ Returns `(gamertag, rating, games)` for the highest-rated players. """
+        conn = database.connect(self.db_path)
+        rows = conn.execute("""
+            SELECT u.gamertag, r.rating, r.games
+            FROM player_ratings r
+            JOIN registered_users u ON u.id = r.player_id
+            ORDER BY r.rating DESC
+            LIMIT ?
+        """, (limit,)).fetchall()
+        conn.close()
+        return rows
+
+    def record_result(self, winner_id: int, loser_id: int) -> tuple[float, float]:
+        """
+        **Applies one new result to both players' ratings.**
+
+        - Read and update share one write transaction, so two kiosks recording results for the
+          same player cannot both start from the old rating.
+
+        **Returns:**
+        - `tuple[float, float]`: The winner's and loser's new ratings.
+        """
+        def update(conn):
+            stored = dict(conn.execute(
+                "SELECT player_id, rating FROM player_ratings WHERE player_id IN (?, ?)", (winner_id, loser_id)
+            ).fetchall())
+            winner_rating = stored.get(winner_id, DEFAULT_RATING)
+            loser_rating = stored.get(loser_id, DEFAULT_RATING)
+            change = rating_change(winner_rating, loser_rating)
+            conn.executemany("""
+                INSERT INTO player_ratings (player_id, rating, games) VALUES (?, ?, 1)
+                ON CONFLICT (player_id) DO UPDATE SET
+                    rating = excluded.rating, games = games + 1, updated_at = datetime('now')
+            """, [(winner_id, winner_rating + change), (loser_id, loser_rating - change)])
+            return winner_rating + change, loser_rating - change
+
+        return database.write(update, self.db_path)
+
+    @Timed()
+    def recompute(self) -> int:
+        """
+        **Rebuilds every rating from the full match history.**
+
+        - History is read in recorded order; results without a known loser (recorded before
+          losers were stored) cannot be rated and are left out.
+        - The read, the replay and the save share one write transaction, so a result recorded
+          meanwhile cannot be overwritten by ratings computed without it.
+
+        **Returns:**
+        - `int`: Number of matches replayed.
+        """
+        def rebuild(conn):
+            rows = conn.execute("""
+                SELECT winner_id, loser_id FROM match_results
+                WHERE loser_id IS NOT NULL
+                ORDER BY recorded_at, rowid
+            """).fetchall()
+
+            started = time.perf_counter()
+            winners = [winner for winner, _ in rows]
+            losers = [loser for _, loser in rows]
+            ratings, games = replay(winners, losers)
+            record("ratings.replay", (time.perf_counter() - started) * 1000, rows=len(rows))
+
+            conn.execute("DELETE FROM player_ratings")
+            conn.executemany(
+                "INSERT INTO player_ratings (player_id, rating, games) VALUES (?, ?, ?)",
+                [(player, rating, games[player]) for player, rating in ratings.items()],
+            )
+            return rows, ratings
+
+        rows, ratings = database.write(rebuild, self.db_path)
+        logger.info("ratings recomputed matches=%d players=%d vectorized=%s", len(rows), len(ratings),
+                    np is not None and len(ratings) // 2 >= MIN_LAYER_WIDTH)
+        return len(rows)
@@ -0,0 +1,223 @@
+import heapq
+import logging
+import re
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import NamedTuple
+from model import database
+from model.intervals import IntervalIndex
+
+logger = logging.getLogger(__name__)
+
+SESSION_HOURS = 4  # Length of one campaign session
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+ORDINALS = {"first": 1, "second": 2, "third": 3, "fourth": 4, "last": -1}
+WEEK_ZERO = date(1970, 1, 5)  # A Monday; bi-weekly campaigns without a start date count weeks from here
+
+
+class RecurrenceRule(NamedTuple):
+    """
+    **A campaign schedule, parsed once from its `meet_day`, `meet_frequency` and `time` text.**
+
+    **Implementation Decisions:**
+    - Weekly rules (`nth_weekday == 0`) meet every `interval_weeks` weeks on `weekday`;
+      monthly rules meet on the `nth_weekday` (1-4, or -1 for the last) `weekday` of each month.
+    - `occurrences()` jumps straight to the first session in the window and steps from there,
+      so a window far in the future costs the same as next week.
+    """
+    weekday: int  # 0 = Monday ... 6 = Sunday
+    interval_weeks: int  # 1 = weekly, 2 = bi-weekly; unused by monthly rules
+    nth_weekday: int  # 0 for weekly rules, otherwise which weekday of the month
+    start_time: time  # When each session begins
+    first_day: date  # No sessions before this day; also the week bi-weekly rules count from
+
+    def occurrences(self, start: datetime, end: datetime):
+        """
+        **Lazily yields the start of every session beginning in `[start, end)`, in order.**
+
+        **Parameters:**
+        - `start` (datetime): First moment included.
+        - `end` (datetime): First moment excluded.
+        """
+        day = max(start.date(), self.first_day)
+        if self.nth_weekday:
+            month = date(day.year, day.month, 1)
+            while datetime.combine(month, time.min) < end:
+                session = datetime.combine(nth_weekday_of_month(month, self.weekday, self.nth_weekday), self.start_time)
+                if start <= session < end and session.date() >= self.first_day:
+                    yield session
+                month = date(month.year + month.month // 12, month.month % 12 + 1, 1)  # Next month
+            return
+
+        day += timedelta(days=(self.weekday - day.weekday()) % 7)  # First matching weekday
+        skipped_weeks = (day - self.first_day).days // 7 % self.interval_weeks
+        if skipped_weeks:
+            day += timedelta(weeks=self.interval_weeks - skipped_weeks)  # Back onto the cycle
+        step = timedelta(weeks=self.interval_weeks)
+        session = datetime.combine(day, self.start_time)
+        if session < start:
+            session += step  # Today's session already started before the window
+        while session < end:
+            yield session
+            session += step
+
+
+class Session(NamedTuple):
+    """ One meeting of a campaign. """
+    campaign: str  # Campaign (event) name
+    host: str  # Who runs the session
+    table: int | None  # Table the campaign is assigned to, if any
+    starts_at: datetime
+    ends_at: datetime
+
+
+def nth_weekday_of_month(month: date, weekday: int, nth: int) -> date:
+    """ Returns e.g. the first Friday (`weekday=4, nth=1`) or last Monday (`weekday=0, nth=-1`) of `month`. """
+    if nth > 0:
+        first = month + timedelta(days=(weekday - month.weekday()) % 7)
+        return first + timedelta(weeks=nth - 1)
+    next_month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+    last_day = next_month - timedelta(days=1)
+    return last_day - timedelta(days=(last_day.weekday() - weekday) % 7)
+
+
+@lru_cache(maxsize=1024)
+def compile_rule(meet_day: str, meet_frequency: str, meet_time: str, starts_on: str | None = None) -> RecurrenceRule:
+    """
+    **Parses a campaign's schedule text into a `RecurrenceRule`.**
+
+    **Why This Function Exists:**
+    - Schedules are entered as text (`"Mondays"`, `"Bi-weekly"`, `"First Friday of the Month"`,
+      `"7:00 PM"`), so nothing could list the sessions on a given day.
+
+    **Implementation Decisions:**
+    - Cached, so each distinct schedule is parsed once per process however often sessions are listed.
+    - The frequency may name the weekday itself ("First Friday of the Month"); it must agree with `meet_day`.
+
+    **Parameters:**
+    - `meet_day` (str): Weekday, singular or plural, e.g. `"Saturdays"`.
+    - `meet_frequency` (str): `"weekly"`, `"bi-weekly"`/`"every other week"`, `"monthly"` or
+      `"<first|second|third|fourth|last> <weekday> of the month"`.
+    - `meet_time` (str): Start time such as `"7:00 PM"`.
+    - `starts_on` (str | None): ISO date of the first session; bi-weekly rules count weeks from it.
+
+    **Returns:**
+    - `RecurrenceRule`: The compiled schedule.
+
+    **Raises:**
+    - `ValueError`: If any part of the schedule cannot be read.
+    """
+    day_text = meet_day.strip().lower().rstrip("s")
+    if day_text not in WEEKDAYS:
+        raise ValueError(f"Unknown meeting day '{meet_day}'")
+    weekday = WEEKDAYS.index(day_text)
+
+    frequency = " ".join(meet_frequency.lower().replace("-", " ").split())
+    interval_weeks, nth = 1, 0
+    monthly = re.fullmatch(r"(first|second|third|fourth|last) (\w+?)s? of (the|each|every) month", frequency)
+    if monthly:
+        if monthly.group(2) != day_text:
+            raise ValueError(f"Frequency '{meet_frequency}' does not match meeting day '{meet_day}'")
+        nth = ORDINALS[monthly.group(1)]
+    elif frequency == "monthly":
+        nth = 1
+    elif frequency in ("bi weekly", "biweekly", "every other week", "fortnightly"):
+        interval_weeks = 2
+    elif frequency not in ("weekly", "every week"):
+        raise ValueError(f"Unknown meeting frequency '{meet_frequency}'")
+
+    try:
+        start_time = datetime.strptime(meet_time.strip().upper(), "%I:%M %p").time()
+        first_day = date.fromisoformat(starts_on) if starts_on else WEEK_ZERO
+    except ValueError as error:
+        raise ValueError(f"Unreadable time '{meet_time}' or start date '{starts_on}': {error}") from None
+
+    return RecurrenceRule(weekday, interval_weeks, nth, start_time, first_day)
+
+
+class CampaignSchedule:
+    """
+    **CampaignSchedule Class**
+
+    **Class Purpose:**
+    - Answers "which campaign sessions are on between these dates?" and finds sessions that
+      clash over the same host or table.
+
+    **Why This Class Exists:**
+    - Campaigns only store their schedule as text, so sessions had to be worked out by hand.
+
+    **Implementation Decisions:**
+    - Every campaign's rule is compiled once when the schedule is loaded; listing sessions merges
+      the campaigns' lazy generators in time order, so only the sessions asked for are created.
+    - Clashes are found with one `IntervalIndex` per host and per table: each session is checked
+      against the sessions already placed on its host and table, never against every campaign.
+    - Campaigns whose schedule cannot be read are skipped with a warning (listed in `unreadable`).
+    """
+
+    def __init__(self, db_path=database.DB_PATH):
+        """ Loads every campaign and compiles its schedule. """
+        self.db_path = db_path  # Assigns the database path to a variable for easier connections.
+        self.rules = []  # (name, host, table, RecurrenceRule)
+        self.unreadable = []  # Names of campaigns whose schedule could not be parsed
+        self.load()
+
+    def load(self) -> None:
+        """ (Re)reads the campaigns from the database. """
+        conn = database.connect(self.db_path)
+        rows = conn.execute("""
+            SELECT e.name, d.host, d.table_number, d.meet_day, d.meet_frequency, e.time, d.starts_on
+            FROM events e JOIN campaign_details d ON d.event_id = e.id
+            ORDER BY e.name
+        """).fetchall()
+        conn.close()
+
+        self.rules, self.unreadable = [], []
+        for name, host, table, meet_day, meet_frequency, meet_time, starts_on in rows:
+            try:
+                self.rules.append((name, host, table, compile_rule(meet_day, meet_frequency, meet_time, starts_on)))
+            except ValueError as error:
+                logger.warning("unreadable campaign schedule campaign=%s error=%s", name, error)
+                self.unreadable.append(name)
+
+    def sessions(self, start: datetime, end: datetime):
+        """
+        **Lazily yields every `Session` starting in `[start, end)`, earliest first.**
+
+        - Sessions starting at the same moment come out in campaign name order.
+        """
+        length = timedelta(hours=SESSION_HOURS)
+
+        def campaign_sessions(name, host, table, rule):
+            for session_start in rule.occurrences(start, end):
+                yield Session(name, host, table, session_start, session_start + length)
+
+        return heapq.merge(
+            *(campaign_sessions(*entry) for entry in self.rules),
+            key=lambda session: session.starts_at,
+        )
+
+    def sessions_on(self, day: date) -> list:
+        """ Returns the sessions starting on `day`, e.g. `sessions_on(date(2025, 3, 11))` for one Tuesday. """
+        start = datetime.combine(day, time.min)
+        return list(self.sessions(start, start + timedelta(days=1)))
+
+    def conflicts(self, start: datetime, end: datetime) -> list:
+        """
+        **Finds sessions in `[start, end)` that overlap another session with the same host or table.**
+
+        **Returns:**
+        - `list[tuple[str, Session, Session]]`: `(reason, earlier, later)` where reason is
+          `"host"` or `"table"`, in the order the later session starts.
+        """
+        by_host, by_table = {}, {}
+        clashes = []
+        for session in self.sessions(start, end):
+            resources = [("host", by_host, session.host)]
+            if session.table is not None:
+                resources.append(("table", by_table, session.table))
+            for reason, indexes, key in resources:
+                index = indexes.setdefault(key, IntervalIndex())
+                for _, _, other in index.overlapping(session.starts_at, session.ends_at):
+                    clashes.append((reason, other, session))
+                index.add(session.starts_at, session.ends_at, session)
+        return clashes
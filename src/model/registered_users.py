@@ -0,0 +1,140 @@
+import difflib
+from model import database
+
+SUGGESTION_LIMIT = 8  # Suggestions shown under the gamertag box
+FUZZY_CANDIDATES = 50  # Trigram matches re-ranked by similarity for typo suggestions
+
+
+class RegisteredUsers:
+    """
+    **RegisteredUsers Class**
+
+    **Class Purpose:**
+    - Reads and writes cafe members in the `registered_users` table.
+
+    **Why This Class Exists:**
+    - Registration used to open its own connection with no busy timeout, so a kiosk writing
+      at the same time as another raised "database is locked" straight into the GUI.
+    - Keeps database logic out of the `Registration` form.
+    """
+
+    def __init__(self, db_path=database.DB_PATH):
+        """ Initializes the RegisteredUsers class and defines the database path. """
+        self.db_path = db_path  # Assigns the database path to a variable for easier connections.
+
+    def gamertag_or_email_exists(self, gamertag: str, email: str) -> bool:
+        """
+        **Checks if a gamertag or email already exists in the database.**
+
+        **Returns:**
+        - `bool`: `True` if a matching record exists, otherwise `False`.
+        """
+        conn = database.connect(self.db_path)
+        row = conn.execute("SELECT 1 FROM registered_users WHERE gamertag = ? OR email = ?", (gamertag, email)).fetchone()
+        conn.close()
+        return row is not None
+
+    def add_user(self, fname: str, lname: str, gamertag: str, email: str) -> int:
+        """
+        **Stores a new registered user.**
+
+        **Implementation Decisions:**
+        - Runs through `database.write()`, so a locked database is waited on and retried.
+
+        **Returns:**
+        - `int`: The new user's id.
+        """
+        def insert(conn):
+            cursor = conn.execute(
+                "INSERT INTO registered_users (gamertag, fname, lname, email) VALUES (?, ?, ?, ?)",
+                (gamertag, fname, lname, email)
+            )
+            return cursor.lastrowid
+
+        return database.write(insert, self.db_path)
+
+    def suggest_gamertags(self, text: str, limit: int = SUGGESTION_LIMIT) -> list[str]:
+        """
+        **Suggests registered gamertags for partially typed or mistyped input.**
+
+        **Why This Function Exists:**
+        - Sign-up used to require the exact gamertag; a single typo sent the player to the back of the line.
+
+        **Implementation Decisions:**
+        - Prefix matches come first, found with a range scan on the `COLLATE NOCASE` index.
+        - If there are too few, a trigram full-text query finds gamertags that still contain most of
+          the input despite a typo, and `difflib` ranks those candidates by similarity.
+        - Both queries are bounded by `LIMIT`, so cost does not grow with the number of members.
+
+        **Parameters:**
+        - `text` (str): What the user has typed so far.
+        - `limit` (int): Maximum number of suggestions.
+
+        **Returns:**
+        - `list[str]`: Gamertags, best matches first.
+
+        **Step-by-Step Explanation:**
+        1️⃣ **Step 1 - Prefix Matches**
+           - `gamertag >= text AND gamertag < text + U+10FFFF` (case-insensitive) walks the index in order.
+
+        2️⃣ **Step 2 - Fuzzy Matches**
+           - For inputs of three or more characters, runs a trigram FTS5 query built by `_fuzzy_query()`.
+           - Candidates are sorted by similarity ratio and appended after the prefix matches.
+        """
+        text = text.strip()
+        if not text:
+            return []
+
+        conn = database.connect(self.db_path)
+        try:
+            # Step 1: Case-insensitive prefix range scan
+            suggestions = [row[0] for row in conn.execute("""
+                SELECT gamertag FROM registered_users
+                WHERE gamertag >= ? COLLATE NOCASE AND gamertag < ? COLLATE NOCASE
+                ORDER BY gamertag COLLATE NOCASE
+                LIMIT ?
+            """, (text, text + "\U0010ffff", limit))]
+
+            # Step 2: Trigram candidates re-ranked by similarity
+            if len(suggestions) < limit and len(text) >= 3:
+                candidates = [row[0] for row in conn.execute("""
+                    SELECT gamertag FROM registered_users_fts
+                    WHERE registered_users_fts MATCH ?
+                    LIMIT ?
+                """, (self._fuzzy_query(text), FUZZY_CANDIDATES))]
+
+                seen = set(suggestions)
+                lowered = text.lower()
+                candidates = [tag for tag in candidates if tag not in seen]
+                candidates.sort(key=lambda tag: difflib.SequenceMatcher(None, lowered, tag.lower()).ratio(), reverse=True)
+                suggestions += candidates[:limit - len(suggestions)]
+        finally:
+            conn.close()
+
+        return suggestions
+
+    def _fuzzy_query(self, text: str) -> str:
+        """
+        **Builds an FTS5 trigram query that tolerates one typo in `text`.**
+
+        **Implementation Decisions:**
+        - The input is cut into up to three segments of at least three characters; a quoted segment
+          matches as a substring.
+        - A single typo breaks at most one segment, so with three segments the query asks for any two
+          of them (`(A AND B) OR (A AND C) OR (B AND C)`). Pairs are selective, which keeps the
+          query fast without `ORDER BY rank` over hundreds of thousands of members.
+        - Shorter inputs fall back to either of two segments (six to eight characters) or to the
+          first or last trigram (three to five characters).
+        """
+        if len(text) < 6:
+            segments = list(dict.fromkeys([text[:3], text[-3:]]))  # First and last trigram (one if they coincide)
+        else:
+            count = min(3, len(text) // 3)  # Number of segments, each at least 3 characters
+            size = len(text) // count
+            segments = [text[i * size:(i + 1) * size if i < count - 1 else len(text)] for i in range(count)]
+        quoted = ['"' + segment.replace('"', '""') + '"' for segment in segments]
+
+        if len(quoted) == 3:
+            a, b, c = quoted
+            return f"({a} AND {b}) OR ({a} AND {c}) OR ({b} AND {c})"
+        return " OR ".join(quoted)
@@ -0,0 +1,79 @@
+"""
+**Seeding Module - Standard Seed-Order Brackets for Any Field Size**
+
+**Purpose:**
+- Orders a tournament field by manual seed and rating, and lays it out in standard bracket order.
+
+**Why This File Exists:**
+- Brackets were built straight from sign-up order and padded to `max_players`, so the two best
+  players could meet in round one, and any field that was not a power of two broke the bracket.
+
+**Implementation Decisions:**
+- The bracket size is the next power of two; the missing seats are byes. Byes are the lowest
+  "seeds", so standard order pairs them with the top seeds.
+- Standard order (1 v 16, 8 v 9, 5 v 12, ...) keeps seeds 1 and 2 apart until the final. It is
+  built by mirroring: each seed `s` of the half-size order becomes `s, size + 1 - s`.
+- Seed-position tables are cached per bracket size, so laying out a field is one pass over it.
+- Player-agnostic: works on any ids; `model/tournament.py` supplies its own bye sentinel.
+"""
+
+from functools import lru_cache
+
+
+def bracket_size(field_size: int) -> int:
+    """ Returns the smallest power of two that seats `field_size` players (at least 2). """
+    return 1 << max(field_size - 1, 1).bit_length()
+
+
+@lru_cache(maxsize=None)
+def seed_positions(size: int) -> tuple[int, ...]:
+    """
+    **Returns the seed (1-based) in each bracket slot, top to bottom, for a power-of-two `size`.**
+
+    - Slots `2k` and `2k + 1` meet in round one, e.g. `seed_positions(8)` is `(1, 8, 4, 5, 2, 7, 3, 6)`.
+
+    **Raises:**
+    - `ValueError`: If `size` is not a power of two of at least 2.
+    """
+    if size < 2 or size & (size - 1):
+        raise ValueError(f"Bracket size must be a power of two, got {size}")
+    order = [1]
+    while len(order) < size:
+        mirror = 2 * len(order) + 1  # Seeds that meet in the first round add up to this
+        order = [slot for seed in order for slot in (seed, mirror - seed)]
+    return tuple(order)
+
+
+def seed_order(players: list, ratings: dict = None, manual_seeds: dict = None) -> list:
+    """
+    **Sorts players best seed first.**
+
+    - Players with a manual seed come first, by seed number; then rated players, highest rating
+      first; then everyone else. Ties keep the order players were given in (sign-up order).
+
+    **Parameters:**
+    - `players` (list): Player ids.
+    - `ratings` (dict | None): Player id -> rating.
+    - `manual_seeds` (dict | None): Player id -> seed set by staff (1 = top seed).
+    """
+    ratings = ratings or {}
+    manual_seeds = manual_seeds or {}
+    return sorted(players, key=lambda player: (
+        player not in manual_seeds, manual_seeds.get(player, 0),
+        player not in ratings, -ratings.get(player, 0),
+    ))
+
+
+def bracket_slots(seeded: list, empty) -> list:
+    """
+    **Places a seeded field into bracket slots; first-round matches are slot pairs `(0, 1)`, `(2, 3)`, ...**
+
+    **Parameters:**
+    - `seeded` (list): Players best seed first (see `seed_order()`).
+    - `empty`: Value used for the seats nobody fills (the bye).
+
+    **Returns:**
+    - `list`: `bracket_size(len(seeded))` entries.
+    """
+    field = len(seeded)
+    return [seeded[seed - 1] if seed <= field else empty for seed in seed_positions(bracket_size(field))]
@@ -0,0 +1,133 @@
+"""
+**Stall Watchdog Module**
+
+**Purpose:**
+- Notices when the GUI thread stops processing events and records *where* it was stuck.
+
+**Why This File Exists:**
+- Kiosks "hang for a few seconds" and nobody could say where; by the time anyone looks, the
+  freeze is over and nothing in the logs points at the cause.
+
+**Implementation Decisions:**
+- The GUI thread calls `beat()` from a repeating timer. A watchdog thread checks how long ago
+  the last beat was; while it is overdue by more than the threshold, the watchdog samples the
+  main thread's Python stack with `sys._current_frames()`.
+- When beats resume, the stall is logged once with its length and the stack seen most often
+  while it lasted (the code that was actually holding the thread), and recorded as
+  `event_loop.stall` in the diagnostics window.
+- The threshold comes from `$GAME_CAFE_STALL_MS` (default 500 ms); `0` turns the watchdog off.
+- Qt-free: the heartbeat timer lives in `main.py`, so this module can watch any loop.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from model.instrumentation import record
+
+logger = logging.getLogger(__name__)
+
+STALL_MS_ENV = "GAME_CAFE_STALL_MS"  # Threshold override, in milliseconds
+DEFAULT_STALL_MS = 500  # A heartbeat this late counts as a stall
+HEARTBEAT_MS = 100  # How often the GUI thread should call beat()
+STACK_LIMIT = 30  # Innermost frames kept per sampled stack
+
+
+class StallWatchdog:
+    """
+    **StallWatchdog Class**
+
+    **Class Purpose:**
+    - Watches a heartbeat from the GUI thread and logs every stall longer than `threshold_ms`.
+
+    **Attributes:**
+    - `threshold_ms` (float): Lateness beyond the heartbeat interval that counts as a stall.
+    - `stalls` (list[dict]): The most recent stalls (`{"ms", "stack", "samples"}`), newest last.
+    """
+
+    def __init__(self, threshold_ms: float = DEFAULT_STALL_MS, heartbeat_ms: float = HEARTBEAT_MS):
+        """ Remembers the thread to watch (the caller's) and prepares the watchdog thread. """
+        self.threshold_ms = threshold_ms
+        self.heartbeat_ms = heartbeat_ms
+        self.watched_id = threading.get_ident()  # Created on the GUI thread, so that is the one watched
+        self.last_beat = time.monotonic()
+        self.stalls = []
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+
+    def start(self) -> None:
+        """ Starts the watchdog thread. """
+        self.last_beat = time.monotonic()
+        self.thread.start()
+
+    def stop(self) -> None:
+        """ Stops the watchdog thread. """
+        self.stop_event.set()
+
+    def beat(self) -> None:
+        """ Call from the watched thread's event loop every `heartbeat_ms`. """
+        self.last_beat = time.monotonic()  # A float assignment is atomic, no lock needed
+
+    def _watch(self) -> None:
+        """ Watchdog thread: samples the watched stack while a beat is overdue, reports when it resumes. """
+        check_every = max(self.threshold_ms / 4, 10) / 1000
+        samples = Counter()  # Stack text -> times seen during the current stall
+        stall_beat = None  # last_beat value when the current stall was detected
+
+        while not self.stop_event.wait(check_every):
+            beat = self.last_beat
+            late_ms = (time.monotonic() - beat) * 1000 - self.heartbeat_ms
+
+            if stall_beat is not None and beat != stall_beat:
+                self._report(beat, stall_beat, samples)  # Beats resumed: the stall is over
+                samples.clear()
+                stall_beat = None
+
+            if late_ms > self.threshold_ms:
+                stall_beat = beat
+                stack = self._watched_stack()
+                if stack:
+                    samples[stack] += 1
+
+    def _watched_stack(self) -> str:
+        """ Returns the watched thread's current Python stack as text, or "" if it has exited. """
+        frame = sys._current_frames().get(self.watched_id)
+        if frame is None:
+            return ""
+        return "".join(traceback.format_stack(frame, limit=STACK_LIMIT))
+
+    def _report(self, resumed_beat: float, stalled_beat: float, samples: Counter) -> None:
+        """ Logs and records one finished stall. """
+        stalled_ms = (resumed_beat - stalled_beat) * 1000
+        stack, count = samples.most_common(1)[0] if samples else ("(no stack captured)", 0)
+        record("event_loop.stall", stalled_ms)
+        logger.warning("event loop stalled ms=%.0f samples=%d stack:\n%s", stalled_ms, sum(samples.values()), stack)
+        self.stalls.append({"ms": round(stalled_ms, 1), "stack": stack, "samples": count})
+        del self.stalls[:-50]  # Keep the most recent stalls only
+
+
+def start_watchdog(threshold_ms: float = None):
+    """
+    **Creates and starts a watchdog for the calling thread, unless disabled.**
+
+    **Parameters:**
+    - `threshold_ms` (float | None): Defaults to `$GAME_CAFE_STALL_MS` or `DEFAULT_STALL_MS`.
+
+    **Returns:**
+    - `StallWatchdog | None`: The running watchdog (call its `beat()` every `HEARTBEAT_MS`),
+      or `None` if the threshold is `0`.
+    """
+    if threshold_ms is None:
+        try:
+            threshold_ms = float(os.environ.get(STALL_MS_ENV, DEFAULT_STALL_MS))
+        except ValueError:
+            logger.warning("ignoring invalid %s=%r", STALL_MS_ENV, os.environ[STALL_MS_ENV])
+            threshold_ms = DEFAULT_STALL_MS
+    if threshold_ms <= 0:
+        return None
+    watchdog = StallWatchdog(threshold_ms)
+    watchdog.start()
+    return watchdog
@@ -0,0 +1,266 @@
+"""
+**Table Allocator Module - Physical Tables and Stations for Concurrent Events**
+
+**Purpose:**
+- Assigns the cafe's tables and gaming stations to tournament matches and campaign sessions
+  so that events running at the same time never share one.
+
+**Why This File Exists:**
+- Round robin numbered tables `match % 2`, other formats had no tables at all, and a
+  tournament and a campaign on the same evening could both be told to use table 1.
+
+**Implementation Decisions:**
+- Tables and stations live in the `cafe_tables` table, so staff can change the floor plan
+  without touching code. Events for a game tagged "video game" use stations, everything else tables.
+- Each table's bookings are kept in an `IntervalIndex` (`model/intervals.py`), an interval
+  tree: "is table 3 free from 19:00 to 23:00?" stays O(log n) however full the day is.
+- A `TablePlan` books one day in a fixed order, so every kiosk works out the same assignment:
+  campaigns that already have a `table_number` first, then tournaments by start time, then
+  the other campaign sessions.
+- A tournament reserves one table per two seats (`max_players // 2`) for its whole run, so
+  its tables do not move when sign-ups change. Every round reuses those tables.
+- Tournaments get the smallest suitable tables first, which leaves the big ones for campaigns.
+- Anything that does not fit is listed in `shortfalls` instead of being double-booked.
+- `tables_for_event()` runs whenever a bracket opens, so it reuses the day's plan until
+  `PRAGMA data_version` shows another connection committed; any commit clears the cache, which
+  errs on the side of rebuilding rather than tracking which tables a plan read.
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import NamedTuple
+from model import database
+from model.current_events import MAX_EVENT_HOURS, TIMESTAMP_FORMAT
+from model.intervals import IntervalIndex
+from model.recurrence import SESSION_HOURS, CampaignSchedule
+
+logger = logging.getLogger(__name__)
+
+VIDEO_GAME_TAG = "video game"  # Games with this tag are played at stations
+SEATS_PER_MATCH = 2  # Tournament matches are one on one
+
+
+class CafeTable(NamedTuple):
+    """ One physical table or gaming station. """
+    number: int  # Number shown to players
+    kind: str  # 'table' or 'station'
+    seats: int
+
+
+def load_tables(db_path: str = database.DB_PATH) -> list:
+    """ Returns every `CafeTable`, by number. """
+    conn = database.connect(db_path)
+    rows = conn.execute("SELECT number, kind, seats FROM cafe_tables ORDER BY number").fetchall()
+    conn.close()
+    return [CafeTable(*row) for row in rows]
+
+
+class TableAllocator:
+    """
+    **TableAllocator Class**
+
+    **Class Purpose:**
+    - Tracks when each table is booked and hands out free tables for a time range.
+
+    **Attributes:**
+    - `tables` (tuple[CafeTable]): The floor plan, by number.
+    - `occupancy` (dict[int, IntervalIndex]): Bookings per table number; items are event names.
+    """
+
+    def __init__(self, tables: list):
+        """ Starts with every table free. """
+        self.tables = tuple(sorted(tables))
+        self.occupancy = {table.number: IntervalIndex() for table in self.tables}
+
+    def is_free(self, number: int, start: datetime, end: datetime) -> bool:
+        """ Returns True if table `number` exists and has no booking overlapping `[start, end)`. """
+        index = self.occupancy.get(number)
+        return index is not None and not index.overlapping(start, end)
+
+    def free_tables(self, start: datetime, end: datetime, kind: str = None, seats: int = 0) -> list:
+        """ Returns the tables (of `kind`, with at least `seats` seats) free for all of `[start, end)`, smallest first. """
+        candidates = [
+            table for table in self.tables
+            if (kind is None or table.kind == kind) and table.seats >= seats and self.is_free(table.number, start, end)
+        ]
+        return sorted(candidates, key=lambda table: (table.seats, table.number))
+
+    def book(self, number: int, start: datetime, end: datetime, item) -> None:
+        """
+        **Books table `number` for `[start, end)`.**
+
+        **Raises:**
+        - `ValueError`: If the table does not exist or is already booked for part of that time.
+        """
+        if number not in self.occupancy:
+            raise ValueError(f"There is no table {number}")
+        clashes = self.occupancy[number].overlapping(start, end)
+        if clashes:
+            raise ValueError(f"Table {number} is already booked for {clashes[0][2]}")
+        self.occupancy[number].add(start, end, item)
+
+    def allocate(self, start: datetime, end: datetime, item, count: int = 1, kind: str = None, seats: int = 0) -> list:
+        """
+        **Books up to `count` free tables for `[start, end)`.**
+
+        **Returns:**
+        - `list[int]`: The table numbers booked, possibly fewer than `count` if the cafe is full.
+        """
+        chosen = [table.number for table in self.free_tables(start, end, kind, seats)[:count]]
+        for number in chosen:
+            self.occupancy[number].add(start, end, item)
+        return chosen
+
+
+class TablePlan:
+    """
+    **TablePlan Class**
+
+    **Class Purpose:**
+    - Works out the table for every tournament and campaign session in a time window.
+
+    **Attributes:**
+    - `allocator` (TableAllocator): Every booking made, for free-table questions afterwards.
+    - `tournaments` (dict[str, tuple[int]]): Tournament name -> tables reserved for it.
+    - `sessions` (dict[tuple[str, datetime], int]): `(campaign, session start)` -> table.
+    - `shortfalls` (list[str]): Events that could not get (all) the tables they need, and why.
+    """
+
+    def __init__(self, db_path: str, start: datetime, end: datetime):
+        """ Books every event overlapping `[start, end)`. """
+        self.db_path = db_path  # Assigns the database path to a variable for easier connections.
+        self.allocator = TableAllocator(load_tables(db_path))
+        self.tournaments = {}
+        self.sessions = {}
+        self.shortfalls = []
+        self.build(start, end)
+
+    @classmethod
+    def for_day(cls, db_path: str, day: date) -> "TablePlan":
+        """ Returns the plan for one calendar day. """
+        start = datetime.combine(day, time.min)
+        return cls(db_path, start, start + timedelta(days=1))
+
+    def build(self, start: datetime, end: datetime) -> None:
+        """
+        **Books the window's events in a fixed order.**
+
+        **Step-by-Step Explanation:**
+        1️⃣ **Step 1 - Read the Events**
+           - Tournaments overlapping the window (a range scan on `idx_events_starts`), campaign
+             seat counts, and which games are played at stations.
+
+        2️⃣ **Step 2 - Campaigns With a Fixed Table**
+           - Booked first; a clash with another fixed campaign is reported, not moved.
+
+        3️⃣ **Step 3 - Tournaments, by Start Time**
+           - Each reserves `max_players // 2` two-seat tables for its whole run.
+
+        4️⃣ **Step 4 - Other Campaign Sessions**
+           - Each gets the smallest free table that seats everyone.
+        """
+        # Step 1: Read the events
+        conn = database.connect(self.db_path)
+        tournaments = conn.execute("""
+            SELECT name, game_type, max_players, starts_at, ends_at FROM events
+            WHERE kind = 'tournament' AND starts_at >= ? AND starts_at < ? AND ends_at > ?
+            ORDER BY starts_at, name
+        """, (
+            (start - timedelta(hours=MAX_EVENT_HOURS)).strftime(TIMESTAMP_FORMAT),  # Nothing earlier can still be running
+            end.strftime(TIMESTAMP_FORMAT), start.strftime(TIMESTAMP_FORMAT),
+        )).fetchall()
+        campaigns = {name: (game_type, seats) for name, game_type, seats in conn.execute(
+            "SELECT name, game_type, max_players FROM events WHERE kind = 'campaign'"
+        )}
+        video_games = {title for (title,) in conn.execute("SELECT title FROM game_tags WHERE tag = ?", (VIDEO_GAME_TAG,))}
+        conn.close()
+
+        def kind_for(game_type):
+            return "station" if game_type in video_games else "table"
+
+        sessions = [
+            session for session in CampaignSchedule(self.db_path).sessions(start - timedelta(hours=SESSION_HOURS), end)
+            if session.ends_at > start  # Include sessions that started before the window but are still running
+        ]
+
+        # Step 2: Campaigns that already have a table
+        for session in sessions:
+            if session.table is None:
+                continue
+            try:
+                self.allocator.book(session.table, session.starts_at, session.ends_at, session.campaign)
+                self.sessions[(session.campaign, session.starts_at)] = session.table
+            except ValueError as error:
+                self.shortfalls.append(f"{session.campaign} ({session.starts_at:%m-%d %H:%M}): {error}")
+
+        # Step 3: Tournaments, earliest first
+        for name, game_type, max_players, starts_at, ends_at in tournaments:
+            needed = max(1, max_players // SEATS_PER_MATCH)
+            tables = self.allocator.allocate(
+                datetime.strptime(starts_at, TIMESTAMP_FORMAT), datetime.strptime(ends_at, TIMESTAMP_FORMAT),
+                name, needed, kind_for(game_type), SEATS_PER_MATCH,
+            )
+            self.tournaments[name] = tuple(tables)
+            if len(tables) < needed:
+                self.shortfalls.append(f"{name}: needs {needed} {kind_for(game_type)}s, {len(tables)} free")
+
+        # Step 4: Campaign sessions without a fixed table
+        for session in sessions:
+            if session.table is not None:
+                continue
+            game_type, seats = campaigns.get(session.campaign, (None, 0))
+            tables = self.allocator.allocate(session.starts_at, session.ends_at, session.campaign, 1, kind_for(game_type), seats)
+            if tables:
+                self.sessions[(session.campaign, session.starts_at)] = tables[0]
+            else:
+                self.shortfalls.append(f"{session.campaign} ({session.starts_at:%m-%d %H:%M}): no free table for {seats}")
+
+        if self.shortfalls:
+            logger.warning("table plan incomplete start=%s shortfalls=%d", start, len(self.shortfalls))
+
+
+class _DayPlanCache:
+    """ Day plans per database, kept while nothing has been committed since they were built. """
+
+    def __init__(self):
+        """ Starts empty; a version connection is opened per database on first use. """
+        self.lock = threading.Lock()  # Guards the connections and the plans (brackets load on worker threads)
+        self.version_conns = {}  # db_path -> connection kept open: data_version is tracked per connection
+        self.plans = {}  # db_path -> (data_version, {day: TablePlan})
+
+    def data_version(self, db_path: str) -> int:
+        """ Returns the counter SQLite bumps whenever another connection commits to `db_path`. """
+        with self.lock:
+            conn = self.version_conns.get(db_path)
+            if conn is None:
+                conn = self.version_conns[db_path] = sqlite3.connect(db_path, check_same_thread=False)
+            return conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def for_day(self, db_path: str, day: date) -> TablePlan:
+        """ Returns the cached plan for `day`, building it if the database changed since. """
+        version = self.data_version(db_path)  # Read before building: a commit during the build is seen next time
+        with self.lock:
+            cached_version, plans = self.plans.get(db_path, (None, {}))
+            if cached_version == version and day in plans:
+                return plans[day]
+        plan = TablePlan.for_day(db_path, day)  # Built outside the lock; a rare duplicate build is harmless
+        with self.lock:
+            cached_version, plans = self.plans.get(db_path, (None, {}))
+            if cached_version != version:
+                plans = {}  # Older plans are stale
+            plans[day] = plan
+            self.plans[db_path] = (version, plans)
+        return plan
+
+
+_day_plans = _DayPlanCache()
+
+
+def tables_for_event(event: dict, db_path: str = database.DB_PATH) -> tuple:
+    """ Returns the tables planned for a tournament dictionary from `CurrentEvents` (empty without a start time). """
+    if not event.get("starts_at"):
+        return ()
+    day = datetime.strptime(event["starts_at"], TIMESTAMP_FORMAT).date()
+    return _day_plans.for_day(db_path, day).tournaments.get(event["name"], ())
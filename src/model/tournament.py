@@ -1,5 +1,16 @@
-import sqlite3
-import math
+import logging
+from model import database
+from model.instrumentation import Timed
+from model.seeding import bracket_slots, seed_order
+from model.table_allocator import tables_for_event
+
+logger = logging.getLogger(__name__)
+
+# Sentinel player ids for bracket slots that are not real players (real ids are registered_users.id, 1 and up)
+OPEN_SLOT = 0  # Seat nobody signed up for
+BYE = -1  # Automatic pass for the opponent (empty seats in a bracket, odd round-robin fields)
+TBD = -2  # Decided by an earlier match
+SENTINEL_NAMES = {OPEN_SLOT: "Open Slot", BYE: "BYE", TBD: "TBD"}
 
 class Tournament:
     """
@@ -14,16 +25,37 @@ class Tournament:
     - Provides a **common structure** for all tournament types.
     - Eliminates redundant code by defining **shared functionality**.
     - Ensures **players are correctly loaded** from the database at initialization.
+
+    **Implementation Decisions:**
+    - Players are stored as integer ids (`registered_users.id`) everywhere in the bracket; byes,
+      open slots and undecided slots are the sentinel ids `BYE`, `OPEN_SLOT` and `TBD`.
+    - `self.gamertags` is the one id -> gamertag table, used only when a bracket is displayed
+      (`display_name()`, `named_rounds()`), so comparing, storing and copying brackets only
+      touches small integers.
+    - Matches are spread over `self.tables`, the tables the cafe's `TablePlan` reserved for this
+      tournament, so concurrent events never share one (`"table"` is `None` without a plan).
+    - Elimination brackets are seeded (`model/seeding.py`): manual seeds from `event_signup.seed`
+      first, then ratings (`player_ratings`, unless `ratings` is passed in), then sign-up order.
     """
     
-    def __init__(self, name: str, max_players: int):
+
+    advances_winners = True  # Elimination formats move each match winner into the next round
+
+    def __init__(self, name: str, max_players: int, db_path: str = database.DB_PATH, ratings: dict = None, tables=()):
         """ Initializes the Tournament class. """
         self.name = name  # Store tournament name
         self.max_players = max_players  # Store max number of players
-        self.players = self.load_registered_players()  # Fetch registered players from database
+        self.db_path = db_path  # Database the sign-ups are read from
+        self.ratings = dict(ratings) if ratings is not None else None  # Player id -> rating for seeding (None: read from player_ratings)
+        self.tables = tuple(tables)  # Table numbers reserved for this tournament (see model/table_allocator.py)
+        self.gamertags = dict(SENTINEL_NAMES)  # Player id -> gamertag, filled by load_registered_players()
+        self.seeds = {}  # Player id -> manual seed, filled by load_registered_players()
+        self.checkin_closed = False  # True once check-in has closed and the field is final (see model/checkin.py)
+        self.players = self.load_registered_players()  # Fetch registered player ids from database
         self.rounds = []  # Initialize rounds list
     
-    def load_registered_players(self) -> list[str]:
+    @Timed()
+    def load_registered_players(self) -> list[int]:
         """
         **Fetches players signed up for this tournament from the database.**
         
@@ -33,42 +65,262 @@ class Tournament:
         
         **Implementation Decisions:**
         - Uses a **JOIN query** to match signed-up players with their gamertags.
-        - Stores player gamertags in a **list** for easy access.
+        - Keeps the player **ids** for the bracket and records each gamertag once in `self.gamertags`,
+          any manual seed in `self.seeds`, and (unless ratings were passed in) each stored rating
+          in `self.ratings`.
+        - Players are returned in sign-up order. Once check-in has closed, every player's seed is
+          their seat instead: players are returned by seed, with `OPEN_SLOT` where a no-show was
+          not replaced, so one missing player never moves anyone else.
         - Uses **parameterized queries** to prevent **SQL injection**.
         
         **Returns:**
-        - `list[str]`: A list of gamertags of registered players.
+        - `list[int]`: The `registered_users.id` of each registered player.
         
         **Step-by-Step Explanation:**
         1️⃣ **Step 1 - Establish Database Connection**
            - Connects to the SQLite database.
         
         2️⃣ **Step 2 - Execute SQL Query**
-           - Retrieves gamertags of players who signed up for this tournament.
+           - Retrieves ids and gamertags of players who signed up for this tournament.
         
         3️⃣ **Step 3 - Process Query Results**
-           - Converts query results into a **list of gamertags**.
+           - Converts query results into a **list of ids** and fills the gamertag lookup.
         
         4️⃣ **Step 4 - Close Database Connection**
            - Ensures database resources are properly released.
         
         5️⃣ **Step 5 - Return Player List**
-           - Returns the list of registered players.
+           - Returns the list of registered player ids.
         """
-        conn = sqlite3.connect("src/game_cafe.db")  # Step 1: Connect to database
+        conn = database.connect(self.db_path)  # Step 1: Connect to database (applying any pending migrations)
         cursor = conn.cursor()  # Create a cursor to execute SQL commands
 
         cursor.execute("""
-            SELECT registered_users.gamertag 
+            SELECT registered_users.id, registered_users.gamertag, event_signup.seed, player_ratings.rating
             FROM event_signup 
             JOIN registered_users ON event_signup.gamertag = registered_users.id 
+            LEFT JOIN player_ratings ON player_ratings.player_id = registered_users.id
             WHERE event_signup.event_name = ?
+            ORDER BY event_signup.id
         """, (self.name,))  # Step 2: Retrieve players who signed up for this tournament
         
-        players = [row[0] for row in cursor.fetchall()]  # Step 3: Extract gamertags into a list
+        rows = cursor.fetchall()
+        closed = cursor.execute("""
+            SELECT tournament_details.checkin_closed_at
+            FROM events JOIN tournament_details ON tournament_details.event_id = events.id
+            WHERE events.name = ?
+        """, (self.name,)).fetchone()
+        self.checkin_closed = bool(closed and closed[0])
         conn.close()  # Step 4: Close the database connection
-        
-        return players if players else []  # Step 5: Return player list (empty list if no players)
+
+        stored_ratings = self.ratings is None
+        if stored_ratings:
+            self.ratings = {}
+        for player_id, gamertag, seed, rating in rows:  # Step 3: Remember each gamertag once, for display
+            self.gamertags[player_id] = gamertag
+            if seed is not None:
+                self.seeds[player_id] = seed
+            if stored_ratings and rating is not None:
+                self.ratings[player_id] = rating
+        if self.checkin_closed:  # Seats were fixed at check-in: seed n sits in seat n
+            by_seat = {seed: player_id for player_id, _, seed, _ in rows if seed is not None}
+            late = [player_id for player_id, _, seed, _ in rows if seed is None]  # Added by staff after closing
+            return [by_seat.get(seat, OPEN_SLOT) for seat in range(1, max(by_seat, default=0) + 1)] + late
+        return [player_id for player_id, _, _, _ in rows]  # Step 5: Return player ids (empty list if no players)
+
+    def display_name(self, player_id: int) -> str:
+        """ Returns the gamertag (or placeholder text) shown for a player id. """
+        return self.gamertags.get(player_id, "Unknown Player")
+
+    def player_id(self, gamertag: str):
+        """ Returns the id of a player in this tournament by gamertag, or `None` if they are not in it. """
+        for player_id, name in self.gamertags.items():
+            if player_id > 0 and name == gamertag:
+                return player_id
+        return None
+
+    def pending_label(self, round_number: int, match_number: int, key: str) -> str:
+        """ Names the match that decides an undecided (`TBD`) slot, e.g. `"Winner of Match 3"`. """
+        feeder = 2 * match_number - (1 if key == "p1" else 0)  # Matches 2m-1 and 2m feed match m
+        return f"Winner of Match {feeder}"
+
+    def named_rounds(self) -> list[list[dict]]:
+        """
+        **Returns the bracket with every player id replaced by its display text.**
+
+        - Used by windows, the command line and the API; the tournament itself keeps the ids.
+
+        **Returns:**
+        - `list[list[dict]]`: Same shape as `self.rounds`; undecided winners stay `None`.
+        """
+        named = []
+        for round_number, matches in enumerate(self.rounds, start=1):
+            named_round = []
+            for match_number, match in enumerate(matches, start=1):
+                named_match = dict(match)
+                for key in ("p1", "p2"):
+                    if match[key] == TBD:
+                        named_match[key] = self.pending_label(round_number, match_number, key)
+                    else:
+                        named_match[key] = self.display_name(match[key])
+                for key in ("winner", "loser"):
+                    if match.get(key) is not None:
+                        named_match[key] = self.display_name(match[key])
+                named_round.append(named_match)
+            named.append(named_round)
+        return named
+
+    def seeded_slots(self) -> list[int]:
+        """
+        **Returns the first-round bracket slots: the seeded field in standard order, byes in the empty seats.**
+
+        - Open slots (seats nobody has signed up for yet) are seeded below every player.
+        - After check-in has closed, players are already in seat order and nobody else is coming,
+          so every empty seat is a bye.
+        - Pairs of slots `(0, 1)`, `(2, 3)`, ... are the first-round matches.
+        """
+        if self.checkin_closed:
+            return bracket_slots([player if player > 0 else BYE for player in self.players], BYE)
+        real = [player for player in self.players if player > 0]
+        open_slots = [player for player in self.players if player <= 0]
+        return bracket_slots(seed_order(real, self.ratings, self.seeds) + open_slots, BYE)
+
+    def frozen_seeds(self) -> dict:
+        """
+        **Returns a seed for every player without a manual one that keeps the current seed order.**
+
+        - Stored when the first result comes in, so later rating changes cannot reshuffle a bracket
+          that is already being played.
+        """
+        real = [player for player in self.players if player > 0]
+        base = max(self.seeds.values(), default=0)  # Below every manual seed
+        return {
+            player: base + position
+            for position, player in enumerate(seed_order(real, self.ratings, self.seeds), start=1)
+            if player not in self.seeds
+        }
+
+    def seat_numbers(self) -> dict:
+        """
+        **Returns player id -> seat (1-based) for every player, in the order the bracket seats them.**
+
+        - Elimination formats seat by seed order; round robin by the order players are listed.
+        - Stored as seeds when check-in closes, which pins every pairing to its seat.
+        """
+        real = [player for player in self.players if player > 0]
+        seated = seed_order(real, self.ratings, self.seeds) if self.advances_winners else real
+        return {player: seat for seat, player in enumerate(seated, start=1)}
+
+    def reseat_first_round(self, replacements: dict, gamertags: dict = None) -> None:
+        """
+        **Puts replacements into the seats of players who did not show up, without rebuilding the bracket.**
+
+        - Only the first round holds players in elimination formats, so only it changes; a
+          round robin fixes every pairing up front, so the swap is made in every round.
+        - A no-show mapped to `None` leaves a bye (an open slot in round robin), and so does any
+          seat still open: check-in has closed, nobody else is coming.
+
+        **Parameters:**
+        - `replacements` (dict[int, int | None]): No-show id -> id of the player taking the seat.
+        - `gamertags` (dict | None): Player id -> gamertag for the replacements, for display.
+        """
+        self.gamertags.update(gamertags or {})
+        empty = BYE if self.advances_winners else OPEN_SLOT
+        for matches in self.rounds[:1] if self.advances_winners else self.rounds:
+            for match in matches:
+                for key in ("p1", "p2"):
+                    player = match[key]
+                    if player in replacements:
+                        match[key] = replacements[player] if replacements[player] is not None else empty
+                    elif player == OPEN_SLOT:
+                        match[key] = empty
+        self.players = [replacements.get(player, player) or OPEN_SLOT for player in self.players]
+        self.checkin_closed = True
+        if self.advances_winners:
+            self.award_byes()  # New byes advance straight into round two
+        self.assign_tables()
+
+    def assign_tables(self) -> None:
+        """
+        **Puts every match on one of `self.tables`.**
+
+        - Within a round, matches that will be played take the tables in order; matches against a
+          bye need no table. Only when the cafe could not reserve enough tables does a round wrap
+          around, and those matches then share a table one after another.
+        """
+        for matches in self.rounds:
+            playable = 0
+            for match in matches:
+                if not self.tables or BYE in (match["p1"], match["p2"]):
+                    match["table"] = None
+                else:
+                    match["table"] = self.tables[playable % len(self.tables)]
+                    playable += 1
+
+    def advance_winner(self, round_number: int, match_number: int, player: int) -> None:
+        """
+        **Moves `player` into the match fed by `round_number` / `match_number`.**
+
+        - Matches 1 and 2 feed match 1 of the next round, 3 and 4 feed match 2, and so on;
+          odd-numbered matches fill `p1`, even-numbered matches fill `p2`.
+        """
+        if self.advances_winners and round_number < len(self.rounds):
+            next_round = self.rounds[round_number]
+            next_index = (match_number - 1) // 2
+            if next_index < len(next_round):
+                next_round[next_index]["p1" if match_number % 2 == 1 else "p2"] = player
+
+    def award_byes(self) -> None:
+        """ Advances everyone drawn against a `BYE` in the first round; real players are recorded as winners. """
+        for match_number, match in enumerate(self.rounds[0] if self.rounds else [], start=1):
+            if BYE not in (match["p1"], match["p2"]):
+                continue
+            player = match["p2"] if match["p1"] == BYE else match["p1"]
+            if player > 0:
+                match["winner"] = player
+                if "loser" in match:
+                    match["loser"] = BYE
+            self.advance_winner(1, match_number, player)  # An open slot still moves up, to be filled later
+
+    def record_winner(self, round_number: int, match_number: int, winner: int) -> None:
+        """
+        **Sets the winner of a match and, in elimination formats, moves them into the next round.**
+
+        **Why This Function Exists:**
+        - Results recorded from the command line or stored in `match_results` are replayed onto a
+          freshly generated bracket, so the bracket reflects every finished match.
+
+        **Parameters:**
+        - `round_number` (int): Round, starting at 1.
+        - `match_number` (int): Match within the round, starting at 1.
+        - `winner` (int): Player id of the winner (see `player_id()` to look one up by gamertag).
+
+        **Raises:**
+        - `ValueError`: If the match does not exist, or `winner` is not a real player in it.
+
+        **Step-by-Step Explanation:**
+        1️⃣ **Step 1 - Validate Match and Winner**
+        2️⃣ **Step 2 - Store Winner (and Loser, for double elimination)**
+        3️⃣ **Step 3 - Advance Winner**
+           - See `advance_winner()`.
+        """
+        # Step 1: Validate
+        if not 1 <= round_number <= len(self.rounds):
+            raise ValueError(f"Round {round_number} does not exist in {self.name}")
+        matches = self.rounds[round_number - 1]
+        if not 1 <= match_number <= len(matches):
+            raise ValueError(f"Round {round_number} of {self.name} has no match {match_number}")
+        match = matches[match_number - 1]
+        if winner not in (match["p1"], match["p2"]) or winner <= 0:  # Sentinels (byes, open and TBD slots) never win
+            raise ValueError(f"'{self.display_name(winner)}' is not playing in round {round_number} match {match_number}")
+
+        # Step 2: Store winner
+        match["winner"] = winner
+        if "loser" in match:
+            match["loser"] = match["p2"] if winner == match["p1"] else match["p1"]
+
+        # Step 3: Advance winner
+        self.advance_winner(round_number, match_number, winner)
 
     """
     def set_winner(self, round_number, match, winner_gamertag):
@@ -79,7 +331,7 @@ class Tournament:
         
         # Find the exact match object from self.rounds before modifying it
         if round_number > len(self.rounds):
-            print(f"❌ Error: Round {round_number} does not exist!")
+            logger.error("set_winner: round does not exist tournament=%s round=%s", self.name, round_number)
             return
 
         round_matches = self.rounds[round_number]
@@ -92,16 +344,14 @@ class Tournament:
                 break
 
         if match_index is None:
-            print(f"❌ Error: Match ({match['p1']} vs {match['p2']}) not found in round {round_number}")
+            logger.error("set_winner: match not found tournament=%s round=%s p1=%s p2=%s", self.name, round_number, match["p1"], match["p2"])
             return
 
         # Determine the loser
         loser_gamertag = match["p1"] if match["p2"] != winner_gamertag else match["p2"]
 
         # Update match winner
-        print("Round Matches:", round_matches)
-        print("Match Index:", match_index)
-        print("Both Round Matches and Match Index:", round_matches[match_index])
+        logger.debug("set_winner: tournament=%s round=%s match_index=%s match=%s", self.name, round_number, match_index, round_matches[match_index])
         round_matches[match_index]["winner"] = winner_gamertag
 
         # Move the winner to the next round
@@ -116,7 +366,7 @@ class Tournament:
         if isinstance(self, DoubleEliminationTournament):
             self.move_to_losers_bracket(loser_gamertag, round_number)
 
-        print(f"✅ Winner '{winner_gamertag}' set for Round {round_number}!")
+        logger.info("winner set tournament=%s round=%s winner=%s", self.name, round_number, winner_gamertag)
 
 
 
@@ -147,60 +397,16 @@ class SingleEliminationTournament(Tournament):
     - Automates **round generation**, reducing manual setup time.
     """
     
-    def __init__(self, name: str, max_players: int):
+    def __init__(self, name: str, max_players: int, db_path: str = database.DB_PATH, ratings: dict = None, tables=()):
         """ Initializes a Single Elimination Tournament. """
-        super().__init__(name, max_players)  # Call base class constructor
-        self.players = self.load_registered_players()  # Fetch registered players
+        super().__init__(name, max_players, db_path, ratings, tables)  # Call base class constructor
         self.rounds = []  # Initialize rounds list
 
-        print(f"Creating Single Elimination Tournament: {self.name} with max_players: {self.max_players}")  # Step 4: Debugging
-        print(f"Initial players list: {self.players}")  # Debugging
+        logger.debug("creating tournament type=%s name=%s max_players=%s players=%s", type(self).__name__, self.name, self.max_players, self.players)  # Formatted only at DEBUG
 
         self.fill_empty_slots()  # Fill empty slots with placeholders
         self.generate_rounds()  # Generate tournament rounds
 
-    def load_registered_players(self) -> list[str]:
-        """
-        **Fetches players signed up for this tournament from the database.**
-        
-        **Why This Function Exists:**
-        - Dynamically retrieves **registered players** to populate the tournament.
-        - Automates **player assignment**, reducing manual input errors.
-        
-        **Returns:**
-        - `list[str]`: A list of registered player gamertags.
-        
-        **Step-by-Step Explanation:**
-        1️⃣ **Step 1 - Establish Database Connection**
-           - Connects to SQLite database.
-        
-        2️⃣ **Step 2 - Execute Query**
-           - Retrieves gamertags of players who signed up for this tournament.
-        
-        3️⃣ **Step 3 - Convert Query Results**
-           - Formats retrieved player data into a list.
-        
-        4️⃣ **Step 4 - Close Database Connection**
-           - Ensures database resources are freed.
-        
-        5️⃣ **Step 5 - Return Player List**
-           - Returns the list of registered players.
-        """
-        conn = sqlite3.connect("src/game_cafe.db")  # Step 1: Connect to database
-        cursor = conn.cursor()  # Create cursor for executing SQL queries
-
-        cursor.execute("""
-            SELECT registered_users.gamertag 
-            FROM event_signup 
-            JOIN registered_users ON event_signup.gamertag = registered_users.id 
-            WHERE event_signup.event_name = ?
-        """, (self.name,))  # Step 2: Retrieve players who signed up for this tournament
-    
-        players = [row[0] for row in cursor.fetchall()]  # Step 3: Convert database output to list
-        conn.close()  # Step 4: Close the database connection
-    
-        return players if players else []  # Step 5: Return players or an empty list
-    
     def fill_empty_slots(self) -> None:
         """
         **Fills empty player slots to complete the bracket.**
@@ -213,15 +419,16 @@ class SingleEliminationTournament(Tournament):
            - Ensures the player count matches `max_players`.
         
         2️⃣ **Step 2 - Append Open Slots**
-           - Adds placeholder entries (`"Open Slot"`) until the tournament is full.
+           - Adds `OPEN_SLOT` entries until the tournament is full.
         
-        3️⃣ **Step 3 - Debugging Print**
-           - Prints the updated player list for verification.
+        3️⃣ **Step 3 - Debug Logging**
+           - Logs the updated player list at DEBUG level for verification.
         """
         while len(self.players) < self.max_players:  # Step 1: Check if slots are available
-            self.players.append("Open Slot")  # Step 2: Fill remaining slots
-        print(f"Updated players list for {self.name}: {self.players}")  # Step 3: Debugging output
+            self.players.append(OPEN_SLOT)  # Step 2: Fill remaining slots
+        logger.debug("open slots filled tournament=%s players=%s", self.name, self.players)  # Step 3: Formatted only at DEBUG
     
+    @Timed()
     def generate_rounds(self) -> None:
         """
         **Generates a structured single elimination tournament bracket.**
@@ -236,38 +443,41 @@ class SingleEliminationTournament(Tournament):
         **Mathematical Breakdown of Rounds Calculation:**
         - The number of rounds required for a **single elimination** tournament depends on the number of players.
         - A single elimination tournament always reduces the number of competitors by half each round.
-        - The number of rounds needed is determined by:
+        - The field is seated in a bracket of the next power of two; the extra seats are byes,
+          so the number of rounds needed is:
           
           **Formula:**
           ```
-          num_rounds = log2(total players)
+          num_rounds = log2(bracket size)
           ```
-          - `math.log2(self.max_players)`: Computes the **base-2 logarithm** of the total players.
-          - The result gives the total number of rounds required to reduce the players to a **single winner**.
           - Example Calculations:
-            - `max_players = 16` → `log2(16) = 4` rounds (16 → 8 → 4 → 2 → 1)
-            - `max_players = 8` → `log2(8) = 3` rounds (8 → 4 → 2 → 1)
+            - `max_players = 16` → 16 seats, `log2(16) = 4` rounds (16 → 8 → 4 → 2 → 1)
+            - `max_players = 6` → 8 seats (2 byes), `log2(8) = 3` rounds (8 → 4 → 2 → 1)
         
         **Step-by-Step Explanation:**
         1️⃣ **Step 1 - Initialize Rounds List**
            - Clears any previously stored round data.
         
-        2️⃣ **Step 2 - Calculate Number of Rounds**
-           - Uses `math.log2(self.max_players)` to determine how many rounds are needed.
+        2️⃣ **Step 2 - Seed the Field**
+           - `seeded_slots()` lays the players out in standard seed order, byes against the top seeds.
         
         3️⃣ **Step 3 - Generate First Round Matches**
-           - Assigns actual players to the first set of matchups.
+           - Pairs neighbouring slots into the first set of matchups.
         
         4️⃣ **Step 4 - Generate Future Rounds**
-           - Creates placeholders (`"TBD"`) for winners who will advance in later rounds.
+           - Creates `TBD` slots for winners who will advance in later rounds.
+        
+        5️⃣ **Step 5 - Award Byes**
+           - Players drawn against a bye move straight into round two.
         """
         self.rounds = []  # Step 1: Clear any previous tournament data
-        num_rounds = int(math.log2(self.max_players))  # Step 2: Calculate number of rounds needed
+        slots = self.seeded_slots()  # Step 2: Seeded bracket, a power of two long
+        num_rounds = len(slots).bit_length() - 1  # log2 of the bracket size
         
         # **Step 3 - First Round: Assign real players**
         first_round = []
-        for i in range(0, self.max_players, 2):  # Iterate through players in pairs (p1 vs p2)
-            match = {"p1": self.players[i], "p2": self.players[i+1], "winner": None}  # Create match structure
+        for i in range(0, len(slots), 2):  # Iterate through slots in pairs (p1 vs p2)
+            match = {"p1": slots[i], "p2": slots[i+1], "winner": None}  # Create match structure
             first_round.append(match)  # Add match to first round
         self.rounds.append(first_round)  # Store first round in rounds list
         
@@ -276,14 +486,13 @@ class SingleEliminationTournament(Tournament):
         for round_num in range(1, num_rounds):  # Iterate through rounds beyond the first
             next_round = []
             for match_num in range(num_matches):  # Generate placeholder matches for the next round
-                next_round.append({
-                    "p1": f"Winner of Match {match_num * 2 + 1}",
-                    "p2": f"Winner of Match {match_num * 2 + 2}",
-                    "winner": None
-                })
+                next_round.append({"p1": TBD, "p2": TBD, "winner": None})  # Filled in by record_winner()
             self.rounds.append(next_round)  # Store generated round
             num_matches //= 2  # Reduce number of matches by half for the next round
 
+        self.award_byes()  # Step 5: Byes advance without a match
+        self.assign_tables()
+
 
 class DoubleEliminationTournament(Tournament):
     """
@@ -300,63 +509,24 @@ class DoubleEliminationTournament(Tournament):
     - Automates **round generation**, reducing manual tournament setup.
     """
     
-    def __init__(self, name: str, max_players: int):
+    def __init__(self, name: str, max_players: int, db_path: str = database.DB_PATH, ratings: dict = None, tables=()):
         """ Initializes a Double Elimination Tournament. """
-        super().__init__(name, max_players)  # Call base class constructor
-        self.players = self.load_registered_players()  # Fetch registered players
+        super().__init__(name, max_players, db_path, ratings, tables)  # Call base class constructor
         self.rounds = []  # Initialize main rounds list
         self.winners_bracket = []  # Initialize winners bracket
         self.losers_bracket = []  # Initialize losers bracket
         self.grand_finals = None  # Set grand finals placeholder
 
-        print(f"Creating Double Elimination Tournament: {self.name} with max_players: {self.max_players}")  # Step 4: Debugging
-        print(f"Initial players list: {self.players}")  # Debugging
+        logger.debug("creating tournament type=%s name=%s max_players=%s players=%s", type(self).__name__, self.name, self.max_players, self.players)  # Formatted only at DEBUG
 
         self.fill_empty_slots()  # Fill empty slots with placeholders
         self.generate_rounds()  # Generate tournament rounds
 
-    def load_registered_players(self) -> list[str]:
-        """
-        **Fetches players signed up for this tournament from the database.**
-        
-        **Why This Function Exists:**
-        - Dynamically retrieves **registered players** to populate the tournament.
-        - Automates **player assignment**, reducing manual input errors.
-        
-        **Returns:**
-        - `list[str]`: A list of registered player gamertags.
-        
-        **Step-by-Step Explanation:**
-        1️⃣ **Step 1 - Establish Database Connection**
-           - Connects to SQLite database.
-        
-        2️⃣ **Step 2 - Execute Query**
-           - Retrieves gamertags of players who signed up for this tournament.
-        
-        3️⃣ **Step 3 - Convert Query Results**
-           - Formats retrieved player data into a list.
-        
-        4️⃣ **Step 4 - Close Database Connection**
-           - Ensures database resources are freed.
-        
-        5️⃣ **Step 5 - Return Player List**
-           - Returns the list of registered players.
-        """
-        conn = sqlite3.connect("src/game_cafe.db")  # Step 1: Connect to database
-        cursor = conn.cursor()  # Create cursor for executing SQL queries
+    def pending_label(self, round_number: int, match_number: int, key: str) -> str:
+        """ Names the Winners' Bracket match that decides a `TBD` slot, e.g. `"Winner of WB Round 1 Match 3"`. """
+        feeder = 2 * match_number - (1 if key == "p1" else 0)
+        return f"Winner of WB Round {round_number - 1} Match {feeder}"
 
-        cursor.execute("""
-            SELECT registered_users.gamertag 
-            FROM event_signup 
-            JOIN registered_users ON event_signup.gamertag = registered_users.id 
-            WHERE event_signup.event_name = ?
-        """, (self.name,))  # Step 2: Retrieve players who signed up for this tournament
-    
-        players = [row[0] for row in cursor.fetchall()]  # Step 3: Convert database output to list
-        conn.close()  # Step 4: Close the database connection
-    
-        return players if players else []  # Step 5: Return players or an empty list
-    
     def fill_empty_slots(self) -> None:
         """
         **Fills empty player slots to complete the bracket.**
@@ -369,16 +539,17 @@ class DoubleEliminationTournament(Tournament):
            - Ensures the player count matches `max_players`.
         
         2️⃣ **Step 2 - Append Open Slots**
-           - Adds placeholder entries (`"Open Slot"`) until the tournament is full.
+           - Adds `OPEN_SLOT` entries until the tournament is full.
         
-        3️⃣ **Step 3 - Debugging Print**
-           - Prints the updated player list for verification.
+        3️⃣ **Step 3 - Debug Logging**
+           - Logs the updated player list at DEBUG level for verification.
         """
         while len(self.players) < self.max_players:  # Step 1: Check if slots are available
-            self.players.append("Open Slot")  # Step 2: Fill remaining slots
-        print(f"Updated players list for {self.name}: {self.players}")  # Step 3: Debugging output
+            self.players.append(OPEN_SLOT)  # Step 2: Fill remaining slots
+        logger.debug("open slots filled tournament=%s players=%s", self.name, self.players)  # Step 3: Formatted only at DEBUG
 
 
+    @Timed()
     def generate_rounds(self) -> None:
         """
         **Generates the Winners' and Losers' brackets for a double-elimination tournament.**
@@ -393,13 +564,14 @@ class DoubleEliminationTournament(Tournament):
           - Fair competition by following **double elimination rules**.
         
         **Mathematical Breakdown of Rounds Calculation:**
-        - The number of rounds needed is determined using:
+        - The field is seated in a bracket of the next power of two (extra seats are byes), and the
+          number of rounds needed is determined using:
           
           **Formula:**
           ```
-          num_rounds = log2(total players) + 1
+          num_rounds = log2(bracket size) + 1
           ```
-          - `math.log2(self.max_players)`: Computes the **base-2 logarithm** to determine how many rounds are needed to reach a single undefeated player.
+          - `log2(bracket size)`: The **base-2 logarithm** gives how many rounds are needed to reach a single undefeated player.
           - **Adding `+1`** accounts for the **Grand Finals**, where the final Winner' Bracket champion faces the Losers' Bracket champion.
           - Example Calculations:s
             - `max_players = 16` → `log2(16) + 1 = 5` rounds (16 → 8 → 4 → 2 → 1 → Grand Finals)
@@ -409,22 +581,26 @@ class DoubleEliminationTournament(Tournament):
         1️⃣ **Step 1 - Initialize Rounds List**
            - Clears any previously stored round data.
         
-        2️⃣ **Step 2 - Calculate Number of Rounds**
-           - Uses `math.log2(self.max_players) + 1` to determine the correct number of rounds.
+        2️⃣ **Step 2 - Seed the Field and Calculate Number of Rounds**
+           - `seeded_slots()` gives the seeded bracket; `log2` of its size + 1 is the number of rounds.
         
         3️⃣ **Step 3 - Generate First Round Matches**
-           - Assigns actual players to the first round of the Winners' Bracket (WB).
+           - Assigns seeded players to the first round of the Winners' Bracket (WB).
         
         4️⃣ **Step 4 - Generate Future Winners' Bracket Rounds**
-           - Creates placeholders (`"TBD"`) for players advancing in the Winners' Bracket.
+           - Creates `TBD` slots for players advancing in the Winners' Bracket.
+        
+        5️⃣ **Step 5 - Award Byes**
+           - Players drawn against a bye move straight into round two.
         """
         self.rounds = []  # Step 1: Clear any previous tournament data
-        num_rounds = int(math.log2(self.max_players)) + 1  # Step 2: Calculate number of rounds needed (+1 for Grand Finals)
+        slots = self.seeded_slots()  # Step 2: Seeded bracket, a power of two long
+        num_rounds = len(slots).bit_length()  # log2 of the bracket size, +1 for Grand Finals
         
-        # **Step 3 - First Round: Assign real players to Winners' Bracket**
+        # **Step 3 - First Round: Assign seeded players to Winners' Bracket**
         first_round = [
-            {"p1": self.players[i], "p2": self.players[i+1], "winner": None, "loser": None}  # Create match structure
-            for i in range(0, self.max_players, 2)  # Iterate through players in pairs (p1 vs p2)
+            {"p1": slots[i], "p2": slots[i+1], "winner": None, "loser": None}  # Create match structure
+            for i in range(0, len(slots), 2)  # Iterate through slots in pairs (p1 vs p2)
         ]
         self.rounds.append(first_round)  # Store first round in rounds list
         
@@ -432,16 +608,15 @@ class DoubleEliminationTournament(Tournament):
         num_matches = len(first_round) // 2  # The number of matches in the next round is half of the previous round
         for round_num in range(1, num_rounds):  # Iterate through rounds beyond the first
             next_round = [
-                {
-                    "p1": f"Winner of WB Round {round_num} Match {match_num * 2 + 1}",
-                    "p2": f"Winner of WB Round {round_num} Match {match_num * 2 + 2}",
-                    "winner": None, "loser": None
-                }
+                {"p1": TBD, "p2": TBD, "winner": None, "loser": None}  # Filled in by record_winner()
                 for match_num in range(num_matches)  # Generate placeholder matches for the next round
             ]
             self.rounds.append(next_round)  # Store generated round
             num_matches //= 2  # Reduce number of matches by half for the next round
 
+        self.award_byes()  # Step 5: Byes advance without a match
+        self.assign_tables()
+
 class RoundRobinTournament(Tournament):
     """
     **RoundRobinTournament Class**
@@ -456,61 +631,19 @@ class RoundRobinTournament(Tournament):
     - Ensures that every player **competes in an equal number of matches**.
     - Automates **match scheduling and table assignments**, reducing manual setup time.
     """
+
+    advances_winners = False  # Every pairing is fixed up front; winners only count toward standings
     
-    def __init__(self, name: str, max_players: int):
+    def __init__(self, name: str, max_players: int, db_path: str = database.DB_PATH, ratings: dict = None, tables=()):
         """ Initializes a Round-Robin Tournament. """
-        super().__init__(name, max_players)  # Step 1: Call base class constructor
-        self.players = self.load_registered_players()  # Step 2: Fetch registered players
-        self.rounds = []  # Step 3: Initialize main rounds list
+        super().__init__(name, max_players, db_path, ratings, tables)  # Step 1: Call base class constructor
+        self.rounds = []  # Step 2: Initialize main rounds list
 
-        print(f"Creating RoundRobinTournament: {self.name} with max_players: {self.max_players}")  # Step 4: Debugging
-        print(f"Initial players list: {self.players}")  # Step 4: Debugging
+        logger.debug("creating tournament type=%s name=%s max_players=%s players=%s", type(self).__name__, self.name, self.max_players, self.players)  # Formatted only at DEBUG
 
-        self.fill_empty_slots()  # Step 5: Fill empty slots with placeholders
-        self.generate_rounds()  # Step 6: Generate tournament rounds
+        self.fill_empty_slots()  # Step 3: Fill empty slots with placeholders
+        self.generate_rounds()  # Step 4: Generate tournament rounds
 
-    def load_registered_players(self) -> list[str]:
-        """
-        **Fetches players signed up for this tournament from the database.**
-        
-        **Why This Function Exists:**
-        - Dynamically retrieves **registered players** to populate the tournament.
-        - Automates **player assignment**, reducing manual input errors.
-        
-        **Returns:**
-        - `list[str]`: A list of registered player gamertags.
-        
-        **Step-by-Step Explanation:**
-        1️⃣ **Step 1 - Establish Database Connection**
-           - Connects to SQLite database.
-        
-        2️⃣ **Step 2 - Execute Query**
-           - Retrieves gamertags of players who signed up for this tournament.
-        
-        3️⃣ **Step 3 - Convert Query Results**
-           - Formats retrieved player data into a list.
-        
-        4️⃣ **Step 4 - Close Database Connection**
-           - Ensures database resources are freed.
-        
-        5️⃣ **Step 5 - Return Player List**
-           - Returns the list of registered players.
-        """
-        conn = sqlite3.connect("src/game_cafe.db")  # Step 1: Connect to database
-        cursor = conn.cursor()  # Create cursor for executing SQL queries
-
-        cursor.execute("""
-            SELECT registered_users.gamertag 
-            FROM event_signup 
-            JOIN registered_users ON event_signup.gamertag = registered_users.id 
-            WHERE event_signup.event_name = ?
-        """, (self.name,))  # Step 2: Retrieve players who signed up for this tournament
-    
-        players = [row[0] for row in cursor.fetchall()]  # Step 3: Convert database output to list
-        conn.close()  # Step 4: Close the database connection
-    
-        return players if players else []  # Step 5: Return players or an empty list
-    
     def fill_empty_slots(self) -> None:
         """
         **Fills empty player slots to complete the bracket.**
@@ -523,16 +656,17 @@ class RoundRobinTournament(Tournament):
            - Ensures the player count matches `max_players`.
         
         2️⃣ **Step 2 - Append Open Slots**
-           - Adds placeholder entries (`"Open Slot"`) until the tournament is full.
+           - Adds `OPEN_SLOT` entries until the tournament is full.
         
-        3️⃣ **Step 3 - Debugging Print**
-           - Prints the updated player list for verification.
+        3️⃣ **Step 3 - Debug Logging**
+           - Logs the updated player list at DEBUG level for verification.
         """
         while len(self.players) < self.max_players:  # Step 1: Check if slots are available
-            self.players.append("Open Slot")  # Step 2: Fill remaining slots
-        print(f"Updated players list for {self.name}: {self.players}")  # Step 3: Debugging output
+            self.players.append(OPEN_SLOT)  # Step 2: Fill remaining slots
+        logger.debug("open slots filled tournament=%s players=%s", self.name, self.players)  # Step 3: Formatted only at DEBUG
 
 
+    @Timed()
     def generate_rounds(self) -> None:
         """
         **Generates a round-robin format tournament with table assignments.**
@@ -546,14 +680,14 @@ class RoundRobinTournament(Tournament):
         
         **Step-by-Step Explanation:**
         1️⃣ **Step 1 - Handle Edge Cases**
-           - If fewer than **two players** are available, fill slots with `"Open Slot"` placeholders.
+           - If fewer than **two players** are available, fill slots with `OPEN_SLOT`.
         
         2️⃣ **Step 2 - Initialize Players and Clear Previous Rounds**
            - Copy the player list to prevent modification issues.
            - Clear previously stored rounds to start fresh.
         
         3️⃣ **Step 3 - Ensure Even Number of Participants**
-           - If the number of players is **odd**, add a `"BYE"` entry to balance matchups.
+           - If the number of players is **odd**, add a `BYE` entry to balance matchups.
         
         4️⃣ **Step 4 - Generate Round-Robin Matchups**
            - The tournament lasts for **`num_rounds = total_players - 1`** rounds.
@@ -563,13 +697,13 @@ class RoundRobinTournament(Tournament):
            - Standard **round-robin rotation algorithm** is used.
            - **First player remains fixed**, while others rotate **clockwise**.
         
-        6️⃣ **Step 6 - Store and Print the Final Schedule**
+        6️⃣ **Step 6 - Store and Log the Final Schedule**
            - Append each round to `self.rounds`.
-           - Print final matchups for debugging.
+           - Log final matchups at DEBUG level.
         """
         # **Step 1 - Handle Edge Cases**
         if len(self.players) < 2:
-            self.players = ["Open Slot"] * self.max_players  # Ensure a valid tournament structure
+            self.players = [OPEN_SLOT] * self.max_players  # Ensure a valid tournament structure
         
         # **Step 2 - Initialize Players and Clear Previous Rounds**
         self.rounds.clear()  # Reset rounds
@@ -577,7 +711,7 @@ class RoundRobinTournament(Tournament):
         
         # **Step 3 - Ensure Even Number of Participants**
         if len(players) % 2 == 1:
-            players.append("BYE")  # If odd players, add a BYE to balance matchups
+            players.append(BYE)  # If odd players, add a BYE to balance matchups
         
         num_rounds = len(players) - 1  # **Each player plays against every other player once**
         
@@ -588,7 +722,6 @@ class RoundRobinTournament(Tournament):
                     "p1": players[match_num],  # First player in matchup
                     "p2": players[-(match_num + 1)],  # Last player (paired from opposite ends)
                     "winner": None,  # No winner yet (to be determined during gameplay)
-                    "table": (match_num % 2)  # Alternate table assignments for variety
                 }
                 for match_num in range(len(players) // 2)  # Create matchups for half the players per round
             ]
@@ -597,6 +730,30 @@ class RoundRobinTournament(Tournament):
             # **Step 5 - Rotate Players to Form New Matchups**
             players.insert(1, players.pop())  # Standard round-robin rotation (first player stays fixed)
         
-        # **Step 6 - Store and Print the Final Schedule**
-        print(f"Final generated rounds: {self.rounds}")  # Debugging output
+        # **Step 6 - Store and Log the Final Schedule**
+        self.assign_tables()  # Spread each round over the tables reserved for this tournament
+        logger.debug("rounds generated tournament=%s rounds=%d detail=%s", self.name, len(self.rounds), self.rounds)  # Formatted only at DEBUG
 
+
+TOURNAMENT_TYPES = {
+    "single_elimination": SingleEliminationTournament,
+    "double_elimination": DoubleEliminationTournament,
+    "round_robin": RoundRobinTournament,
+}  # `event_type` column value -> tournament class
+
+
+def create_tournament(event: dict, db_path: str = database.DB_PATH, ratings: dict = None) -> Tournament:
+    """
+    **Builds the tournament instance for a tournament dictionary from `CurrentEvents`.**
+
+    - Matches are put on the tables the day's `TablePlan` reserves for the tournament.
+
+    - `ratings` (player id -> rating) overrides the stored `player_ratings` used to seed elimination brackets.
+
+    **Raises:**
+    - `ValueError`: If the tournament type is unknown.
+    """
+    tournament_class = TOURNAMENT_TYPES.get(event["type"])
+    if tournament_class is None:
+        raise ValueError(f"Unknown tournament type '{event['type']}' for {event['name']}")
+    return tournament_class(event["name"], event["max_players"], db_path, ratings, tables_for_event(event, db_path))
@@ -0,0 +1,92 @@
+"""
+**Ratings Benchmark - Plain vs Layered Elo Replay**
+
+**Purpose:**
+- Times `model.ratings.replay()` one match at a time and with NumPy layers, for several player counts.
+- Verifies that both paths give the same ratings.
+
+**Why This File Exists:**
+- The layered replay only pays off when layers are wide (many distinct players); with the few
+  dozen regulars a cafe has it was several times slower. `MIN_LAYER_WIDTH` is set from these numbers.
+
+**Usage:**
+```
+python src/ratings_bench.py [--matches 1000000] [--players 20 50 1000 2000 100000]
+```
+- Needs NumPy. Uses random matches in memory; no database is opened.
+- Exits with status 1 if the two paths disagree by more than `--tolerance` rating points.
+
+**Results (1M matches, Python 3.11, NumPy 2.4):**
+```
+players    plain s  layered s
+     20       0.54       2.46
+     50       0.53       1.45
+   1000       0.63       0.63
+   2000       0.65       0.57
+ 100000       1.19       0.74
+```
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from model import ratings
+
+
+def random_matches(count: int, players: int, seed: int) -> tuple[list, list]:
+    """ Returns `(winners, losers)` for `count` matches between distinct random players. """
+    rng = random.Random(seed)
+    winners = [rng.randrange(players) for _ in range(count)]
+    losers = [(winner + 1 + rng.randrange(players - 1)) % players for winner in winners]  # Never the winner
+    return winners, losers
+
+
+def plain_replay(winners: list, losers: list) -> tuple[dict, dict]:
+    """ Runs `replay()` as it runs without NumPy. """
+    numpy, ratings.np = ratings.np, None
+    try:
+        return ratings.replay(winners, losers)
+    finally:
+        ratings.np = numpy
+
+
+def main() -> int:
+    """ Parses the arguments, times both replays for each player count, and prints a table. """
+    parser = argparse.ArgumentParser(description="Compare the plain and layered Elo replay.")
+    parser.add_argument("--matches", type=int, default=1_000_000, help="matches to replay")
+    parser.add_argument("--players", type=int, nargs="+", default=[20, 50, 1000, 2000, 100_000], help="distinct players")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument("--tolerance", type=float, default=1e-6, help="largest acceptable rating difference")
+    args = parser.parse_args()
+
+    if ratings.np is None:
+        print("NumPy is not installed; only the plain replay is available.")
+        return 1
+
+    failed = False
+    print(f"{'players':>7}  {'plain s':>9}  {'layered s':>9}  replay() uses")
+    for players in args.players:
+        winners, losers = random_matches(args.matches, players, args.seed)
+
+        started = time.perf_counter()
+        plain, _ = plain_replay(winners, losers)
+        plain_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        layered, _ = ratings._replay_layers(winners, losers, ratings.K_FACTOR)
+        layered_seconds = time.perf_counter() - started
+
+        chosen = "layered" if players // 2 >= ratings.MIN_LAYER_WIDTH else "plain"
+        print(f"{players:>7}  {plain_seconds:>9.2f}  {layered_seconds:>9.2f}  {chosen}")
+        difference = max(abs(plain[player] - layered[player]) for player in plain)
+        if difference > args.tolerance:
+            print(f"  ratings differ by up to {difference:.3g} points")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from model.change_feed import ChangeFeed
+
+POLL_INTERVAL_MS = 1000  # How often open windows check for changes
+
+
+class ChangeNotifier(QObject):
+    """
+    **ChangeNotifier Class**
+
+    **Class Purpose:**
+    - Polls the `ChangeFeed` on a timer and turns database changes into Qt signals.
+
+    **Why This Class Exists:**
+    - Open bracket and event windows need to know *what* changed to patch themselves in place.
+
+    **Implementation Decisions:**
+    - One shared instance (`change_notifier()`) polls for every window, so opening more windows
+      does not add more polling.
+    - An idle poll is one `PRAGMA data_version`, cheap enough for the GUI thread.
+    """
+
+    events_changed = pyqtSignal(list)  # [(kind, name)] for tournaments and campaigns added, edited or removed
+    signups_changed = pyqtSignal(list)  # Event names whose sign-ups changed
+    results_changed = pyqtSignal(list)  # Tournament names with new or corrected match results
+    reload_required = pyqtSignal()  # Too many changes were missed; reload everything
+
+    def __init__(self, parent=None):
+        """ Starts the polling timer. """
+        super().__init__(parent)
+        self.feed = ChangeFeed()
+        self.timer = QTimer(self)
+        self.timer.setInterval(POLL_INTERVAL_MS)
+        self.timer.timeout.connect(self.poll)
+        self.timer.start()
+
+    def poll(self) -> None:
+        """ Emits one signal per kind of change found since the last poll. """
+        changes = self.feed.poll()
+        if changes is None:
+            self.reload_required.emit()
+            return
+
+        events = [(entity, key) for entity, key in changes if entity in ("tournament", "campaign")]
+        signups = [key for entity, key in changes if entity == "signup"]
+        results = [key for entity, key in changes if entity == "result"]
+        if events:
+            self.events_changed.emit(events)
+        if signups:
+            self.signups_changed.emit(signups)
+        if results:
+            self.results_changed.emit(results)
+
+
+_notifier = None  # Shared ChangeNotifier, created on first use
+
+
+def change_notifier() -> ChangeNotifier:
+    """ Returns the application-wide change notifier. """
+    global _notifier
+    if _notifier is None:
+        _notifier = ChangeNotifier()
+    return _notifier
@@ -0,0 +1,76 @@
+import logging
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, pyqtSignal
+from model.db_executor import db_executor
+from model.profiling import profile_worker
+
+logger = logging.getLogger(__name__)
+
+
+class _Delivery(QObject):
+    """ Carries finished futures from the database threads back to the GUI thread. """
+
+    finished = pyqtSignal(object, object, object, object)  # (owner, future, on_result, on_error)
+
+    def __init__(self):
+        """ Connects the signal; created on the GUI thread, so deliveries run there. """
+        super().__init__()
+        self.finished.connect(self._deliver)
+
+    def _deliver(self, owner, future, on_result, on_error) -> None:
+        """ Calls the result or error callback, unless the window that asked has been closed. """
+        if owner is not None and sip.isdeleted(owner):
+            return  # The window went away while the query ran
+        error = future.exception()
+        if error is None:
+            on_result(future.result())
+        elif on_error is not None:
+            on_error(error)
+        else:
+            logger.error("database request failed owner=%s", type(owner).__name__, exc_info=error)
+
+
+_delivery = None  # Shared _Delivery, created on the GUI thread on first use
+
+
+def _submit(submit, owner, fn, args, on_result, on_error):
+    """ Queues `fn(*args)` and arranges for its outcome to reach the GUI thread. """
+    global _delivery
+    if _delivery is None:
+        _delivery = _Delivery()
+    future = submit(profile_worker(fn), *args)  # Profiled on the worker when a window open is being profiled
+    future.add_done_callback(lambda done: _delivery.finished.emit(owner, done, on_result, on_error))
+    return future
+
+
+def run_read(owner, fn, *args, on_result, on_error=None):
+    """
+    **Runs a read-only model call off the GUI thread and passes its result to `on_result`.**
+
+    **Why This Function Exists:**
+    - Windows used to query the database directly on the GUI thread, freezing the kiosk whenever
+      the disk was slow or another kiosk held the lock.
+
+    **Implementation Decisions:**
+    - The work runs on the shared `DatabaseExecutor`; the callback is delivered through a queued
+      Qt signal, so it always runs on the GUI thread and may touch widgets.
+    - If `owner` (normally the calling window) has been deleted by the time the result arrives,
+      the callback is skipped instead of touching a dead widget.
+    - Without `on_error`, failures are logged rather than raised into the event loop.
+
+    **Parameters:**
+    - `owner` (QObject | None): The widget waiting for the result.
+    - `fn` (callable): Model method or function to run, e.g. `self.events.get_upcoming_events`.
+    - `*args`: Arguments for `fn`.
+    - `on_result` (callable): Called with the return value of `fn`.
+    - `on_error` (callable | None): Called with the exception if `fn` raised.
+
+    **Returns:**
+    - `concurrent.futures.Future`: The queued request.
+    """
+    return _submit(db_executor().read, owner, fn, args, on_result, on_error)
+
+
+def run_write(owner, fn, *args, on_result, on_error=None):
+    """ Same as `run_read()`, but queues `fn` on the single write thread, behind earlier writes. """
+    return _submit(db_executor().write, owner, fn, args, on_result, on_error)
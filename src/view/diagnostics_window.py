@@ -0,0 +1,86 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QFileDialog, QHeaderView
+)
+from PyQt6.QtCore import Qt
+from model import instrumentation
+
+SUMMARY_COLUMNS = ("name", "calls", "avg_ms", "max_ms", "total_ms", "rows")
+RECENT_COLUMNS = ("name", "ms", "rows", "thread")
+MAX_RECENT_SHOWN = 200  # Newest samples listed; the JSON export includes the whole buffer
+
+
+class DiagnosticsWindow(QDialog):
+    """
+    **DiagnosticsWindow Class**
+
+    **Class Purpose:**
+    - Hidden staff window (Ctrl+Shift+D) showing how long controller actions, queries,
+      bracket generation and image loading have taken on this kiosk.
+
+    **Why This Class Exists:**
+    - Lets staff see which click is slow without a debugger, and export the numbers as JSON
+      to compare kiosks.
+    """
+
+    def __init__(self, parent=None):
+        """ Initializes the diagnostics UI and fills it with the current measurements. """
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostics")
+        self.setGeometry(250, 150, 750, 600)
+
+        layout = QVBoxLayout(self)
+
+        layout.addWidget(QLabel("Totals per operation (slowest total first)"))
+        self.summary_table = self.create_table(SUMMARY_COLUMNS)
+        layout.addWidget(self.summary_table, 3)
+
+        layout.addWidget(QLabel("Most recent samples"))
+        self.recent_table = self.create_table(RECENT_COLUMNS)
+        layout.addWidget(self.recent_table, 2)
+
+        # Buttons
+        button_row = QHBoxLayout()
+        for text, handler in (("Refresh", self.refresh), ("Reset", self.reset),
+                              ("Export JSON...", self.export_json), ("Close", self.close)):
+            button = QPushButton(text)
+            button.clicked.connect(handler)
+            button_row.addWidget(button)
+        layout.addLayout(button_row)
+
+        self.refresh()
+
+    def create_table(self, columns: tuple) -> QTableWidget:
+        """ Creates a read-only table with the given column headers. """
+        table = QTableWidget(0, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        return table
+
+    def fill_table(self, table: QTableWidget, columns: tuple, rows: list[dict]) -> None:
+        """ Replaces the table contents with one row per dictionary. """
+        table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            for column_index, column in enumerate(columns):
+                value = row[column]
+                item = QTableWidgetItem("" if value is None else str(value))
+                if column_index > 0:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                table.setItem(row_index, column_index, item)
+
+    def refresh(self) -> None:
+        """ Reloads both tables from the instrumentation buffer. """
+        self.fill_table(self.summary_table, SUMMARY_COLUMNS, instrumentation.summary())
+        self.fill_table(self.recent_table, RECENT_COLUMNS, instrumentation.recent_samples()[:MAX_RECENT_SHOWN])
+
+    def reset(self) -> None:
+        """ Clears all measurements, e.g. before reproducing a slow click. """
+        instrumentation.reset()
+        self.refresh()
+
+    def export_json(self) -> None:
+        """ Saves totals and samples to a JSON file chosen by the user. """
+        path, _ = QFileDialog.getSaveFileName(self, "Export Diagnostics", "diagnostics.json", "JSON Files (*.json)")
+        if path:
+            instrumentation.export_json(path)
@@ -1,9 +1,12 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QPushButton, QScrollArea, QFrame, QLineEdit, QMessageBox
+    QWidget, QVBoxLayout, QLabel, QPushButton, QScrollArea, QFrame, QLineEdit, QMessageBox, QListWidget
 )
 from PyQt6.QtCore import Qt
 from model.current_events import CurrentEvents
-import sqlite3
+from model.event_signups import EventSignUps, SignUpResult
+from view.gamertag_search import GamertagSearch
+from view.change_notifier import change_notifier
+from view.db_worker import run_read, run_write
 
 class EventsDisplay(QWidget):
     """
@@ -73,6 +76,7 @@ class EventsDisplay(QWidget):
         1️⃣ **Step 1 - Retrieve Events from Database**
         - Calls `get_tournaments()` to fetch active tournaments for the selected game.
         - Calls `get_campaigns()` to fetch active campaigns for the selected game.
+        - Both run on the database worker thread; `show_events()` performs the remaining steps.
 
         2️⃣ **Step 2 - Check for Available Events**
         - If no tournaments or campaigns exist, display a message indicating that no events are available.
@@ -88,16 +92,26 @@ class EventsDisplay(QWidget):
         - Adds the generated campaign widget to the event layout.
         """
 
-        # Step 1 - Retrieve Events from Database
-        tournaments = self.events.get_tournaments(self.game_name)  # Get all tournaments related to the game
-        campaigns = self.events.get_campaigns(self.game_name)  # Get all campaigns related to the game
+        # Step 1 - Retrieve Events from Database (on the database thread; a label shows until they arrive)
+        self.loading_label = QLabel("Loading events...")
+        self.loading_label.setStyleSheet("font-size: 14px; color: gray;")
+        self.event_layout.addWidget(self.loading_label, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        def fetch():
+            return self.events.get_tournaments(self.game_name), self.events.get_campaigns(self.game_name)
+
+        run_read(self, fetch, on_result=self.show_events)
+
+    def show_events(self, events):
+        """ Replaces the loading label with the fetched `(tournaments, campaigns)` (Steps 2-4 of `load_events()`). """
+        tournaments, campaigns = events
 
         # Step 2 - Check for Available Events
         if not tournaments and not campaigns:  # If both lists are empty
-            no_event_label = QLabel("No upcoming events at the cafe for this game.")  # Create label for no events
-            no_event_label.setStyleSheet("font-size: 14px; color: gray;")  # Style label
-            self.event_layout.addWidget(no_event_label, alignment=Qt.AlignmentFlag.AlignCenter)  # Add to UI
+            self.loading_label.setText("No upcoming events at the cafe for this game.")
             return  # Exit function early since there are no events to display
+        self.event_layout.removeWidget(self.loading_label)
+        self.loading_label.deleteLater()
 
         # Step 3 - Add Tournaments to the UI
         for tournament in tournaments:  # Loop through each retrieved tournament
@@ -233,6 +247,7 @@ class AllEventsDisplay(QWidget):
     - `controller` (Controller): Handles event interactions and navigation.
     - `main_layout` (QVBoxLayout): The primary layout that organizes UI components.
     - `event_layout` (QVBoxLayout): Holds the dynamically generated event widgets.
+    - `event_frames` (dict): `(kind, name)` -> event widget, so changed events are replaced in place.
     """
 
     def __init__(self, controller):
@@ -260,9 +275,17 @@ class AllEventsDisplay(QWidget):
         self.main_layout.addWidget(scroll_area)  # Add scroll area to main layout
 
         # Load and Display Events from Database
+        self.events = CurrentEvents()  # Retrieves tournaments and campaigns
+        self.event_frames = {}  # (kind, name) -> event widget
+        self.no_event_label = None  # Shown only while there are no events
         self.load_all_events()  # Retrieve and populate event listings
         self.setLayout(self.main_layout)  # Apply main layout to the window
 
+        # Patch the list when events are added, edited or removed on another kiosk
+        notifier = change_notifier()
+        notifier.events_changed.connect(self.patch_events)
+        notifier.reload_required.connect(self.reload_all_events)
+
     def load_all_events(self):
         """
         **Fetches and Displays All Upcoming Tournaments and Campaigns from the Database.**
@@ -272,67 +295,102 @@ class AllEventsDisplay(QWidget):
         - Both tournaments and campaigns should be retrieved and displayed together.
         - Users should see all upcoming events available at the cafe.
 
-        **Step-by-Step Breakdown:**
-        1️⃣ **Step 1 - Connect to the Database**
-           - Establishes a connection to the SQLite database where event data is stored.
-
-        2️⃣ **Step 2 - Fetch Tournaments from the Database**
-           - Retrieves all active tournaments from the `active_tournaments` table.
-
-        3️⃣ **Step 3 - Fetch Campaigns from the Database**
-           - Retrieves all active campaigns from the `active_campaigns` table.
+        **Implementation Decisions:**
+        - The query runs on the database worker thread; a "Loading events..." label is shown until
+          `show_all_events()` receives the result, so the window opens at once even on a busy database.
 
-        4️⃣ **Step 4 - Close the Database Connection**
-           - Closes the connection to free up resources after fetching the data.
-
-        5️⃣ **Step 5 - Handle Case Where No Events Exist**
-           - If no tournaments or campaigns exist, display a message informing the user.
-
-        6️⃣ **Step 6 - Populate the UI with Tournaments**
-           - Iterates through the tournament data and creates widgets for each.
+        **Step-by-Step Breakdown:**
+        1️⃣ **Step 1 - Show the Loading State**
+           - Displays a placeholder label while the events are fetched.
 
-        7️⃣ **Step 7 - Populate the UI with Campaigns**
-           - Iterates through the campaign data and creates widgets for each.
+        2️⃣ **Step 2 - Fetch Every Event**
+           - One query on the shared `events` table returns unfinished tournaments (by start time) and campaigns.
         """
         
-        # Step 1 - Connect to the Database
-        conn = sqlite3.connect("src/game_cafe.db")  # Establish database connection
-        cursor = conn.cursor()  # Create a cursor object for executing SQL queries
+        # Step 1 - Show the Loading State
+        self.no_event_label = QLabel("Loading events...")
+        self.no_event_label.setStyleSheet("font-size: 14px; color: gray;")
+        self.event_layout.addWidget(self.no_event_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        # Step 2 - Fetch Tournaments from the Database
-        cursor.execute("""
-            SELECT event_name, game_type, event_type, date, time, entry_fee, prize, max_players
-            FROM active_tournaments
-        """)
-        tournaments = cursor.fetchall()  # Store retrieved tournament data
+        # Step 2 - Fetch Every Event (finished tournaments are left out)
+        run_read(self, self.events.get_upcoming_events, on_result=self.show_all_events)
 
-        # Step 3 - Fetch Campaigns from the Database
-        cursor.execute("""
-            SELECT campaign_name, game_type, host, meet_day, meet_frequency, time, max_players
-            FROM active_campaigns
-        """)
-        campaigns = cursor.fetchall()  # Store retrieved campaign data
-
-        # Step 4 - Close the Database Connection
-        conn.close()  # Close the connection to free up resources
+    def show_all_events(self, events):
+        """
+        **Replaces the loading label with the fetched events.**
 
-        # Step 5 - Handle Case Where No Events Exist
-        if not tournaments and not campaigns:
-            no_event_label = QLabel("No upcoming events at the cafe.")  # Create message label
-            no_event_label.setStyleSheet("font-size: 14px; color: gray;")  # Style the message
-            self.event_layout.addWidget(no_event_label, alignment=Qt.AlignmentFlag.AlignCenter)  # Add to layout
-            return  # Exit function since there are no events
+        **Step-by-Step Breakdown:**
+        1️⃣ **Step 1 - Handle Case Where No Events Exist**
+           - If no tournaments or campaigns exist, the label tells the user instead.
 
-        # Step 6 - Populate the UI with Tournaments
-        for tournament in tournaments:
-            event_widget = self.create_tournament_widget(tournament)  # Create a widget for each tournament
-            self.event_layout.addWidget(event_widget)  # Add tournament widget to the UI
+        2️⃣ **Step 2 - Populate the UI**
+           - Creates a tournament or campaign widget for each event, depending on its kind.
+        """
 
-        # Step 7 - Populate the UI with Campaigns
-        for campaign in campaigns:
-            event_widget = self.create_campaign_widget(campaign)  # Create a widget for each campaign
-            self.event_layout.addWidget(event_widget)  # Add campaign widget to the UI
+        # Step 1 - Handle Case Where No Events Exist
+        if not events and not self.event_frames:
+            self.no_event_label.setText("No upcoming events at the cafe.")
+            return  # Exit function since there are no events
+        if self.no_event_label is not None:  # A change may have arrived (and removed it) first
+            self.event_layout.removeWidget(self.no_event_label)
+            self.no_event_label.deleteLater()
+            self.no_event_label = None
+
+        # Step 2 - Populate the UI
+        for event in events:
+            if (event["kind"], event["name"]) in self.event_frames:
+                continue  # Already added by a change that arrived before the full list
+            event_widget = self.create_event_widget(event)  # Create a widget for each event
+            self.event_layout.addWidget(event_widget)  # Add event widget to the UI
+            self.event_frames[(event["kind"], event["name"])] = event_widget
+
+    def create_event_widget(self, event: dict) -> QFrame:
+        """ Creates the tournament or campaign widget matching the event's kind. """
+        if event["kind"] == "tournament":
+            return self.create_tournament_widget(event)
+        return self.create_campaign_widget(event)
+
+    def patch_events(self, changes: list) -> None:
+        """
+        **Replaces, adds or removes only the event widgets that changed.**
 
+        **Parameters:**
+        - `changes` (list): `(kind, name)` pairs from the change notifier, kind `"tournament"` or `"campaign"`.
+        """
+        def fetch():
+            return [(kind, name, self.events.get_event(name)) for kind, name in changes]
+
+        run_read(self, fetch, on_result=self.apply_event_changes)
+
+    def apply_event_changes(self, changed: list) -> None:
+        """ Swaps in the widgets for events fetched by `patch_events()`; `None` means the event was removed. """
+        for kind, name, event in changed:
+            old_widget = self.event_frames.pop((kind, name), None)
+            if event is not None and event["kind"] == kind:
+                new_widget = self.create_event_widget(event)
+                if old_widget is not None:
+                    self.event_layout.insertWidget(self.event_layout.indexOf(old_widget), new_widget)  # Same position
+                else:
+                    self.event_layout.addWidget(new_widget)
+                self.event_frames[(kind, name)] = new_widget
+            if old_widget is not None:
+                self.event_layout.removeWidget(old_widget)
+                old_widget.deleteLater()
+
+        if self.event_frames and self.no_event_label is not None:
+            self.event_layout.removeWidget(self.no_event_label)
+            self.no_event_label.deleteLater()
+            self.no_event_label = None
+
+    def reload_all_events(self) -> None:
+        """ Rebuilds the whole list after the change notifier lost track of individual changes. """
+        while self.event_layout.count():
+            widget = self.event_layout.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+        self.event_frames.clear()
+        self.no_event_label = None
+        self.load_all_events()
 
     def create_tournament_widget(self, tournament):
         """
@@ -344,10 +402,10 @@ class AllEventsDisplay(QWidget):
         - Includes a sign-up button for user interaction.
         
         **Parameters:**
-        - `tournament` (tuple): A tuple containing tournament details retrieved from the database, structured as:
-            - `event_name` (str): Name of the tournament.
+        - `tournament` (dict): Tournament details from `CurrentEvents`, with the keys:
+            - `name` (str): Name of the tournament.
             - `game_type` (str): Type of game for the tournament.
-            - `event_type` (str): Tournament format (e.g., "Single Elimination").
+            - `type` (str): Tournament format (e.g., "Single Elimination").
             - `date` (str): Date of the tournament.
             - `time` (str): Time of the tournament.
             - `entry_fee` (str): Cost to participate.
@@ -360,7 +418,7 @@ class AllEventsDisplay(QWidget):
            - Applies a dark red theme with a border to match the UI style.
         
         2️⃣ **Step 2 - Extract Tournament Data**
-           - Unpacks the tournament tuple into individual variables.
+           - Unpacks the tournament dictionary into individual variables.
         
         3️⃣ **Step 3 - Create and Style Title Label**
            - Displays the tournament name in bold red text.
@@ -385,7 +443,9 @@ class AllEventsDisplay(QWidget):
         layout = QVBoxLayout()
         
         # Step 2 - Extract Tournament Data
-        event_name, game_type, event_type, date, time, entry_fee, prize, max_players = tournament
+        event_name, game_type, event_type, date, time, entry_fee, prize, max_players = (
+            tournament[key] for key in ("name", "game_type", "type", "date", "time", "entry_fee", "prize", "max_players")
+        )
         
         # Step 3 - Create and Style Title Label
         title = QLabel(event_name)
@@ -440,8 +500,8 @@ class AllEventsDisplay(QWidget):
         - Includes a sign-up button for user interaction.
         
         **Parameters:**
-        - `campaign` (tuple): A tuple containing campaign details retrieved from the database, structured as:
-            - `campaign_name` (str): Name of the campaign.
+        - `campaign` (dict): Campaign details from `CurrentEvents`, with the keys:
+            - `name` (str): Name of the campaign.
             - `game_type` (str): Type of game for the campaign.
             - `host` (str): Name of the Dungeon Master (DM) or campaign host.
             - `meet_day` (str): Day of the week the campaign meets.
@@ -455,7 +515,7 @@ class AllEventsDisplay(QWidget):
            - Applies a dark red theme with a border to match the UI style.
         
         2️⃣ **Step 2 - Extract Campaign Data**
-           - Unpacks the campaign tuple into individual variables.
+           - Unpacks the campaign dictionary into individual variables.
         
         3️⃣ **Step 3 - Create and Style Title Label**
            - Displays the campaign name in bold red text.
@@ -480,7 +540,9 @@ class AllEventsDisplay(QWidget):
         layout = QVBoxLayout()
         
         # Step 2 - Extract Campaign Data
-        campaign_name, game_type, host, meet_day, meet_frequency, time, max_players = campaign
+        campaign_name, game_type, host, meet_day, meet_frequency, time, max_players = (
+            campaign[key] for key in ("name", "game_type", "host", "meet_day", "meet_frequency", "time", "max_players")
+        )
         
         # Step 3 - Create and Style Title Label
         title = QLabel(campaign_name)
@@ -538,6 +600,7 @@ class EventSignUp(QWidget):
         self.controller = controller
         self.event_name = event_name
         self.event_type = event_type
+        self.signups = EventSignUps()  # Handles user lookup and atomic sign-up
         self.setWindowTitle("User Registration")
         self.setGeometry(300, 200, 400, 300)
         self.setup_ui()
@@ -549,19 +612,33 @@ class EventSignUp(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Enter gamertag here...")
 
+        # Suggestions update as the user types, so a typo does not require starting over
+        self.suggestions = QListWidget()
+        self.suggestions.setMaximumHeight(120)
+        self.suggestions.itemClicked.connect(lambda item: self.search_input.setText(item.text()))
+        self.search = GamertagSearch(self)
+        self.search_input.textEdited.connect(self.search.update_text)  # Only user edits, not setText()
+        self.search.suggestions_ready.connect(self.show_suggestions)
+
         # Buttons
-        signup_button = QPushButton("Sign Up")
-        signup_button.clicked.connect(self.sign_up)
+        self.signup_button = QPushButton("Sign Up")
+        self.signup_button.clicked.connect(lambda: self.sign_up())
         cancel_button = QPushButton("Cancel")
         cancel_button.clicked.connect(self.close)
 
         self.layout.addWidget(signup_label)
         self.layout.addWidget(self.search_input)
-        self.layout.addWidget(signup_button)
+        self.layout.addWidget(self.suggestions)
+        self.layout.addWidget(self.signup_button)
         self.layout.addWidget(cancel_button)
 
-    def sign_up(self):
-        """Handles sign-up logic."""
+    def show_suggestions(self, gamertags):
+        """Replaces the suggestion list with the latest matches."""
+        self.suggestions.clear()
+        self.suggestions.addItems(gamertags)
+
+    def sign_up(self, waitlist=False):
+        """Starts the sign-up on the database thread; the form is disabled until it finishes."""
         gamertag = self.search_input.text().strip()
 
         # Make sure the field is filled out
@@ -569,62 +646,54 @@ class EventSignUp(QWidget):
             QMessageBox.warning(self, "Error", "Gamertag cannot be empty!")
             return
 
-        # Get user_id from registered_users
-        user_id = self.get_user_id(gamertag)
+        self.set_busy(True)
+        run_write(self, self.register_sign_up, gamertag, waitlist, on_result=self.show_result, on_error=self.show_error)
 
+    def register_sign_up(self, gamertag, waitlist):
+        """Looks up the gamertag and signs the player up (or queues them). Runs on the database write thread."""
+        user_id = self.signups.get_user_id(gamertag)
         if user_id is None:
+            return None, None
+        result = self.signups.add_user_to_event(user_id, self.event_name, waitlist=waitlist)  # Atomic check-and-insert
+        position = self.signups.waitlist_position(user_id, self.event_name) if result is SignUpResult.WAITLISTED else None
+        return result, position
+
+    def set_busy(self, busy):
+        """Disables the form while a sign-up is in progress."""
+        self.search_input.setEnabled(not busy)
+        self.signup_button.setEnabled(not busy)
+        self.signup_button.setText("Signing up..." if busy else "Sign Up")
+
+    def show_result(self, outcome):
+        """Shows the outcome of `register_sign_up()`."""
+        self.set_busy(False)
+        result, position = outcome
+
+        if result is None:
             QMessageBox.warning(self, "Error", "Gamertag not found. Please register first.")
             return
 
-        # Attempt to add user to event
-        self.add_user_to_event(user_id)
-
-    def get_user_id(self, gamertag):
-        """Retrieves user_id from registered_users based on gamertag."""
-        conn = sqlite3.connect("src/game_cafe.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM registered_users WHERE gamertag = ?", (gamertag,))
-        user_id = cursor.fetchone()
-        conn.close()
-        return user_id[0] if user_id else None  # Returns user_id if found
-
-    def add_user_to_event(self, user_id):
-        """Adds the user to the selected event."""
-        conn = sqlite3.connect("src/game_cafe.db")
-        cursor = conn.cursor()
-
-        # Check current signups for the event
-        cursor.execute("SELECT COUNT(*) FROM event_signup WHERE event_name = ?", (self.event_name,))
-        current_signups = cursor.fetchone()[0]
-
-        # Get max_players for this event
-        cursor.execute("SELECT max_players FROM active_tournaments WHERE event_name = ?", (self.event_name,))
-        max_players = cursor.fetchone()
-
-        if max_players is None:
-            QMessageBox.warning(self, "Error", "Event not found!")
-            conn.close()
+        # Offer the waitlist instead of turning the player away
+        if result is SignUpResult.FULL:
+            answer = QMessageBox.question(self, "Event Full", f"{self.event_name} is full. Join the waitlist?")
+            if answer == QMessageBox.StandardButton.Yes:
+                self.sign_up(waitlist=True)
             return
 
-        max_players = int(max_players[0])  # Extract integer value
-
-        # Check if event is full
-        if current_signups >= max_players:
-            QMessageBox.warning(self, "Error", "This event is already full!")
-            conn.close()
+        if position is not None:  # None means a seat opened in the meantime and they were promoted
+            QMessageBox.information(self, "Waitlist", f"You are number {position} on the waitlist for {self.event_name}.\n"
+                                                      "You will be signed up automatically when a spot opens.")
+            self.close()
             return
 
-        # Check if user is already signed up
-        cursor.execute("SELECT 1 FROM event_signup WHERE gamertag = ? AND event_name = ?", (user_id, self.event_name))
-        if cursor.fetchone():
-            QMessageBox.warning(self, "Error", "You are already signed up for this event!")
-            conn.close()
+        if result not in (SignUpResult.OK, SignUpResult.WAITLISTED):
+            QMessageBox.warning(self, "Error", result.message)
             return
 
-        # Insert into signups table
-        cursor.execute("INSERT INTO event_signup (gamertag, event_name) VALUES (?, ?)", (user_id, self.event_name))
-        conn.commit()
-        conn.close()
-
         QMessageBox.information(self, "Success", f"Successfully signed up for {self.event_name}!")
         self.close()
+
+    def show_error(self, error):
+        """Re-enables the form after the database could not be reached."""
+        self.set_busy(False)
+        QMessageBox.warning(self, "Error", f"Could not sign up right now, please try again.\n({error})")
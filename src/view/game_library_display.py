@@ -5,6 +5,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtCore import Qt, QSize
 from model.game_library import GameLibrary  # Import GameLibrary class
+from model.instrumentation import Timed
+
+_icon_cache = {}  # Image path -> QIcon, so reopening the library does not decode every image again
 
 class GameDisplay(QWidget):
     """
@@ -61,9 +64,9 @@ class GameDisplay(QWidget):
         - Each category section needs to be scrollable for better navigation.
 
         **Step-by-Step Explanation:**
-        1️⃣ **Step 1 - Retrieve and Organize Game Data**
-           - Fetches all games from `GameLibrary`.
-           - Groups them into categories.
+        1️⃣ **Step 1 - Retrieve Game Data**
+           - Fetches the game catalog from `GameLibrary`.
+           - Games are already grouped by category in the catalog, so no grouping happens here.
 
         2️⃣ **Step 2 - Create Scrollable Sections for Each Category**
            - Labels each category.
@@ -77,19 +80,12 @@ class GameDisplay(QWidget):
            - Adds the scrollable container to the main layout.
         """
         
-        game_lib = GameLibrary()  # Step 1: Create an instance of GameLibrary to access stored game data.
-        games = game_lib.games  # Retrieve the dictionary containing all game information.
-
-        # Step 1 - Group games by category
-        categorized_games = {}  # Dictionary to store games categorized by type.
-        for game, details in games.items():
-            category, image_path = details  # Extract the category and image path for each game.
-            if category not in categorized_games:  # If the category doesn't exist, create an entry.
-                categorized_games[category] = []
-            categorized_games[category].append((game, image_path))  # Append the game to its respective category.
+        game_lib = GameLibrary()  # Step 1: Create an instance of GameLibrary to access the shared game catalog.
+        catalog = game_lib.catalog  # Games are already grouped by category when the catalog is loaded.
 
         # Step 2 - Create a scrollable section for each category
-        for category, games_list in categorized_games.items():
+        for category in catalog.categories:
+            games_list = catalog.by_category[category]  # Prebuilt group, no regrouping needed
             # --- Create Category Label ---
             category_label = QLabel(category.capitalize())  # Capitalize and display the category name.
             category_label.setStyleSheet("font-size: 18px; font-weight: bold; margin-top: 10px;")  # Style the label.
@@ -108,8 +104,8 @@ class GameDisplay(QWidget):
             game_container.setLayout(game_layout)  # Apply the layout to the container.
 
             # Step 3 - Populate the category section with game images/titles
-            for game_name, image_path in games_list:
-                game_entry = self.create_game_entry(game_name, image_path)  # Create a game entry widget.
+            for game in games_list:
+                game_entry = self.create_game_entry(game.title, game.image_path)  # Create a game entry widget.
                 game_layout.addWidget(game_entry)  # Add the game entry widget to the layout.
 
             # Step 4 - Add the game container to the scroll area
@@ -151,9 +147,12 @@ class GameDisplay(QWidget):
 
         # Step 1 - Create a Clickable Image Button
         game_button = QPushButton()  # Create a QPushButton for the game image
-        pixmap = QPixmap(image_path)  # Load the image from the given file path
-        icon = QIcon(pixmap)  # Convert the pixmap into an icon format
-        game_button.setIcon(QIcon(pixmap))  # Set the button's icon as the game image
+        icon = _icon_cache.get(image_path)  # Reuse the icon if this image was loaded before
+        if icon is None:
+            with Timed("GameDisplay.load_icon"):
+                icon = QIcon(QPixmap(image_path))  # Load the image from the given file path and convert it to an icon
+            _icon_cache[image_path] = icon
+        game_button.setIcon(icon)  # Set the button's icon as the game image
         game_button.setIconSize(QSize(200, 200))  # Resize the icon to fit within 200x200 pixels
         game_button.setStyleSheet("border: none;")  # Remove any default button borders
 
@@ -1,7 +1,8 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QLineEdit, QPushButton, QMessageBox
 )
-import sqlite3
+from model.registered_users import RegisteredUsers
+from view.db_worker import run_write
 
 class Registration(QWidget):
     """
@@ -20,6 +21,7 @@ class Registration(QWidget):
     def __init__(self):
         """ Initializes the registration form UI. """
         super().__init__()  # Initialize QWidget
+        self.users = RegisteredUsers()  # Handles registered user storage
         self.setWindowTitle("User Registration")  # Set title
         self.setGeometry(300, 200, 400, 300)  # Set window size
         self.setup_ui()  # Load UI elements
@@ -100,6 +102,8 @@ class Registration(QWidget):
         
         4️⃣ **Step 4 - Store User in Database**
            - If valid, stores user data.
+           - Steps 3 and 4 run together on the database write thread (`save_registration()`); the
+             Register button shows "Registering..." until `show_registration()` gets the outcome.
         
         5️⃣ **Step 5 - Display Success Message**
            - Notifies user of successful registration.
@@ -117,14 +121,35 @@ class Registration(QWidget):
             QMessageBox.warning(self, "Input Error", "All fields are required!")
             return
 
-        # Step 3: Check if gamertag or email already exists
-        if self.check_gamertag_email(gamertag, email):
+        # Steps 3-4: Check for duplicates and store the user, off the GUI thread
+        self.set_busy(True)
+        run_write(self, self.save_registration, fname, lname, gamertag, email,
+                  on_result=self.show_registration, on_error=self.show_error)
+
+    def save_registration(self, fname: str, lname: str, gamertag: str, email: str) -> bool:
+        """ Steps 3-4 of `register_user()`; runs on the database write thread. Returns `False` for a duplicate. """
+        if self.check_gamertag_email(gamertag, email):  # Step 3: Check if gamertag or email already exists
+            return False
+        self.store_user(fname, lname, gamertag, email)  # Step 4: Store user in the database
+        return True
+
+    def set_busy(self, busy: bool) -> None:
+        """ Disables the Register button while the registration is being saved. """
+        self.register_button.setEnabled(not busy)
+        self.register_button.setText("Registering..." if busy else "Register")
+
+    def show_error(self, error: Exception) -> None:
+        """ Re-enables the form after the database could not be reached. """
+        self.set_busy(False)
+        QMessageBox.warning(self, "Error", f"Could not register right now, please try again.\n({error})")
+
+    def show_registration(self, registered: bool) -> None:
+        """ Steps 5-6 of `register_user()`, once the database has answered. """
+        self.set_busy(False)
+        if not registered:
             QMessageBox.warning(self, "Error", "Gamer tag or email already exists!")
             return
 
-        # Step 4: Store user in the database
-        self.store_user(fname, lname, gamertag, email)
-
         # Step 5: Show success message
         QMessageBox.information(self, "Success", "User registered successfully!")
 
@@ -160,15 +185,7 @@ class Registration(QWidget):
         5️⃣ **Step 5 - Return Result**
            - Returns `True` if a matching record exists, otherwise returns `False`.
         """
-        conn = sqlite3.connect("src/game_cafe.db")  # Step 1: Connect to database
-        cursor = conn.cursor()  # Step 1: Create cursor for executing SQL queries
-        
-        cursor.execute("SELECT 1 FROM registered_users WHERE gamertag = ? OR email = ?", (gamertag, email))  # Step 2: Execute query
-        
-        exists = cursor.fetchone() is not None  # Step 3: Check if query returned a result
-        
-        conn.close()  # Step 4: Close database connection
-        return exists  # Step 5: Return True if found, False otherwise
+        return self.users.gamertag_or_email_exists(gamertag, email)  # Steps 1-5: Query and return result
 
     def store_user(self, fname: str, lname: str, gamertag: str, email: str) -> None:
         """
@@ -187,17 +204,9 @@ class Registration(QWidget):
         
         3️⃣ **Step 3 - Commit Changes**
            - Ensures that the newly registered user is saved in the database.
+           - If another kiosk is writing, waits and retries instead of failing with "database is locked".
         
         4️⃣ **Step 4 - Close Connection**
            - Closes the database connection to free up resources.
         """
-        conn = sqlite3.connect("src/game_cafe.db")  # Step 1: Connect to database
-        cursor = conn.cursor()  # Step 1: Create cursor
-        
-        cursor.execute(
-            "INSERT INTO registered_users (gamertag, fname, lname, email) VALUES (?, ?, ?, ?)",
-            (gamertag, fname, lname, email)
-        )  # Step 2: Insert user data into the database
-        
-        conn.commit()  # Step 3: Save changes
-        conn.close()  # Step 4: Close connection
\ No newline at end of file
+        self.users.add_user(fname, lname, gamertag, email)  # Steps 1-4: Insert and commit, retrying if the database is busy
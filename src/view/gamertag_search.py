@@ -0,0 +1,85 @@
+import logging
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from model.registered_users import RegisteredUsers
+
+logger = logging.getLogger(__name__)
+
+DEBOUNCE_MS = 150  # Wait this long after the last keystroke before searching
+
+
+class _SearchSignals(QObject):
+    """ Carries a finished search back to the GUI thread (QRunnable cannot emit signals itself). """
+    finished = pyqtSignal(int, list)  # (request number, suggestions)
+
+
+class _SearchTask(QRunnable):
+    """ Runs one gamertag suggestion query on a thread-pool thread. """
+
+    def __init__(self, request: int, text: str, users: RegisteredUsers, signals: _SearchSignals):
+        super().__init__()
+        self.request = request
+        self.text = text
+        self.users = users
+        self.signals = signals
+
+    def run(self):
+        """ Queries the database and reports the suggestions (none if the query failed). """
+        try:
+            suggestions = self.users.suggest_gamertags(self.text)
+        except Exception:  # QThreadPool drops exceptions silently, and the list would stop updating
+            logger.exception("gamertag suggestions failed text=%r", self.text)
+            suggestions = []
+        self.signals.finished.emit(self.request, suggestions)
+
+
+class GamertagSearch(QObject):
+    """
+    **GamertagSearch Class**
+
+    **Class Purpose:**
+    - Turns keystrokes in a gamertag box into suggestion lists, without blocking the GUI.
+
+    **Why This Class Exists:**
+    - Querying on every keystroke, on the GUI thread, would make typing stutter on a busy database.
+
+    **Implementation Decisions:**
+    - A single-shot `QTimer` restarts on every keystroke, so only the final text after a pause is searched.
+    - Queries run on `QThreadPool`; each opens its own SQLite connection, so no connection crosses threads.
+    - Every request is numbered and only the newest result is delivered; a slow old query can never
+      overwrite suggestions for newer text.
+    """
+
+    suggestions_ready = pyqtSignal(list)  # Emitted with the gamertags for the latest text
+
+    def __init__(self, parent=None):
+        """ Initializes the debounce timer and background search machinery. """
+        super().__init__(parent)
+        self.users = RegisteredUsers()
+        self.pool = QThreadPool.globalInstance()
+        self.signals = _SearchSignals()
+        self.signals.finished.connect(self._on_finished)
+        self.pending_text = ""
+        self.latest_request = 0  # Number of the most recent search started
+
+        self.debounce = QTimer(self)
+        self.debounce.setSingleShot(True)
+        self.debounce.setInterval(DEBOUNCE_MS)
+        self.debounce.timeout.connect(self._start_search)
+
+    def update_text(self, text: str) -> None:
+        """ Call on every edit; schedules a search once typing pauses. """
+        self.pending_text = text
+        self.debounce.start()  # Restarting cancels the previous countdown
+
+    def _start_search(self) -> None:
+        """ Starts a background query for the pending text. """
+        self.latest_request += 1
+        if not self.pending_text.strip():
+            self.suggestions_ready.emit([])  # Nothing to search for
+            return
+        self.pool.start(_SearchTask(self.latest_request, self.pending_text, self.users, self.signals))
+
+    def _on_finished(self, request: int, suggestions: list) -> None:
+        """ Delivers results, dropping any that belong to outdated text. """
+        if request == self.latest_request:
+            self.suggestions_ready.emit(suggestions)
@@ -0,0 +1,114 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, QFileDialog
+)
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from model.bulk_import import BulkImporter
+from view.db_worker import run_write
+
+MAX_SHOWN_ERRORS = 500  # Keeps the results box responsive for very large files
+
+
+class _ImportProgress(QObject):
+    """ Carries batch progress from the database write thread back to the GUI thread. """
+    progress = pyqtSignal(int, int)  # (rows read, rows imported)
+
+
+class ImportDialog(QDialog):
+    """
+    **ImportDialog Class**
+
+    **Class Purpose:**
+    - Admin window for importing members or event sign-ups from a CSV spreadsheet.
+
+    **Why This Class Exists:**
+    - Staff preparing convention weekends need the bulk importer without a terminal.
+    - Shows a summary and every rejected row with its line number so the spreadsheet can be fixed.
+
+    **Implementation Decisions:**
+    - A 100k-row file takes long enough to freeze the kiosk, so the import runs on the database
+      write thread (`run_write`); progress after each batch and the final report come back
+      through queued signals.
+    """
+
+    def __init__(self, parent=None):
+        """ Initializes the import dialog UI. """
+        super().__init__(parent)
+        self.setWindowTitle("Bulk Import")
+        self.setGeometry(300, 200, 600, 450)
+        self.importer = BulkImporter()
+        self.progress = _ImportProgress()  # No parent: the write thread may still emit after the dialog closes
+        self.progress.progress.connect(self.show_progress)
+
+        layout = QVBoxLayout(self)
+        info_label = QLabel(
+            "Members CSV header: fname, lname, gamertag, email\n"
+            "Sign-ups CSV header: gamertag, event_name"
+        )
+        layout.addWidget(info_label)
+
+        # Import buttons
+        button_row = QHBoxLayout()
+        self.members_button = QPushButton("Import Members...")
+        self.members_button.clicked.connect(lambda: self.run_import("members"))
+        self.signups_button = QPushButton("Import Sign-Ups...")
+        self.signups_button.clicked.connect(lambda: self.run_import("signups"))
+        button_row.addWidget(self.members_button)
+        button_row.addWidget(self.signups_button)
+        layout.addLayout(button_row)
+
+        # Results area
+        self.results = QTextEdit()
+        self.results.setReadOnly(True)
+        layout.addWidget(self.results)
+
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        layout.addWidget(close_button, alignment=Qt.AlignmentFlag.AlignCenter)
+
+    def run_import(self, kind: str) -> None:
+        """
+        **Asks for a CSV file and starts importing it on the database write thread.**
+
+        **Parameters:**
+        - `kind` (str): `"members"` or `"signups"`.
+        """
+        path, _ = QFileDialog.getOpenFileName(self, "Choose CSV File", "", "CSV Files (*.csv)")
+        if not path:
+            return  # User cancelled
+
+        self.set_busy(True)
+        self.results.setPlainText("Importing...")
+        run_write(self, self.import_file, kind, path, on_result=self.show_report, on_error=self.show_error)
+
+    def import_file(self, kind: str, path: str):
+        """ Reads and imports the file. Runs on the database write thread. """
+        def report_progress(report):
+            self.progress.progress.emit(report.rows_read, report.imported)
+
+        with open(path, newline="", encoding="utf-8-sig") as csv_file:
+            if kind == "members":
+                return self.importer.import_members(csv_file, report_progress)
+            return self.importer.import_signups(csv_file, report_progress)
+
+    def set_busy(self, busy: bool) -> None:
+        """ Disables the import buttons while an import is running. """
+        self.members_button.setEnabled(not busy)
+        self.signups_button.setEnabled(not busy)
+
+    def show_progress(self, rows_read: int, imported: int) -> None:
+        """ Shows how far the running import has got. """
+        self.results.setPlainText(f"Importing... {rows_read} rows read, {imported} imported so far")
+
+    def show_report(self, report) -> None:
+        """ Shows the summary and the rejected rows of a finished import. """
+        self.set_busy(False)
+        lines = [str(report)]
+        lines += [f"line {line}: {reason}" for line, reason in report.errors[:MAX_SHOWN_ERRORS]]
+        if len(report.errors) > MAX_SHOWN_ERRORS:
+            lines.append(f"... and {len(report.errors) - MAX_SHOWN_ERRORS} more (use src/import_csv.py --errors for the full list)")
+        self.results.setPlainText("\n".join(lines))
+
+    def show_error(self, error) -> None:
+        """ Shows why the import could not run (unreadable file, bad header, database unavailable). """
+        self.set_busy(False)
+        self.results.setPlainText(f"Import failed: {error}")
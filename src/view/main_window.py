@@ -1,13 +1,18 @@
 from view.news_feed import NewsFeed
 from model.current_events import CurrentEvents
+from model.event_search import EventSearch
+from model.matchmaking import MATCH_INTERVAL_MS, MatchmakingQueue
 from view.gamers import Registration
+from view.db_worker import run_read, run_write
 from PyQt6.QtWidgets import (
     QMainWindow, QPushButton, QVBoxLayout, QWidget, QLabel, 
-    QHBoxLayout, QListWidget, QListWidgetItem, QMessageBox
+    QHBoxLayout, QListWidget, QListWidgetItem, QMessageBox, QLineEdit
 )
-from PyQt6.QtGui import QFont, QPixmap
+from PyQt6.QtGui import QFont, QPixmap, QShortcut, QKeySequence
 from PyQt6.QtCore import Qt, QTimer
-import sqlite3
+import logging
+
+logger = logging.getLogger(__name__)
 
 class MainWindow(QMainWindow):
     """
@@ -20,6 +25,7 @@ class MainWindow(QMainWindow):
         event_list (database query]): A list of upcoming events at the cafe.
         current_event_index (int): The index of the currently displayed event.
         timer (QTimer): Timer to cycle through events.
+        matchmaking_timer (QTimer): Timer that pairs players in the casual matchmaking queue.
     """
 
     def __init__(self, controller):
@@ -88,7 +94,8 @@ class MainWindow(QMainWindow):
 
         # Load events and set timer for cycling through them
         self.events = CurrentEvents()
-        self.event_list = self.get_all_events()
+        self.event_list = [{"name": "Loading events...", "game_name": None}]  # Shown until the query returns
+        self.load_events()
         self.current_event_index = 0
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_active_events)
@@ -108,6 +115,22 @@ class MainWindow(QMainWindow):
         welcome_label.setFont(QFont("Arial", 24, QFont.Weight.DemiBold))
         welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
+        # Search box for events and games (results appear as the user types)
+        self.search = EventSearch()
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search events, hosts and games...")
+        self.search_results = QListWidget()
+        self.search_results.setMaximumHeight(160)
+        self.search_results.hide()  # Only shown while there is something to show
+        self.search_results.itemClicked.connect(self.open_search_result)
+        self.search_timer = QTimer(self)  # Debounce: search once typing pauses
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.update_search_results)
+        self.search_input.textChanged.connect(lambda: self.search_timer.start())  # Restart countdown on each edit
+        button_layout.addWidget(self.search_input)
+        button_layout.addWidget(self.search_results)
+
         # List of menu buttons
         buttons = [
             ("Game Library", "resources/images/icon_library.png", "resources/images/library.png", self.controller.open_game_library),
@@ -152,42 +175,81 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(button_layout, 1)
         main_layout.addWidget(self.right_container, 2)
 
-    def get_all_events(self):
-        """
-        Gets all active cafe-hosted events (tournaments & campaigns) from the database.
-        """
-        event_messages = []
+        # Hidden staff shortcuts (not shown to customers)
+        self.import_shortcut = QShortcut(QKeySequence("Ctrl+Shift+I"), self)
+        self.import_shortcut.activated.connect(self.controller.open_bulk_import)
 
-        conn = sqlite3.connect("src/game_cafe.db")  # Relative path to database file
-        cursor = conn.cursor()
+        # Hidden staff shortcut: Ctrl+Shift+D opens timing diagnostics
+        self.diagnostics_shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        self.diagnostics_shortcut.activated.connect(self.controller.open_diagnostics)
 
-        # Fetch all tournaments
-        cursor.execute("SELECT event_name, game_type, event_type, date, time FROM active_tournaments")
-        tournaments = cursor.fetchall()
+        # Hidden staff shortcut: profile every window open (cProfile files in src/logs/profiles)
+        self.profiling_shortcut = QShortcut(QKeySequence("Ctrl+Shift+P"), self)
+        self.profiling_shortcut.activated.connect(self.toggle_profiling)
 
-        # Fetch all campaigns
-        cursor.execute("SELECT campaign_name, game_type, host, meet_day, meet_frequency, time FROM active_campaigns")
-        campaigns = cursor.fetchall()
+        # Pair players waiting for a casual opponent in the background and announce new matches
+        self.matchmaking = MatchmakingQueue()
+        self.matchmaking_request = None  # Pending matcher run, so slow runs never pile up
+        self.matchmaking_timer = QTimer(self)
+        self.matchmaking_timer.timeout.connect(self.run_matchmaking)
+        self.matchmaking_timer.start(MATCH_INTERVAL_MS)
 
-        conn.close()
+    def load_events(self):
+        """
+        Starts loading all active cafe-hosted events (tournaments & campaigns) off the GUI thread.
+        """
+        run_read(self, self.events.get_upcoming_events, on_result=self.show_events)
 
-        # Format tournaments for display
-        for event_name, game_type, event_type, date, time in tournaments:
-            event_messages.append({
-                "name": f"🎮\n{event_name}\n{date}\n{time}",
-                "game_name": game_type
-            })
+    def show_events(self, events):
+        """
+        Formats the loaded events for the cycling event list.
+        """
+        event_messages = []
 
-        # Format campaigns for display
-        for campaign_name, game_type, host, meet_day, meet_frequency, time in campaigns:
-            event_messages.append({
-                "name": f"📜\n{campaign_name}\n(DM: {host})\n{meet_day}, {meet_frequency} @ {time}",
-                "game_name": game_type
-            })
+        # One query returns unfinished tournaments (by start time) and campaigns
+        for event in events:
+            if event["kind"] == "tournament":
+                event_messages.append({
+                    "name": f"🎮\n{event['name']}\n{event['date']}\n{event['time']}",
+                    "game_name": event["game_type"]
+                })
+            else:
+                event_messages.append({
+                    "name": f"📜\n{event['name']}\n(DM: {event['host']})\n{event['meet_day']}, {event['meet_frequency']} @ {event['time']}",
+                    "game_name": event["game_type"]
+                })
         # Format a message if there are not any active events for the chosen game
-        return event_messages if event_messages else [{"name": "No upcoming events at the cafe.", "game_name": None}]
+        self.event_list = event_messages if event_messages else [{"name": "No upcoming events at the cafe.", "game_name": None}]
+        self.current_event_index = 0
+        self.update_active_events()
 
 
+    def run_matchmaking(self):
+        """
+        Runs the casual matcher on the database write thread, unless the previous run is still going.
+        """
+        if self.matchmaking_request is not None and not self.matchmaking_request.done():
+            return
+        self.matchmaking_request = run_write(self, self.matchmaking.run_matcher, on_result=self.announce_matches)
+
+    def announce_matches(self, matches):
+        """
+        Shows newly paired casual players in the status bar.
+        """
+        if matches:
+            text = "   ".join(f"🎲 {first} vs {second} ({game_title})" for game_title, first, second in matches)
+            self.statusBar().showMessage(f"Opponent found! {text}", 60000)  # Keep it up for a minute
+
+    def toggle_profiling(self):
+        """
+        Turns window-open profiling on or off and tells staff where the files go.
+        """
+        if self.controller.toggle_profiling():
+            QMessageBox.information(self, "Profiling On", "Opening a window now saves a profile to src/logs/profiles.\n"
+                                                          "Press Ctrl+Shift+P again to stop.")
+        else:
+            QMessageBox.information(self, "Profiling Off", "Window opens are no longer profiled.")
+
     def update_active_events(self):
         """
         Cycles through events and updates the QListWidget to display each event for a short duration.
@@ -211,13 +273,46 @@ class MainWindow(QMainWindow):
             self.active_events.itemClicked.connect(self.open_selected_event)
             self.event_connected = True 
 
+    def update_search_results(self):
+        """
+        Searches for the text in the search box on a database thread; `show_search_results` draws the results.
+        """
+        text = self.search_input.text()
+        run_read(self, self.search.search, text, on_result=lambda results: self.show_search_results(text, results))
+
+    def show_search_results(self, text, results):
+        """
+        Shows the ranked search results for `text`, unless the search box has changed since it was searched.
+        """
+        if text != self.search_input.text():
+            return  # A newer search is on its way
+        self.search_results.clear()
+
+        icons = {"tournament": "🎮", "campaign": "📜", "game": "🎲"}
+        for result in results:
+            item = QListWidgetItem(f"{icons[result['kind']]} {result['name']}  ({result['game_type']})")
+            item.setData(Qt.ItemDataRole.UserRole, result["game_type"])
+            self.search_results.addItem(item)
+
+        self.search_results.setVisible(bool(results) or bool(text.strip()))
+        if text.strip() and not results:
+            self.search_results.addItem("No matching events or games.")
+
+    def open_search_result(self, item):
+        """
+        Opens the events window for the game of the clicked search result.
+        """
+        game_name = item.data(Qt.ItemDataRole.UserRole)
+        if game_name:
+            self.controller.on_game_clicked(game_name)
+
     def open_selected_event(self, item):
         """
         Opens the event display window when an event is clicked.
         """
         game_name = item.data(Qt.ItemDataRole.UserRole)  
         if game_name:
-            print(f"Opening events for: {game_name}")  # Debugging
+            logger.debug("opening events game=%s", game_name)
             self.controller.on_game_clicked(game_name)
         else:
             QMessageBox.warning(self, "Error", "No game associated with this event.")
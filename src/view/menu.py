@@ -4,6 +4,7 @@ from model.order import *
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QScrollArea
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QPixmap
+from model.instrumentation import Timed
 
 class MenuWindow(QWidget):
     def __init__(self, controller):
@@ -102,7 +103,8 @@ class MenuWindow(QWidget):
 
         # Image
         image_label = QLabel()
-        pixmap = QPixmap(item.photo)
+        with Timed("MenuWindow.load_image"):
+            pixmap = QPixmap(item.photo)
         pixmap = pixmap.scaled(QSize(50, 50), Qt.AspectRatioMode.KeepAspectRatio)  # Resize image
         image_label.setPixmap(pixmap)
 
@@ -1,8 +1,12 @@
+import logging
 import feedparser
 import requests
 from PyQt6.QtWidgets import QWidget, QLabel, QHBoxLayout, QStackedWidget, QPushButton, QVBoxLayout, QTextEdit
 from PyQt6.QtGui import QFont, QPixmap
 from PyQt6.QtCore import Qt, QTimer
+from model.instrumentation import Timed
+
+logger = logging.getLogger(__name__)
 
 class NewsFeed(QWidget):
     """
@@ -168,16 +172,17 @@ class NewsFeed(QWidget):
                 image_label = QLabel()
                 pixmap = QPixmap()
                 try:
-                    response = requests.get(news["image"], timeout=5)  # Fetch image with timeout
-                    response.raise_for_status()  # Check if request was successful
-                    pixmap.loadFromData(response.content)  # Load image from fetched data
+                    with Timed("NewsFeed.load_image"):
+                        response = requests.get(news["image"], timeout=5)  # Fetch image with timeout
+                        response.raise_for_status()  # Check if request was successful
+                        pixmap.loadFromData(response.content)  # Load image from fetched data
                     pixmap = pixmap.scaled(180, 100, Qt.AspectRatioMode.KeepAspectRatio)  # Resize image proportionally
                     image_label.setPixmap(pixmap)  # Set image to label
                     image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)  # Center the image
                     image_label.setStyleSheet("border: none;")  # Remove any border
                     news_layout.addWidget(image_label)  # Add image to layout
                 except requests.exceptions.RequestException:
-                    print(f"Failed to load image: {news['image']}")  # Print error message if image fails to load
+                    logger.warning("failed to load news image url=%s", news["image"])  # Log if image fails to load
 
             # Step 4 - If a description exists, add it to the layout
             if news["description"]:
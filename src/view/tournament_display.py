@@ -1,3 +1,4 @@
+import logging
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget, 
     QTableWidgetItem, QFrame, QHeaderView, QScrollArea
@@ -5,6 +6,25 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from model.current_events import CurrentEvents
 from model.tournament import *
+from model.match_results import MatchResults
+from view.change_notifier import change_notifier
+from view.db_worker import run_read
+
+logger = logging.getLogger(__name__)
+
+
+def load_bracket(tournament_dict: dict) -> Tournament:
+    """
+    **Builds a tournament's bracket, on its planned tables, with every recorded result applied.**
+
+    - Runs on a database thread (see `view/db_worker.py`).
+
+    **Raises:**
+    - `ValueError`: If the tournament type is unknown.
+    """
+    tournament = create_tournament(tournament_dict)  # Generates the rounds on the tables from the day's table plan
+    MatchResults().apply(tournament)  # Replay recorded winners
+    return tournament
 
 
 class TournamentDisplay(QWidget):
@@ -87,7 +107,7 @@ class TournamentDisplay(QWidget):
            - Creates an instance of `CurrentEvents` to retrieve stored tournaments.
         
         2️⃣ **Step 2 - Retrieve All Tournaments**
-           - Calls `get_all_tournaments()` to obtain tournament data.
+           - Calls `get_all_tournaments()` on a database thread, with a loading label shown meanwhile.
         
         3️⃣ **Step 3 - Check if Tournaments Exist**
            - If no tournaments exist, displays a message to inform users.
@@ -98,10 +118,18 @@ class TournamentDisplay(QWidget):
         
         # Step 1 - Fetch Tournament Data
         self.events = CurrentEvents()  # Create an instance of CurrentEvents to retrieve tournament data
+        self.loading_label = QLabel("Loading tournaments...")  # Shown until the query returns
+        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.tournament_layout.addWidget(self.loading_label)
         
-        # Step 2 - Retrieve All Tournaments
-        all_tournaments = self.events.get_all_tournaments()  # Fetch all stored tournaments from the database
-        
+        # Step 2 - Retrieve All Tournaments (on a database thread; `show_tournaments()` does Steps 3-4)
+        run_read(self, self.events.get_all_tournaments, on_result=self.show_tournaments)
+
+    def show_tournaments(self, all_tournaments: list) -> None:
+        """ Replaces the loading label with the fetched tournaments (Steps 3-4 of `load_tournaments()`). """
+        self.tournament_layout.removeWidget(self.loading_label)
+        self.loading_label.deleteLater()
+
         # Step 3 - Check if Tournaments Exist
         if not all_tournaments:  # If the list of tournaments is empty
             no_tournaments = QLabel("No tournaments currently available.")  # Create a label for displaying the message
@@ -197,7 +225,7 @@ class TournamentDisplay(QWidget):
         - The function takes in a dictionary because tournaments are fetched dynamically from storage.
         - The `-> None` annotation is used because this function does not return a value; it only creates and opens a window.
         - Conditional checks determine which subclass should be instantiated to match the tournament type.
-        - If the tournament type is invalid, an error message is printed for debugging purposes.
+        - If the tournament type is invalid, an error is logged.
         
         **Parameters:**
         - `tournament_dict` (dict): A dictionary containing tournament details, including:
@@ -209,40 +237,24 @@ class TournamentDisplay(QWidget):
         - None. This function does not return a value but instead opens a new window displaying the tournament bracket.
         
         **Step-by-Step Explanation:**
-        1️⃣ **Step 1 - Extract Tournament Details**
-           - Retrieve the tournament's `name`, `type`, and `max_players` from the dictionary.
-           - Convert `max_players` to an integer to ensure it is in the correct format.
-        
-        2️⃣ **Step 2 - Validate Tournament Type and Create Instance**
-           - Check the tournament type and instantiate the corresponding tournament class.
+        1️⃣ **Step 1 - Build the Bracket off the GUI Thread**
+           - `load_bracket()` instantiates the class for the tournament type, on the tables the
+             cafe's table plan reserved for it, and replays recorded results, on a database thread.
         
-        3️⃣ **Step 3 - Handle Invalid Tournament Type**
-           - If the tournament type is invalid, print an error message and exit.
+        2️⃣ **Step 2 - Handle Invalid Tournament Type**
+           - If the tournament type is invalid, log an error and open nothing.
         
-        4️⃣ **Step 4 - Open the Tournament Bracket Window**
-           - Pass the newly created tournament instance to `TournamentBracketDisplay`.
-           - Open the tournament bracket window to display the bracket details.
+        3️⃣ **Step 3 - Open the Tournament Bracket Window**
+           - `open_bracket()` passes the finished tournament instance to `TournamentBracketDisplay`.
         """
         
-        # Step 1 - Extract Tournament Details
-        tournament_name = tournament_dict["name"]  # Extracts the tournament's name
-        tournament_type = tournament_dict["type"]  # Identifies the tournament format (single/double/round-robin)
-        max_players = int(tournament_dict["max_players"])  # Ensures `max_players` is stored as an integer
-
-        # Step 2 - Validate Tournament Type and Create Instance
-        if tournament_type == "single_elimination":
-            tournament_instance = SingleEliminationTournament(tournament_name, max_players)
-        elif tournament_type == "double_elimination":
-            tournament_instance = DoubleEliminationTournament(tournament_name, max_players)
-        elif tournament_type == "round_robin":
-            tournament_instance = RoundRobinTournament(tournament_name, max_players)
-        
-        # Step 3 - Handle Invalid Tournament Type
-        else:
-            print(f"❌ Error: Invalid tournament type '{tournament_type}'")  # Print error for debugging
-            return  # Exit function to avoid processing an invalid tournament
-
-        # Step 4 - Open the Tournament Bracket Window
+        # Step 1 - Build the bracket on a database thread (Step 2 is the error callback)
+        run_read(self, load_bracket, tournament_dict, on_result=self.open_bracket, on_error=lambda error: logger.error(
+            "bracket not opened tournament=%s error=%s", tournament_dict["name"], error
+        ))
+
+    def open_bracket(self, tournament_instance) -> None:
+        """ Opens the bracket window for a tournament built by `load_bracket()` (Step 3 of `view_bracket()`). """
         self.bracket_window = TournamentBracketDisplay(tournament_instance)  # Instantiate bracket display
         self.bracket_window.show()  # Open the tournament bracket window
 
@@ -268,17 +280,20 @@ class TournamentBracketDisplay(QWidget):
         """
         **Initializes the bracket display window.**
         **Parameters:**
-        - `tournament` (Tournament): An instance of the selected tournament, containing match data.
+        - `tournament` (Tournament): An instance of the selected tournament, with its rounds generated
+          and recorded results applied (see `load_bracket()`), so opening the window never queries the database.
         """
         super().__init__()
         
         # Validate Tournament Instance
         if isinstance(tournament, dict):
-            print("❌ Error: Expected a Tournament instance but received a dictionary!")
+            logger.error("expected a Tournament instance but received a dictionary")
             return  # Prevent further execution if incorrect data type is received
         
         # Configure Window
         self.tournament = tournament  # Store the tournament instance
+        self.refresh_request = 0  # Numbers refresh_bracket() calls, so an older result never overwrites a newer one
+        self.round_tables = []  # One table per round, patched in place by refresh_bracket()
         self.setWindowTitle(f"{tournament.name} - Bracket")  # Set the window title dynamically
         self.setGeometry(200, 200, 700, 500)  # Set window size
         
@@ -308,6 +323,12 @@ class TournamentBracketDisplay(QWidget):
             self.create_single_elimination_bracket(self.tournament)
         elif isinstance(self.tournament, DoubleEliminationTournament):
             self.create_double_elimination_bracket(self.tournament)
+
+        # Patch the bracket in place when results or sign-ups change on another kiosk
+        notifier = change_notifier()
+        notifier.results_changed.connect(self.refresh_bracket)
+        notifier.signups_changed.connect(self.refresh_bracket)
+        notifier.reload_required.connect(self.reload_bracket)
         
         # Add Close Button
         close_button = QPushButton("Close")  # Create a close button
@@ -328,7 +349,7 @@ class TournamentBracketDisplay(QWidget):
         - The match table must be visually formatted for clarity.
         
         **Implementation Decisions:**
-        - Calls `generate_rounds()` to ensure matchups are created before display.
+        - Displays the rounds `load_bracket()` prepared on a database thread; nothing here queries the database.
         - Uses a `QTableWidget` for structured data presentation.
         - Applies different styling to improve readability.
         
@@ -336,8 +357,8 @@ class TournamentBracketDisplay(QWidget):
         - `tournament` (RoundRobinTournament): The tournament instance containing match data.
         
         **Step-by-Step Explanation:**
-        1️⃣ **Step 1 - Generate Tournament Rounds**
-           - Calls `generate_rounds()` to create matchups.
+        1️⃣ **Step 1 - Use the Prepared Rounds**
+           - Rounds were generated and recorded winners replayed before the window opened.
         
         2️⃣ **Step 2 - Check if Rounds Exist**
            - If no rounds were generated, exit early to avoid errors.
@@ -360,19 +381,17 @@ class TournamentBracketDisplay(QWidget):
            - Ensures the UI updates correctly and adds the table to the layout.
         """
         
-        # Step 1 - Generate Tournament Rounds
-        print(f"Generating rounds for tournament: {tournament.name}, Max Players: {tournament.max_players}")  # Debugging
-        tournament.generate_rounds()  # Generate the rounds for the tournament
-        print(f"Rounds generated: {tournament.rounds}")  # Debugging output displays number of rounds
+        # Step 1 - Use the Prepared Rounds
+        logger.debug("bracket display tournament=%s max_players=%s rounds=%d", tournament.name, tournament.max_players, len(tournament.rounds))
         
         # Step 2 - Check if Rounds Exist
         if not tournament.rounds:
-            print("No rounds were generated. Ensure max_players is set correctly.")
+            logger.warning("no rounds generated tournament=%s max_players=%s", tournament.name, tournament.max_players)
             return  # Exit if no rounds were created
         
         # Step 3 - Iterate Over Each Round and Matchup
-        for round_number, matchups in enumerate(tournament.rounds, start=1):
-            print(f"Round {round_number}: {matchups}")  # Debugging output
+        for round_number, matchups in enumerate(tournament.named_rounds(), start=1):
+            logger.debug("round tournament=%s round=%d matches=%s", tournament.name, round_number, matchups)  # Formatted only at DEBUG
             
             # Step 4 - Create and Style Round Labels
             round_label = QLabel(f"🛡️ Round {round_number}")  # Create label
@@ -400,10 +419,12 @@ class TournamentBracketDisplay(QWidget):
             for row, match in enumerate(matchups):
                 table.setItem(row, 0, QTableWidgetItem(match["p1"]))  # Player 1
                 table.setItem(row, 1, QTableWidgetItem(match["p2"]))  # Player 2
-                table.setItem(row, 3, QTableWidgetItem(str(match["table"])))  # Table Number
+                table.setItem(row, 2, QTableWidgetItem(match["winner"] or ""))  # Winner (blank until recorded)
+                table.setItem(row, 3, QTableWidgetItem(str(match["table"] or "-")))  # Table Number ("-" if none is free)
             
             # Step 7 - Update and Display Table
             table.viewport().update()  # Force UI refresh (otherwise the table will not show)
+            self.round_tables.append(table)  # Keep for in-place updates
             self.layout.addWidget(table)  # Add table to layout
 
     def create_single_elimination_bracket(self, tournament):
@@ -416,7 +437,7 @@ class TournamentBracketDisplay(QWidget):
         - The match table must be visually formatted for clarity.
         
         **Implementation Decisions:**
-        - Calls `generate_rounds()` to ensure matchups are created before display.
+        - Displays the rounds `load_bracket()` prepared on a database thread; nothing here queries the database.
         - Uses a `QTableWidget` for structured data presentation.
         - Applies different styling to improve readability.
         
@@ -424,8 +445,8 @@ class TournamentBracketDisplay(QWidget):
         - `tournament` (SingleEliminationTournament): The tournament instance containing match data.
         
         **Step-by-Step Explanation:**
-        1️⃣ **Step 1 - Generate Tournament Rounds**
-           - Calls `generate_rounds()` to create matchups.
+        1️⃣ **Step 1 - Use the Prepared Rounds**
+           - Rounds were generated and recorded winners replayed before the window opened.
         
         2️⃣ **Step 2 - Check if Rounds Exist**
            - If no rounds were generated, exit early to avoid errors.
@@ -448,19 +469,17 @@ class TournamentBracketDisplay(QWidget):
            - Ensures the UI updates correctly and adds the table to the layout.
         """
         
-        # Step 1 - Generate Tournament Rounds
-        print(f"Generating rounds for tournament: {tournament.name}, Max Players: {tournament.max_players}")  # Debugging
-        tournament.generate_rounds()  # Generate the rounds for the tournament
-        print(f"Rounds generated: {tournament.rounds}")  # Debugging output displays number of rounds
+        # Step 1 - Use the Prepared Rounds
+        logger.debug("bracket display tournament=%s max_players=%s rounds=%d", tournament.name, tournament.max_players, len(tournament.rounds))
         
         # Step 2 - Check if Rounds Exist
         if not tournament.rounds:
-            print("No rounds were generated. Ensure max_players is set correctly.")
+            logger.warning("no rounds generated tournament=%s max_players=%s", tournament.name, tournament.max_players)
             return  # Exit if no rounds were created
         
         # Step 3 - Iterate Over Each Round and Matchup
-        for round_number, matchups in enumerate(tournament.rounds, start=1):
-            print(f"Round {round_number}: {matchups}")  # Debugging output
+        for round_number, matchups in enumerate(tournament.named_rounds(), start=1):
+            logger.debug("round tournament=%s round=%d matches=%s", tournament.name, round_number, matchups)  # Formatted only at DEBUG
             
             # Step 4 - Create and Style Round Labels
             round_label = QLabel(f"🛡️ Round {round_number}")  # Create label
@@ -488,10 +507,12 @@ class TournamentBracketDisplay(QWidget):
             for row, match in enumerate(matchups):
                 table.setItem(row, 0, QTableWidgetItem(match["p1"]))  # Player 1
                 table.setItem(row, 1, QTableWidgetItem(match["p2"]))  # Player 2
-                # The table number is omitted to avoid a runtime error
+                table.setItem(row, 2, QTableWidgetItem(match["winner"] or ""))  # Winner (blank until recorded)
+                table.setItem(row, 3, QTableWidgetItem(str(match["table"] or "-")))  # Table Number ("-" for byes)
             
             # Step 7 - Update and Display Table
             table.viewport().update()  # Force UI refresh (otherwise the table will not show)
+            self.round_tables.append(table)  # Keep for in-place updates
             self.layout.addWidget(table)  # Add table to layout
 
     def create_double_elimination_bracket(self, tournament):
@@ -504,7 +525,7 @@ class TournamentBracketDisplay(QWidget):
         - Players are only eliminated after two losses, making future matchups more complex.
         
         **Implementation Decisions:**
-        - Calls `generate_rounds()` to ensure matchups are created before display.
+        - Displays the rounds `load_bracket()` prepared on a database thread; nothing here queries the database.
         - Uses a `QTableWidget` for structured data presentation.
         - Applies different styling to improve readability.
         
@@ -512,8 +533,8 @@ class TournamentBracketDisplay(QWidget):
         - `tournament` (DoubleEliminationTournament): The tournament instance containing match data.
         
         **Step-by-Step Explanation:**
-        1️⃣ **Step 1 - Generate Tournament Rounds**
-           - Calls `generate_rounds()` to create matchups.
+        1️⃣ **Step 1 - Use the Prepared Rounds**
+           - Rounds were generated and recorded winners replayed before the window opened.
         
         2️⃣ **Step 2 - Check if Rounds Exist**
            - If no rounds were generated, exit early to avoid errors.
@@ -536,19 +557,17 @@ class TournamentBracketDisplay(QWidget):
            - Ensures the UI updates correctly and adds the table to the layout.
         """
         
-        # Step 1 - Generate Tournament Rounds
-        print(f"Generating rounds for tournament: {tournament.name}, Max Players: {tournament.max_players}")  # Debugging
-        tournament.generate_rounds()  # Generate the rounds for the tournament
-        print(f"Rounds generated: {tournament.rounds}")  # Debugging output displays number of rounds
+        # Step 1 - Use the Prepared Rounds
+        logger.debug("bracket display tournament=%s max_players=%s rounds=%d", tournament.name, tournament.max_players, len(tournament.rounds))
         
         # Step 2 - Check if Rounds Exist
         if not tournament.rounds:
-            print("❌ No rounds were generated. Ensure max_players is set correctly.")
+            logger.warning("no rounds generated tournament=%s max_players=%s", tournament.name, tournament.max_players)
             return  # Exit if no rounds were created
         
         # Step 3 - Iterate Over Each Round and Matchup
-        for round_number, matchups in enumerate(tournament.rounds, start=1):
-            print(f"Round {round_number}: {matchups}")  # Debugging output
+        for round_number, matchups in enumerate(tournament.named_rounds(), start=1):
+            logger.debug("round tournament=%s round=%d matches=%s", tournament.name, round_number, matchups)  # Formatted only at DEBUG
             
             # Step 4 - Create and Style Round Labels
             round_label = QLabel(f"🛡️ Round {round_number}")  # Create label
@@ -575,19 +594,65 @@ class TournamentBracketDisplay(QWidget):
                 if isinstance(match, dict):  # Ensure the match is in dictionary format
                     player1 = str(match.get("p1", "TBD"))  # Get player 1's name or TBD if unknown
                     player2 = str(match.get("p2", "TBD"))  # Get player 2's name or TBD if unknown
-                    winner = str(match.get("winner", "TBD"))  # Get the winner or TBD if undecided
+                    winner = str(match.get("winner") or "")  # Get the winner, blank if undecided
                     
                     table.setItem(row, 0, QTableWidgetItem(player1))  # Set Player 1
                     table.setItem(row, 1, QTableWidgetItem(player2))  # Set Player 2
                     table.setItem(row, 2, QTableWidgetItem(winner))  # Set Winner
                 else:
-                    print(f"❌ Unexpected match format: {match}")  # Debugging
+                    logger.warning("unexpected match format match=%r", match)
             
             # Step 7 - Update and Display Table
             table.viewport().update()  # Force UI refresh (otherwise the table will not show)
+            self.round_tables.append(table)  # Keep for in-place updates
             self.layout.addWidget(table)  # Add table to layout
 
 
+    def refresh_bracket(self, event_names: list) -> None:
+        """
+        **Updates only the bracket cells that changed, when this tournament is among `event_names`.**
+
+        **Why This Function Exists:**
+        - Results recorded or sign-ups changed on another kiosk used to require closing and reopening the window.
+
+        **Implementation Decisions:**
+        - The bracket is rebuilt (sign-ups plus recorded winners) on a database thread, reusing the
+          tables already on screen, then compared match by match (by player id) with what is
+          displayed; only differing player and winner cells are replaced.
+        - Only the newest rebuild is shown: one that finishes after a later one started is dropped.
+        """
+        if self.tournament.name not in event_names:
+            return  # Change belongs to another event
+
+        self.refresh_request += 1
+        request = self.refresh_request
+        tournament_class, name, max_players, db_path, tables = (
+            type(self.tournament), self.tournament.name, self.tournament.max_players, self.tournament.db_path, self.tournament.tables
+        )  # Read on the GUI thread; the rebuild below runs on a database thread
+
+        def rebuild():
+            fresh = tournament_class(name, max_players, db_path, tables=tables)  # Same tables: no new table plan
+            MatchResults(db_path).apply(fresh)
+            return fresh
+
+        run_read(self, rebuild, on_result=lambda fresh: self.show_refreshed_bracket(request, fresh))
+
+    def show_refreshed_bracket(self, request: int, fresh) -> None:
+        """ Replaces the cells that differ between the displayed bracket and `fresh`, built by `refresh_bracket()`. """
+        if request != self.refresh_request:
+            return  # A newer rebuild is on its way
+        for table, old_round, new_round, named_round in zip(self.round_tables, self.tournament.rounds, fresh.rounds, fresh.named_rounds()):
+            for row, (old_match, new_match, named_match) in enumerate(zip(old_round, new_round, named_round)):
+                for column, key in enumerate(("p1", "p2", "winner")):  # Same column order in every bracket type
+                    if old_match.get(key) != new_match.get(key):
+                        table.setItem(row, column, QTableWidgetItem(str(named_match.get(key) or "")))
+        self.tournament = fresh
+
+    def reload_bracket(self) -> None:
+        """ Re-checks every cell after the change notifier lost track of individual changes. """
+        self.refresh_bracket([self.tournament.name])
+
+
 # Saved code for winner button to be added into each bracket table
 # Would be added at the end of step 6 as part of populating the table
 """
@@ -609,4 +674,4 @@ p2_button.toggled.connect(lambda checked, r=round_number, m=match, p=match["p2"]
 # Add to the table
 table.setCellWidget(row, 2, p1_button)
 table.setCellWidget(row, 3, p2_button)
-"""
\ No newline at end of file
+"""